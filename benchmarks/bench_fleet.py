@@ -0,0 +1,67 @@
+"""Scaling benchmark for EvonicFleet against simulated fires.
+
+Starts N fire simulators and snapshots all of them with ``EvonicFleet``,
+once cold (config, device and effects) and once warm (live state only),
+reporting wall time, throughput and per-fire latency for each fleet size.
+
+    python benchmarks/bench_fleet.py --sizes 1 10 100 500 --latency 0.05
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+# Appended, so the integration's calendar.py does not shadow the standard library module
+sys.path.append(str(ROOT / "custom_components" / "evonic"))
+
+from pyevonic.fleet import EvonicFleet  # noqa: E402
+
+from simulator import FireSimulator  # noqa: E402
+
+
+async def run(size: int, latency: float, jitter: float, concurrency: int) -> list[str]:
+    fires = [FireSimulator(latency=latency, jitter=jitter) for _ in range(size)]
+    await asyncio.gather(*(fire.start() for fire in fires))
+    rows = []
+    try:
+        async with EvonicFleet(
+            [fire.address for fire in fires], max_concurrency=concurrency
+        ) as fleet:
+            for phase in ("cold", "warm"):
+                start = time.perf_counter()
+                results = [result async for result in fleet.snapshots()]
+                wall = time.perf_counter() - start
+
+                elapsed = sorted(result.elapsed for result in results)
+                p95 = elapsed[min(len(elapsed) - 1, int(len(elapsed) * 0.95))]
+                failures = sum(not result.ok for result in results)
+                rows.append(
+                    f"{size:>6} {phase:<5} {wall:>8.2f} {size / wall:>9.1f} "
+                    f"{statistics.median(elapsed) * 1000:>9.1f} {p95 * 1000:>9.1f} {failures:>8}"
+                )
+    finally:
+        await asyncio.gather(*(fire.stop() for fire in fires))
+    return rows
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 10, 100, 500])
+    parser.add_argument("--latency", type=float, default=0.05, help="simulated response latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.02, help="extra random latency in seconds")
+    parser.add_argument("--concurrency", type=int, default=50, help="EvonicFleet max_concurrency")
+    args = parser.parse_args()
+
+    print(f"{'fires':>6} {'phase':<5} {'wall s':>8} {'fires/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'failures':>8}")
+    for size in args.sizes:
+        for row in await run(size, args.latency, args.jitter, args.concurrency):
+            print(row)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,106 @@
+"""Parsing benchmark for the pyevonic Device model.
+
+Compares the Device model with the pre-dispatch-table models kept in
+``legacy_models.py``: wall time and peak transient bytes per
+``update_from_dict`` for the payloads a poll and a push frame deliver, and
+the bytes a parsed Device keeps alive.
+
+    python benchmarks/bench_models.py --iterations 20000
+"""
+from __future__ import annotations
+
+import argparse
+import itertools
+import sys
+import timeit
+import tracemalloc
+from collections.abc import Callable, Iterator
+from functools import partial
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+# Appended, so the integration's calendar.py does not shadow the standard library module
+sys.path.append(str(ROOT / "custom_components" / "evonic"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from pyevonic import models  # noqa: E402
+
+import legacy_models  # noqa: E402
+from simulator import DEFAULT_LIVE, DEFAULT_MODULES, DEFAULT_OPTIONS, DEFAULT_SETUP  # noqa: E402
+
+# What typically moves between two polls of an idle fire
+CHANGED_LIVE = {**DEFAULT_LIVE, "temperature": 20, "dbm": -63, "heap": 18200, "time": "12:00:30"}
+
+# Each case cycles through its payloads, so a single payload is a steady-state poll
+PAYLOADS = {
+    "poll (live)": (DEFAULT_LIVE,),
+    "poll (setup)": (DEFAULT_SETUP,),
+    "poll (changed)": (DEFAULT_LIVE, CHANGED_LIVE),
+    "push frame": ({"templevel": 21},),
+}
+
+
+def allocated(update: Callable[[], object], iterations: int) -> int:
+    """Return the peak bytes held while ``update`` runs, over ``iterations`` calls."""
+    update()
+    tracemalloc.start()
+    try:
+        peak = 0
+        for _ in range(iterations):
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            update()
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - before)
+        return peak
+    finally:
+        tracemalloc.stop()
+
+
+def _update_legacy(device, payloads: Iterator[dict]) -> None:
+    device.update_from_dict(next(payloads))
+
+
+def _update(device, payloads: Iterator[dict], changes: set[str]) -> None:
+    # Changes are collected like Evonic does, into a set that outlives the update
+    device.update_from_dict(next(payloads), changes)
+
+
+def retained(build: Callable[[], object]) -> int:
+    """Return the bytes still allocated after ``build`` while its result is alive."""
+    build()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = build()  # noqa: F841
+        return tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    initial = {**DEFAULT_MODULES, **DEFAULT_LIVE, **DEFAULT_SETUP, **DEFAULT_OPTIONS}
+
+    print(f"{'case':<16} {'model':<8} {'us/update':>10} {'bytes/update':>13}")
+    for name, payloads in PAYLOADS.items():
+        for label, module in (("legacy", legacy_models), ("current", models)):
+            device = module.Device(initial)
+            if module is legacy_models:
+                update = partial(_update_legacy, device, itertools.cycle(payloads))
+            else:
+                update = partial(_update, device, itertools.cycle(payloads), set())
+            seconds = min(timeit.repeat(update, number=args.iterations, repeat=5)) / args.iterations
+            memory = allocated(update, 100)
+            print(f"{name:<16} {label:<8} {seconds * 1e6:>10.2f} {memory:>13}")
+
+    print()
+    print(f"{'model':<8} {'bytes/Device':>13}")
+    for label, module in (("legacy", legacy_models), ("current", models)):
+        print(f"{label:<8} {retained(lambda: module.Device(initial)):>13}")  # noqa: B023
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""Latency benchmark for the Evonic client against the fire simulator.
+
+Measures wall time, device requests and bytes on the wire for
+``Evonic.get_config``, ``Evonic.get_device``, the first poll of a new client
+with and without ``defer_config`` and a full
+``EvonicCoordinator._async_update_data`` cycle.
+
+    python benchmarks/bench_poll.py --latency 0.05 --iterations 50
+
+The coordinator case needs Home Assistant installed and is skipped otherwise.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import SimpleNamespace
+
+ROOT = Path(__file__).resolve().parent.parent
+# Appended, so the integration's calendar.py does not shadow the standard library module
+sys.path.append(str(ROOT / "custom_components" / "evonic"))
+sys.path.insert(0, str(ROOT))
+
+from pyevonic import Evonic  # noqa: E402
+
+from simulator import FireSimulator  # noqa: E402
+
+
+@dataclass
+class Result:
+    """Samples collected for one benchmark case."""
+
+    name: str
+    times: list[float] = field(default_factory=list)
+    requests: list[int] = field(default_factory=list)
+    bytes: list[int] = field(default_factory=list)
+
+    def row(self) -> str:
+        times = sorted(self.times)
+        p95 = times[min(len(times) - 1, int(len(times) * 0.95))]
+        return (
+            f"{self.name:<24} {len(times):>5} "
+            f"{statistics.mean(times) * 1000:>9.1f} {times[0] * 1000:>9.1f} {p95 * 1000:>9.1f} "
+            f"{statistics.mean(self.requests):>9.2f} {statistics.mean(self.bytes):>10.0f}"
+        )
+
+
+async def measure(
+    fire: FireSimulator, name: str, iterations: int, operation: Callable[[], Awaitable]
+) -> Result:
+    """Run ``operation`` repeatedly, sampling wall time and simulator traffic."""
+    result = Result(name)
+    for _ in range(iterations):
+        fire.reset_stats()
+        start = time.perf_counter()
+        await operation()
+        result.times.append(time.perf_counter() - start)
+        result.requests.append(fire.stats.requests + fire.stats.ws_messages)
+        result.bytes.append(fire.stats.bytes_in + fire.stats.bytes_out)
+    return result
+
+
+async def bench_get_config(fire: FireSimulator, iterations: int) -> Result:
+    async def operation():
+        async with Evonic(fire.address) as evonic:
+            await evonic.get_config()
+
+    return await measure(fire, "Evonic.get_config", iterations, operation)
+
+
+async def bench_get_device(fire: FireSimulator, iterations: int) -> Result:
+    # Back-to-back polls would otherwise reuse the first one's result
+    async with Evonic(fire.address, device_max_age=0) as evonic:
+        await evonic.get_device()
+        return await measure(fire, "Evonic.get_device", iterations, evonic.get_device)
+
+
+async def bench_first_poll(fire: FireSimulator, iterations: int, defer_config: bool) -> Result:
+    name = "First poll, deferred" if defer_config else "First poll"
+    result = Result(name)
+    for _ in range(iterations):
+        fire.reset_stats()
+        async with Evonic(fire.address, defer_config=defer_config) as evonic:
+            start = time.perf_counter()
+            await evonic.get_device()
+            result.times.append(time.perf_counter() - start)
+            result.requests.append(fire.stats.requests + fire.stats.ws_messages)
+            result.bytes.append(fire.stats.bytes_in + fire.stats.bytes_out)
+            # Not timed, but kept out of the next iteration's traffic
+            await evonic.wait_for_config()
+    return result
+
+
+async def bench_coordinator(fire: FireSimulator, iterations: int) -> Result | None:
+    try:
+        from homeassistant.const import CONF_HOST
+        from homeassistant.core import HomeAssistant
+    except ImportError:
+        print("Home Assistant is not installed, skipping coordinator benchmark")
+        return None
+
+    from custom_components.evonic.coordinator import EvonicCoordinator
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        # The coordinator only reads the host from its entry.
+        entry = SimpleNamespace(entry_id="simulator", data={CONF_HOST: fire.address}, options={})
+        coordinator = EvonicCoordinator(hass, entry=entry)
+        coordinator.evonic.device_max_age = 0
+        await coordinator._async_update_data()
+        result = await measure(
+            fire, "Coordinator update", iterations, coordinator._async_update_data
+        )
+        await hass.async_stop(force=True)
+    return result
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.02, help="injected seconds per request")
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--drop-rate", type=float, default=0.0)
+    parser.add_argument("--keep-alive", action="store_true")
+    args = parser.parse_args()
+
+    async with FireSimulator(
+        latency=args.latency,
+        jitter=args.jitter,
+        drop_rate=args.drop_rate,
+        keep_alive=args.keep_alive,
+    ) as fire:
+        results = [
+            await bench_get_config(fire, args.iterations),
+            await bench_get_device(fire, args.iterations),
+            await bench_first_poll(fire, args.iterations, defer_config=False),
+            await bench_first_poll(fire, args.iterations, defer_config=True),
+            await bench_coordinator(fire, args.iterations),
+        ]
+
+    print(f"{'case':<24} {'runs':>5} {'mean ms':>9} {'min ms':>9} {'p95 ms':>9} {'requests':>9} {'bytes':>10}")
+    for result in results:
+        if result is not None:
+            print(result.row())
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
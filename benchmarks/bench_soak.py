@@ -0,0 +1,107 @@
+"""Soak test of the Evonic client against the fire simulator.
+
+Polls one simulated fire many times over a keep-alive connection, sending
+a command now and then, and samples traced memory, the connections the
+client's pool holds and the connections the fire is serving. Every
+response is released before ``http_request`` returns, so all three should
+stay flat once the first polls have filled the caches.
+
+    python benchmarks/bench_soak.py --polls 10000
+
+Exits with status 1 when memory grows past ``--max-growth`` after warm-up,
+or when a connection is left checked out of the pool.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+
+import aiohttp
+
+ROOT = Path(__file__).resolve().parent.parent
+# Appended, so the integration's calendar.py does not shadow the standard library module
+sys.path.append(str(ROOT / "custom_components" / "evonic"))
+sys.path.insert(0, str(ROOT))
+
+from pyevonic import Evonic  # noqa: E402
+
+from simulator import FireSimulator  # noqa: E402
+
+
+@dataclass
+class Sample:
+    """State of the client and the fire after a number of polls."""
+
+    polls: int
+    memory: int
+    acquired: int
+    idle: int
+    served: int
+
+    def row(self) -> str:
+        return f"{self.polls:>7} {self.memory / 1024:>11.1f} {self.acquired:>9} {self.idle:>6} {self.served:>7}"
+
+
+def pool_state(session: aiohttp.ClientSession) -> tuple[int, int]:
+    """Return the connections checked out of the session's pool, and those idle in it."""
+    # aiohttp has no public pool statistics, these are the connector's own books
+    connector = session.connector
+    idle = sum(len(conns) for conns in connector._conns.values())
+    return len(connector._acquired), idle
+
+
+async def soak(fire: FireSimulator, polls: int, every: int, command_every: int) -> list[Sample]:
+    samples = []
+    async with aiohttp.ClientSession() as session:
+        async with Evonic(fire.address, session=session, device_max_age=0) as evonic:
+            await evonic.get_config()
+            tracemalloc.start()
+            for poll in range(1, polls + 1):
+                await evonic.get_device()
+                if command_every and poll % command_every == 0:
+                    await evonic.power("toggle")
+                if poll % every == 0:
+                    acquired, idle = pool_state(session)
+                    samples.append(
+                        Sample(poll, tracemalloc.get_traced_memory()[0], acquired, idle, fire.open_connections)
+                    )
+            tracemalloc.stop()
+    return samples
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--polls", type=int, default=10_000)
+    parser.add_argument("--sample-every", type=int, default=1_000)
+    parser.add_argument("--command-every", type=int, default=50, help="polls between power toggles, 0 for none")
+    parser.add_argument("--latency", type=float, default=0.0, help="injected seconds per request")
+    parser.add_argument("--max-growth", type=int, default=64 * 1024, help="bytes allowed after the first sample")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    async with FireSimulator(latency=args.latency, keep_alive=True) as fire:
+        samples = await soak(fire, args.polls, args.sample_every, args.command_every)
+        requests = fire.stats.requests
+        connections = fire.stats.connections
+    elapsed = time.perf_counter() - start
+
+    print(f"{'polls':>7} {'traced KiB':>11} {'acquired':>9} {'idle':>6} {'served':>7}")
+    for sample in samples:
+        print(sample.row())
+
+    growth = samples[-1].memory - samples[0].memory
+    leaked = max(sample.acquired for sample in samples)
+    print(
+        f"\n{args.polls} polls, {requests} requests over {connections} connections in {elapsed:.1f}s, "
+        f"memory {growth / 1024:+.1f} KiB after warm-up, {leaked} connections left checked out"
+    )
+    return 0 if growth <= args.max_growth and not leaked else 1
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
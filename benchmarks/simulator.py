@@ -0,0 +1,543 @@
+"""Pure asyncio stand-in for an Evonic Fire.
+
+Serves the local HTTP endpoints and the ``arduino`` WebSocket described in
+docs/endpoints.md so the client can be exercised without a fireplace on the
+bench. Latency, dropped connections and the ESP8266's one-client-at-a-time
+behaviour can be injected through constructor knobs.
+
+Usage:
+    async with FireSimulator(latency=0.05) as fire:
+        evonic = Evonic(fire.address)
+        await evonic.get_device()
+        print(fire.stats)
+"""
+from __future__ import annotations
+
+import asyncio
+import base64
+import copy
+import hashlib
+import json
+import random
+import struct
+from collections import Counter
+from dataclasses import dataclass, field
+from urllib.parse import parse_qs, unquote, urlparse
+
+WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+DEFAULT_MODULES = {
+    "SSDP": "EvonicSim",
+    "configs": "hal1500",
+    "product": "Evonic Halo 1500",
+    "buildData": "2024-02-26generic.bin",
+    "mail": "owner@example.com",
+    "lang": "en",
+    "logo": 0,
+    "module": ["light_box", "temperature", "rgb0", "rgb1", "timers", "cost", "ntp"],
+}
+
+DEFAULT_LIVE = {
+    "Fire": 0,
+    "Heater": 0,
+    "effect": "Eos",
+    "templevel": 21,
+    "temperature": 19,
+    "pinout3": 0,
+    "brightnessRGB0": 255,
+    "brightnessRGB1": 200,
+    "speedRGB0": 120,
+    "speedRGB1": 80,
+    "powerLed": 28,
+    "powerHeater": 1513,
+    "dbm": -61,
+    "heap": 18432,
+    "vcc": 3.3,
+    "time": "12:00:00",
+}
+
+DEFAULT_SETUP = {
+    "effect": "Eos",
+    "ssid": "HomeNetwork",
+    "ssidPass": "secret",
+    "ssidAP": "Evonic-AP",
+    "ssidApPass": "secret",
+    "timeZone": 0,
+    "checkboxIP": 0,
+    "ip": "192.168.1.50",
+    "getway": "192.168.1.1",
+    "subnet": "255.255.255.0",
+    "dns": "192.168.1.1",
+    "autopower": 0,
+    "rcp": 1,
+    "shop": 0,
+    "setIndex": "index.htm",
+    "fahrenheit": 0,
+    "cost": 0.28,
+}
+
+DEFAULT_OPTIONS = {
+    "mac": "AA:BB:CC:DD:EE:FF",
+    "ip": "192.168.1.50",
+    "token": "token",
+    "server": "evoflame.co.uk",
+    "flashChip": "4M",
+}
+
+DEFAULT_ADMIN = {
+    "AT+RFID": "ÿþ",
+    "rfc": "EVO-0001",
+    "logo": 0,
+}
+
+DEFAULT_EFFECT_LIST = {"effect": ["Christmas", "Rainbow"]}
+
+DEFAULT_TIMERS = {
+    "timer": [
+        {"id": 4521, "day": "0111110", "time1": "07:30:00", "com1": "voice Fire_ON", "run1": 0, "active": 1},
+        {"id": 4521, "day": "0111110", "time1": "22:00:00", "com1": "voice Fire_OFF", "run1": 0, "active": 1},
+    ]
+}
+
+BUILT_IN_EFFECTS = (
+    "Eos", "Ignite", "Vero", "Breathe", "Spectrum", "Embers", "Odyssey",
+    "Aurora", "Red", "Orange", "Green", "Blue", "Violet", "White",
+)
+
+VOICE_STATE = {
+    "Fire_ON": {"Fire": 1},
+    "Fire_OFF": {"Fire": 0, "Heater": 0},
+    "Heater_ON": {"Fire": 1, "Heater": 1},
+    "Heater_OFF": {"Heater": 0},
+    "Fire_Heater_ON": {"Fire": 1, "Heater": 1},
+}
+
+VOICE_TOGGLES = {
+    "Fire_ON/OFF": "Fire",
+    "Fire_NOT": "Fire",
+    "Heater_NOT": "Heater",
+    "Heater_ON_/_OFF": "Heater",
+    "Featurelight_NOT": "pinout3",
+    "Light_box": "pinout3",
+}
+
+
+@dataclass
+class SimulatorStats:
+    """Traffic counters collected by the simulator."""
+
+    connections: int = 0
+    requests: int = 0
+    ws_messages: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    dropped: int = 0
+    rejected: int = 0
+    max_concurrent: int = 0
+    paths: Counter = field(default_factory=Counter)
+
+
+class FireSimulator:
+    """A simulated Evonic Fire listening on localhost.
+
+    Args:
+        host: Interface to bind.
+        http_port: HTTP port, 0 picks a free port.
+        ws_port: WebSocket port, 0 picks a free port. Real fires use 81.
+        latency: Seconds to wait before answering each request.
+        jitter: Maximum extra random delay added to ``latency``.
+        drop_rate: Probability (0-1) of closing a connection without answering.
+        max_connections: HTTP clients served at once, the ESP8266 handles one.
+        max_ws_clients: WebSocket clients accepted at once.
+        reject_overflow: Reset connections over the limit instead of queueing them.
+        keep_alive: Honour HTTP keep-alive instead of closing after each response.
+        effects_endpoint: Serve /effect.json, older firmwares answer 404.
+    """
+
+    def __init__(
+        self,
+        *,
+        host: str = "127.0.0.1",
+        http_port: int = 0,
+        ws_port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        drop_rate: float = 0.0,
+        max_connections: int = 1,
+        max_ws_clients: int = 5,
+        reject_overflow: bool = False,
+        keep_alive: bool = False,
+        effects_endpoint: bool = True,
+    ) -> None:
+        self.host = host
+        self.http_port = http_port
+        self.ws_port = ws_port
+        self.latency = latency
+        self.jitter = jitter
+        self.drop_rate = drop_rate
+        self.max_connections = max_connections
+        self.max_ws_clients = max_ws_clients
+        self.reject_overflow = reject_overflow
+        self.keep_alive = keep_alive
+        self.effects_endpoint = effects_endpoint
+
+        self.modules = copy.deepcopy(DEFAULT_MODULES)
+        self.live = copy.deepcopy(DEFAULT_LIVE)
+        self.setup = copy.deepcopy(DEFAULT_SETUP)
+        self.options = copy.deepcopy(DEFAULT_OPTIONS)
+        self.admin = copy.deepcopy(DEFAULT_ADMIN)
+        self.effect_list = copy.deepcopy(DEFAULT_EFFECT_LIST)
+        self.timers = copy.deepcopy(DEFAULT_TIMERS)
+        self.timer_reloads = 0
+        self.stats = SimulatorStats()
+
+        self._http_slots: asyncio.Semaphore | None = None
+        self._ws_slots: asyncio.Semaphore | None = None
+        self._active = 0
+        self._servers: list[asyncio.AbstractServer] = []
+        self._ws_clients: set[asyncio.StreamWriter] = set()
+
+    @property
+    def address(self) -> str:
+        """Host string to hand to ``Evonic``."""
+        return f"{self.host}:{self.http_port}"
+
+    async def start(self) -> None:
+        """Start the HTTP and WebSocket listeners."""
+        self._http_slots = asyncio.Semaphore(self.max_connections)
+        self._ws_slots = asyncio.Semaphore(self.max_ws_clients)
+        http = await asyncio.start_server(self._handle_http, self.host, self.http_port)
+        ws = await asyncio.start_server(self._handle_ws, self.host, self.ws_port)
+        self.http_port = http.sockets[0].getsockname()[1]
+        self.ws_port = ws.sockets[0].getsockname()[1]
+        self._servers = [http, ws]
+
+    async def stop(self) -> None:
+        """Stop listening and disconnect WebSocket clients."""
+        for writer in list(self._ws_clients):
+            writer.close()
+        for server in self._servers:
+            server.close()
+            await server.wait_closed()
+        self._servers = []
+
+    @property
+    def open_connections(self) -> int:
+        """HTTP and WebSocket connections being served right now."""
+        return self._active
+
+    def reset_stats(self) -> None:
+        """Zero the traffic counters."""
+        self.stats = SimulatorStats()
+
+    async def __aenter__(self) -> FireSimulator:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *_exc_info) -> None:
+        await self.stop()
+
+    # State
+
+    def apply_voice(self, command: str) -> dict:
+        """Apply a voice command and return the changed live fields."""
+        if command in VOICE_STATE:
+            changes = dict(VOICE_STATE[command])
+        elif command in VOICE_TOGGLES:
+            key = VOICE_TOGGLES[command]
+            changes = {key: 0 if self.live.get(key) else 1}
+        elif command in self.effects():
+            changes = {"effect": command}
+        else:
+            return {}
+
+        self.live.update(changes)
+        if "effect" in changes:
+            self.setup["effect"] = changes["effect"]
+        return changes
+
+    def apply_cmd(self, command: str) -> dict:
+        """Apply a cmd command and return the changed fields."""
+        parts = command.split()
+        if not parts:
+            return {}
+        if parts[0] == "templevel" and len(parts) > 1:
+            changes = {"templevel": int(parts[1])}
+        elif parts[0] == "get" and len(parts) > 1:
+            return self._get(parts[1])
+        else:
+            return {}
+
+        self.live.update(changes)
+        return changes
+
+    def effects(self) -> list[str]:
+        """Effects this fire will accept by name."""
+        return [*BUILT_IN_EFFECTS, *self.effect_list["effect"]]
+
+    def _get(self, name: str) -> dict:
+        if name == "modules":
+            return dict(self.modules)
+        if name == "config.live":
+            return dict(self.live)
+        if name == "config.setup":
+            return dict(self.setup)
+        if name == "effectList":
+            return {"effectList": self.effect_list["effect"]}
+        return {}
+
+    def _route(self, method: str, target: str, headers: dict, payload: bytes) -> tuple[int, bytes, str]:
+        parsed = urlparse(target)
+        path = parsed.path
+        query = parse_qs(parsed.query)
+        self.stats.paths[path] += 1
+
+        if path == "/modules.json":
+            return 200, json.dumps(self.modules).encode(), "application/json"
+        if path == "/config.live.json":
+            return 200, json.dumps(self.live).encode(), "application/json"
+        if path == "/config.setup.json":
+            return 200, json.dumps(self.setup).encode(), "application/json"
+        if path == "/config.options.json":
+            return 200, json.dumps(self.options).encode(), "application/json"
+        if path == "/config.admin.json":
+            return 200, json.dumps(self.admin, ensure_ascii=False).encode("latin-1"), "application/json"
+        if path == "/effect.json" and self.effects_endpoint:
+            return 200, json.dumps(self.effect_list).encode(), "application/json"
+        if path == "/timer.save.json":
+            return 200, json.dumps(self.timers).encode(), "application/json"
+        if path == "/edit" and method == "POST":
+            name, content = _read_upload(headers, payload)
+            if name == "/timer.save.json":
+                self.timers = json.loads(content)
+            return 200, b"", "text/plain"
+        if path == "/settimer":
+            self.timer_reloads += 1
+            return 200, b"OK", "text/plain"
+        if path in ("/voice", "/cmd") and "command" in query:
+            command = unquote(query["command"][0])
+            changes = self.apply_voice(command) if path == "/voice" else self.apply_cmd(command)
+            if changes:
+                self._broadcast(changes)
+            return 200, b"OK", "text/plain"
+
+        return 404, b"Not found", "text/plain"
+
+    # Connection handling
+
+    async def _acquire(self, slots: asyncio.Semaphore, writer: asyncio.StreamWriter) -> bool:
+        self.stats.connections += 1
+        if self.reject_overflow and slots.locked():
+            self.stats.rejected += 1
+            writer.transport.abort()
+            return False
+
+        await slots.acquire()
+        self._active += 1
+        self.stats.max_concurrent = max(self.stats.max_concurrent, self._active)
+        return True
+
+    def _release(self, slots: asyncio.Semaphore) -> None:
+        self._active -= 1
+        slots.release()
+
+    async def _delay(self) -> None:
+        delay = self.latency + random.uniform(0, self.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+
+    def _drop(self, writer: asyncio.StreamWriter) -> bool:
+        if self.drop_rate and random.random() < self.drop_rate:
+            self.stats.dropped += 1
+            writer.transport.abort()
+            return True
+        return False
+
+    async def _handle_http(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        if not await self._acquire(self._http_slots, writer):
+            return
+        try:
+            while True:
+                request = await _read_request(reader)
+                if request is None:
+                    break
+                method, target, headers, size, payload = request
+                self.stats.requests += 1
+                self.stats.bytes_in += size
+
+                await self._delay()
+                if self._drop(writer):
+                    return
+
+                status, body, content_type = self._route(method, target, headers, payload)
+                keep_alive = self.keep_alive and headers.get("connection", "").lower() != "close"
+                head = (
+                    f"HTTP/1.1 {status} {'OK' if status == 200 else 'Not Found'}\r\n"
+                    f"Content-Type: {content_type}\r\n"
+                    f"Content-Length: {len(body)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+                ).encode()
+                writer.write(head + body)
+                self.stats.bytes_out += len(head) + len(body)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except asyncio.CancelledError:
+            # An idle keep-alive connection when the simulator stops, asyncio logs it if re-raised
+            pass
+        finally:
+            self._release(self._http_slots)
+            writer.close()
+
+    async def _handle_ws(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        if not await self._acquire(self._ws_slots, writer):
+            return
+        try:
+            request = await _read_request(reader)
+            if request is None:
+                return
+            _method, _target, headers, size, _payload = request
+            self.stats.bytes_in += size
+            await self._delay()
+            if self._drop(writer):
+                return
+
+            accept = base64.b64encode(
+                hashlib.sha1((headers["sec-websocket-key"] + WS_GUID).encode()).digest()
+            ).decode()
+            head = (
+                "HTTP/1.1 101 Switching Protocols\r\n"
+                "Upgrade: websocket\r\n"
+                "Connection: Upgrade\r\n"
+                f"Sec-WebSocket-Accept: {accept}\r\n"
+            )
+            if "arduino" in headers.get("sec-websocket-protocol", ""):
+                head += "Sec-WebSocket-Protocol: arduino\r\n"
+            writer.write((head + "\r\n").encode())
+            await writer.drain()
+            self._ws_clients.add(writer)
+
+            while True:
+                opcode, payload = await _read_frame(reader)
+                self.stats.bytes_in += len(payload)
+                if opcode == 0x8:
+                    self._send_frame(writer, 0x8, payload[:2])
+                    break
+                if opcode == 0x9:
+                    self._send_frame(writer, 0xA, payload)
+                    continue
+                if opcode != 0x1:
+                    continue
+
+                self.stats.ws_messages += 1
+                await self._delay()
+                reply = self._handle_ws_message(payload.decode())
+                if reply:
+                    self._send_frame(writer, 0x1, json.dumps(reply).encode())
+        except (ConnectionError, asyncio.IncompleteReadError, KeyError):
+            pass
+        finally:
+            self._ws_clients.discard(writer)
+            self._release(self._ws_slots)
+            writer.close()
+
+    def _handle_ws_message(self, text: str) -> dict:
+        try:
+            message = json.loads(text)
+        except ValueError:
+            return {}
+
+        changes: dict = {}
+        if "voice" in message:
+            changes = self.apply_voice(message["voice"])
+        elif "effect" in message:
+            changes = self.apply_voice(message["effect"])
+        elif "cmd" in message:
+            command = message["cmd"]
+            if command.startswith("get "):
+                return self.apply_cmd(command)
+            changes = self.apply_cmd(command)
+
+        if changes:
+            self._broadcast(changes)
+        return {}
+
+    def _broadcast(self, changes: dict) -> None:
+        payload = json.dumps(changes).encode()
+        for writer in list(self._ws_clients):
+            self._send_frame(writer, 0x1, payload)
+
+    def push(self, **changes) -> None:
+        """Change live state as if from the remote and push it to WebSocket clients."""
+        self.live.update(changes)
+        self._broadcast(changes)
+
+    def _send_frame(self, writer: asyncio.StreamWriter, opcode: int, payload: bytes) -> None:
+        if writer.is_closing():
+            return
+        length = len(payload)
+        if length < 126:
+            head = struct.pack("!BB", 0x80 | opcode, length)
+        elif length < 65536:
+            head = struct.pack("!BBH", 0x80 | opcode, 126, length)
+        else:
+            head = struct.pack("!BBQ", 0x80 | opcode, 127, length)
+        writer.write(head + payload)
+        self.stats.bytes_out += len(head) + length
+
+
+async def _read_request(reader: asyncio.StreamReader) -> tuple[str, str, dict, int, bytes] | None:
+    """Read one HTTP request, returning method, target, headers, size on the wire and body."""
+    try:
+        raw = await reader.readuntil(b"\r\n\r\n")
+    except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+        return None
+
+    lines = raw.decode("latin-1").split("\r\n")
+    method, target, _version = lines[0].split(" ", 2)
+    headers = {}
+    for line in lines[1:]:
+        if ":" in line:
+            name, value = line.split(":", 1)
+            headers[name.strip().lower()] = value.strip()
+
+    size = len(raw)
+    length = int(headers.get("content-length", 0))
+    body = b""
+    if length:
+        body = await reader.readexactly(length)
+        size += length
+    return method, target, headers, size, body
+
+
+def _read_upload(headers: dict, body: bytes) -> tuple[str | None, bytes]:
+    """Return the filename and content of the ``data`` field of a multipart upload to /edit."""
+    boundary = headers.get("content-type", "").partition("boundary=")[2].strip('"')
+    if not boundary:
+        return None, b""
+    for part in body.split(b"--" + boundary.encode()):
+        head, _, content = part.partition(b"\r\n\r\n")
+        if b'name="data"' in head:
+            # Like the firmware's upload handler, the filename is the path, as sent
+            filename = head.partition(b'filename="')[2].partition(b'"')[0].decode()
+            return filename, content.removesuffix(b"\r\n")
+    return None, b""
+
+
+async def _read_frame(reader: asyncio.StreamReader) -> tuple[int, bytes]:
+    """Read one client WebSocket frame and return its opcode and unmasked payload."""
+    first, second = await reader.readexactly(2)
+    opcode = first & 0x0F
+    length = second & 0x7F
+    if length == 126:
+        (length,) = struct.unpack("!H", await reader.readexactly(2))
+    elif length == 127:
+        (length,) = struct.unpack("!Q", await reader.readexactly(8))
+
+    mask = await reader.readexactly(4) if second & 0x80 else b""
+    payload = await reader.readexactly(length)
+    if mask:
+        payload = bytes(byte ^ mask[i % 4] for i, byte in enumerate(payload))
+    return opcode, payload
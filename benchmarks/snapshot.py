@@ -0,0 +1,53 @@
+"""Snapshot many Evonic Fires and print one JSON object per fire.
+
+    python benchmarks/snapshot.py 192.168.1.50 192.168.1.51
+    python benchmarks/snapshot.py --hosts-file fires.txt --concurrency 50 > fleet.ndjson
+
+Results are written as NDJSON in the order the fires answer.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+# Appended, so the integration's calendar.py does not shadow the standard library module
+sys.path.append(str(ROOT / "custom_components" / "evonic"))
+
+from pyevonic.fleet import EvonicFleet  # noqa: E402
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("hosts", nargs="*", help="fire addresses, e.g. 192.168.1.50")
+    parser.add_argument("--hosts-file", type=argparse.FileType(), help="file with one address per line")
+    parser.add_argument("--concurrency", type=int, default=20, help="fires fetched at the same time")
+    parser.add_argument("--timeout", type=float, default=8.0, help="seconds allowed for each request")
+    args = parser.parse_args(argv)
+
+    if args.hosts_file is not None:
+        args.hosts += [line.strip() for line in args.hosts_file if line.strip() and not line.startswith("#")]
+    if not args.hosts:
+        parser.error("no hosts given")
+    return args
+
+
+async def _run(args: argparse.Namespace) -> int:
+    failures = 0
+    async with EvonicFleet(args.hosts, max_concurrency=args.concurrency, request_timeout=args.timeout) as fleet:
+        async for result in fleet.snapshots():
+            failures += not result.ok
+            sys.stdout.write(json.dumps(result.as_dict(), default=list) + "\n")
+            sys.stdout.flush()
+    return 1 if failures else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    return asyncio.run(_run(_parse_args(argv)))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,12 +2,16 @@
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.const import Platform
+from homeassistant.const import CONF_HOST, Platform
 
-from .const import DOMAIN, LOGGER
+from .cache import EvonicConfigCache, async_get_config_cache
+from .const import DATA_HUB, DOMAIN, LOGGER
 from .coordinator import EvonicCoordinator
+from .pyevonic import EvonicError
+from .pyevonic.refresh import LIVE
 
 PLATFORMS = (
+    Platform.CALENDAR,
     Platform.LIGHT,
     Platform.CLIMATE,
     Platform.SENSOR,
@@ -17,10 +21,45 @@ PLATFORMS = (
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Evoflame Fire from a config entry."""
     coordinator = EvonicCoordinator(hass, entry=entry)
-    await coordinator.async_config_entry_first_refresh()
+
+    cache = await async_get_config_cache(hass)
+    # A config flow that just validated the fire hands over what it fetched
+    if (handoff := cache.take_handoff(entry.data[CONF_HOST])) is not None:
+        snapshot = None
+        device = coordinator.evonic.restore_config(handoff, fresh=True)
+    # Otherwise set up from the cached configuration and check it once entities exist
+    elif (snapshot := cache.get(entry.entry_id)) is not None:
+        coordinator.evonic.restore_config(snapshot)
+
+    if handoff is not None and LIVE in handoff["payloads"]:
+        # Polled moments ago, the next poll can wait for the regular interval
+        coordinator.async_set_updated_data(device)
+    else:
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except Exception:
+            # Give up the coordinator's place in the hub until setup is retried
+            await coordinator.async_shutdown()
+            raise
+
+    cache.save(entry.entry_id, coordinator.evonic.export_config())
+    entry.async_create_background_task(
+        hass,
+        _async_save_deferred_config(entry, coordinator, cache),
+        f"{DOMAIN} save deferred config {entry.entry_id}",
+    )
+    if snapshot is not None:
+        entry.async_create_background_task(
+            hass,
+            _async_revalidate_config(hass, entry, coordinator, cache),
+            f"{DOMAIN} revalidate config {entry.entry_id}",
+        )
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
 
+    if coordinator.push is not None:
+        coordinator.push.start()
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
@@ -28,12 +67,45 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+async def _async_save_deferred_config(
+    entry: ConfigEntry, coordinator: EvonicCoordinator, cache: EvonicConfigCache
+) -> None:
+    """Save the configuration again once what the first refresh deferred has loaded."""
+    await coordinator.evonic.wait_for_config()
+    cache.save(entry.entry_id, coordinator.evonic.export_config())
+
+
+async def _async_revalidate_config(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: EvonicCoordinator, cache: EvonicConfigCache
+) -> None:
+    """Refetch the static configuration behind a cached startup and save it again."""
+    try:
+        firmware_changed = await coordinator.evonic.revalidate_config()
+    except EvonicError as err:
+        LOGGER.debug("Could not revalidate cached configuration of %s: %s", entry.title, err)
+        return
+
+    cache.save(entry.entry_id, coordinator.evonic.export_config())
+    if firmware_changed:
+        # New firmware can add or drop features, so set the entities up again
+        hass.config_entries.async_schedule_reload(entry.entry_id)
+
+
 async def async_reload_entry(hass, entry):
     await hass.config_entries.async_reload(entry.entry_id)
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        del hass.data[DOMAIN][entry.entry_id]
+        coordinator: EvonicCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.async_shutdown()
+        if not coordinator.hub.stats.fires:
+            hass.data.pop(DATA_HUB, None)
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Drop the cached configuration of a removed fire."""
+    cache = await async_get_config_cache(hass)
+    cache.remove(entry.entry_id)
@@ -0,0 +1,89 @@
+"""Persistent cache of each fire's static configuration.
+
+Fetching the configuration of a fire takes six sequential requests, which
+stalls Home Assistant's startup when there are many fires. The snapshot from
+``Evonic.export_config`` is kept in a Store keyed by MAC address, so entities
+can be set up from it and the configuration revalidated in the background.
+A config flow that has just validated a fire hands its snapshot over in
+memory, so the entry it creates starts without fetching anything again.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import CONFIG_CACHE_SAVE_DELAY, CONFIG_HANDOFF_MAX_AGE, DATA_CONFIG_CACHE, DOMAIN, LOGGER
+
+STORAGE_KEY = f"{DOMAIN}.config_cache"
+STORAGE_VERSION = 1
+
+
+class EvonicConfigCache:
+    """Configuration snapshots of every fire, stored under their MAC address."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._data: dict[str, Any] = {"devices": {}, "entries": {}}
+        self._loaded = False
+        self._lock = asyncio.Lock()
+        # Snapshots handed over by config flows, keyed by host and never written to disk
+        self._handoffs: dict[str, tuple[float, dict[str, Any]]] = {}
+
+    async def async_load(self) -> None:
+        """Load the snapshots from disk, once, however many entries ask at the same time."""
+        async with self._lock:
+            if self._loaded:
+                return
+            if (data := await self._store.async_load()) is not None:
+                self._data = data
+            self._loaded = True
+
+    def get(self, entry_id: str) -> dict[str, Any] | None:
+        """Return the snapshot of the fire behind a config entry, if one was saved."""
+        mac = self._data["entries"].get(entry_id)
+        return self._data["devices"].get(mac) if mac is not None else None
+
+    def save(self, entry_id: str, snapshot: dict[str, Any] | None) -> None:
+        """Store a fire's snapshot, written to disk shortly after along with any others."""
+        if snapshot is None or not snapshot.get("mac"):
+            return
+
+        mac = snapshot["mac"]
+        self._data["entries"][entry_id] = mac
+        self._data["devices"][mac] = snapshot
+        self._store.async_delay_save(lambda: self._data, CONFIG_CACHE_SAVE_DELAY)
+
+    def hand_off(self, host: str, snapshot: dict[str, Any] | None) -> None:
+        """Keep the snapshot a config flow validated ``host`` with, for the entry it creates."""
+        if snapshot is not None:
+            self._handoffs[host] = (time.monotonic(), snapshot)
+
+    def take_handoff(self, host: str) -> dict[str, Any] | None:
+        """Return the snapshot handed over for ``host``, if it is recent enough to set up from."""
+        handoff = self._handoffs.pop(host, None)
+        if handoff is None or time.monotonic() - handoff[0] > CONFIG_HANDOFF_MAX_AGE.total_seconds():
+            return None
+        return handoff[1]
+
+    def remove(self, entry_id: str) -> None:
+        """Forget the snapshot of a removed config entry."""
+        mac = self._data["entries"].pop(entry_id, None)
+        if mac is None:
+            return
+        if mac not in self._data["entries"].values():
+            self._data["devices"].pop(mac, None)
+        LOGGER.debug("Removed cached configuration of %s", mac)
+        self._store.async_delay_save(lambda: self._data, CONFIG_CACHE_SAVE_DELAY)
+
+
+async def async_get_config_cache(hass: HomeAssistant) -> EvonicConfigCache:
+    """Return the config cache shared by every Evonic config entry, loading it on first use."""
+    cache = hass.data.get(DATA_CONFIG_CACHE)
+    if cache is None:
+        cache = hass.data[DATA_CONFIG_CACHE] = EvonicConfigCache(hass)
+    await cache.async_load()
+    return cache
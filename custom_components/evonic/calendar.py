@@ -0,0 +1,176 @@
+"""Calendar of the timer schedules a fire runs on its own."""
+from __future__ import annotations
+
+from datetime import datetime, time, timedelta
+
+import voluptuous as vol
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import WEEKDAYS
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv, entity_platform
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, LOGGER
+from .coordinator import EvonicCoordinator
+from .models import EvonicEntity
+from .pyevonic import EvonicError, Schedule
+from .pyevonic.timers import FIRE, HEATER
+
+PARALLEL_UPDATES = 1
+
+SERVICE_SET_TIMER = "set_timer"
+SERVICE_REMOVE_TIMER = "remove_timer"
+
+ATTR_SCHEDULE_ID = "schedule_id"
+ATTR_DAYS = "days"
+ATTR_START = "start"
+ATTR_END = "end"
+ATTR_TARGET = "target"
+ATTR_ENABLED = "enabled"
+
+TARGETS = {"fire": FIRE, "heater": HEATER}
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
+) -> None:
+    coordinator: EvonicCoordinator = hass.data[DOMAIN][entry.entry_id]
+    if "timers" not in (coordinator.data.info.modules or []):
+        return
+
+    platform = entity_platform.async_get_current_platform()
+    platform.async_register_entity_service(
+        SERVICE_SET_TIMER,
+        {
+            vol.Optional(ATTR_SCHEDULE_ID): vol.Coerce(int),
+            vol.Required(ATTR_DAYS): cv.weekdays,
+            vol.Required(ATTR_START): cv.time,
+            vol.Optional(ATTR_END): cv.time,
+            vol.Optional(ATTR_TARGET, default="fire"): vol.In(TARGETS),
+            vol.Optional(ATTR_ENABLED, default=True): cv.boolean,
+        },
+        "async_set_timer",
+    )
+    platform.async_register_entity_service(
+        SERVICE_REMOVE_TIMER,
+        {vol.Required(ATTR_SCHEDULE_ID): vol.Coerce(int)},
+        "async_remove_timer",
+    )
+
+    async_add_entities([EvonicTimerCalendar(coordinator)])
+
+
+class EvonicTimerCalendar(EvonicEntity, CalendarEntity):
+    """The on/off schedules stored on the fire, which it runs without Home Assistant."""
+
+    _attr_icon = "mdi:calendar-clock"
+    _attr_name = "Timers"
+    _depends_on = frozenset({"timers"})
+
+    def __init__(self, coordinator: EvonicCoordinator) -> None:
+        super().__init__(coordinator=coordinator)
+        self._attr_unique_id = f"{coordinator.data.network.mac}_timers"
+
+    async def async_added_to_hass(self) -> None:
+        """Read the timers without holding up setup, the calendar stays empty until then."""
+        await super().async_added_to_hass()
+        if self.coordinator.evonic.timers is None:
+            self.coordinator.config_entry.async_create_background_task(
+                self.hass, self._async_load_timers(), f"{DOMAIN} load timers {self.entity_id}"
+            )
+
+    async def _async_load_timers(self) -> None:
+        try:
+            await self.coordinator.evonic.get_timers()
+        except EvonicError as err:
+            # Tried again when the calendar is next read
+            LOGGER.debug("Unable to read the timers of %s: %s", self.coordinator.evonic.host, err)
+            return
+        self.async_write_ha_state()
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        """Return the run in progress, or the next one."""
+        now = dt_util.now()
+        events = self._events(now, now + timedelta(days=8))
+        return min(events, key=lambda event: event.start, default=None)
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """List the schedules, so their ids can be handed to the services."""
+        timers = self.coordinator.evonic.timers
+        return {
+            "schedules": [
+                {
+                    ATTR_SCHEDULE_ID: schedule.id,
+                    ATTR_DAYS: [WEEKDAYS[day] for day in sorted(schedule.days)],
+                    ATTR_START: schedule.start.isoformat(),
+                    ATTR_END: schedule.end.isoformat() if schedule.end is not None else None,
+                    ATTR_TARGET: schedule.target.lower(),
+                    ATTR_ENABLED: schedule.active,
+                }
+                for schedule in timers or ()
+            ]
+        }
+
+    async def async_get_events(
+        self, hass: HomeAssistant, start_date: datetime, end_date: datetime
+    ) -> list[CalendarEvent]:
+        """Return the runs of every schedule between the two dates."""
+        if self.coordinator.evonic.timers is None:
+            await self._async_load_timers()
+        return sorted(self._events(dt_util.as_local(start_date), end_date), key=lambda event: event.start)
+
+    def _events(self, start: datetime, end: datetime) -> list[CalendarEvent]:
+        return [
+            CalendarEvent(
+                start=on,
+                end=off,
+                summary=f"{schedule.target} on",
+                description=f"Run by the fire, schedule {schedule.id}",
+                uid=f"{schedule.id}-{on.date().isoformat()}",
+            )
+            for schedule in self.coordinator.evonic.timers or ()
+            for on, off in schedule.occurrences(start, end)
+        ]
+
+    async def async_set_timer(
+        self,
+        days: list[str],
+        start: time,
+        end: time | None = None,
+        target: str = "fire",
+        enabled: bool = True,
+        schedule_id: int | None = None,
+    ) -> None:
+        """Add a schedule to the fire, or replace the one with ``schedule_id``."""
+        evonic = self.coordinator.evonic
+        if schedule_id is None:
+            schedule_id = evonic.timers.new_id()
+        schedule = Schedule(
+            id=schedule_id,
+            days=frozenset(WEEKDAYS.index(day) for day in days),
+            start=start,
+            end=end,
+            target=TARGETS[target],
+            active=enabled,
+        )
+        try:
+            await evonic.save_schedule(schedule)
+        except EvonicError as err:
+            raise HomeAssistantError(f"Unable to save the timer to the fire: {err}") from err
+        self.async_write_ha_state()
+
+    async def async_remove_timer(self, schedule_id: int) -> None:
+        """Remove a schedule from the fire."""
+        try:
+            await self.coordinator.evonic.remove_schedule(schedule_id)
+        except KeyError as err:
+            raise HomeAssistantError(f"The fire has no timer schedule {schedule_id}") from err
+        except EvonicError as err:
+            raise HomeAssistantError(f"Unable to remove the timer from the fire: {err}") from err
+        self.async_write_ha_state()
@@ -13,7 +13,9 @@ from homeassistant.components.climate import (
 )
 from homeassistant.components.climate.const import HVACMode
 
-PARALLEL_UPDATES = 1
+# Requests are already serialised per fire by pyevonic's scheduler. Letting
+# setpoint calls overlap allows a slider drag to be coalesced into one command.
+PARALLEL_UPDATES = 0
 
 
 async def async_setup_entry(
@@ -29,6 +31,12 @@ class EvonicHeater(EvonicEntity, ClimateEntity):
     """ Defined the Climate Heater """
 
     _attr_name = "Heater"
+    _depends_on = frozenset({
+        "climate.heating",
+        "climate.current_temp",
+        "climate.target_temp",
+        "climate.fahrenheit",
+    })
 
     def __init__(self, coordinator: EvonicCoordinator) -> None:
         super().__init__(coordinator=coordinator)
@@ -70,12 +78,13 @@ class EvonicHeater(EvonicEntity, ClimateEntity):
         if hvac_mode not in self._attr_hvac_modes:
             raise ValueError(f"Unsupported HVAC mode: {hvac_mode}")
 
-        if hvac_mode == HVACMode.HEAT:
-            await self.coordinator.evonic.heater_power("on")
-        if hvac_mode == HVACMode.OFF:
-            await self.coordinator.evonic.heater_power("off")
-
-        await self.coordinator.async_request_refresh()
+        try:
+            if hvac_mode == HVACMode.HEAT:
+                await self.coordinator.evonic.heater_power("on")
+            if hvac_mode == HVACMode.OFF:
+                await self.coordinator.evonic.heater_power("off")
+        finally:
+            await self.coordinator.async_request_refresh()
 
     @property
     def current_temperature(self) -> float | None:
@@ -106,8 +115,10 @@ class EvonicHeater(EvonicEntity, ClimateEntity):
         if self.coordinator.data.climate.fahrenheit:
             temp = round((temp - 32) * 5 / 9)
 
-        await self.coordinator.evonic.set_temperature(temp)
-        await self.coordinator.async_request_refresh()
+        try:
+            await self.coordinator.evonic.set_temperature(temp)
+        finally:
+            await self.coordinator.async_request_refresh()
 
 @callback
 def create_supported_entities(
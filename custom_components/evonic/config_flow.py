@@ -14,9 +14,19 @@ from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import aiohttp_client
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from .cache import async_get_config_cache
 from .pyevonic import Evonic, EvonicConnectionError
 
-from .const import DOMAIN, LOGGER
+from .const import (
+    CONF_ACTIVE_INTERVAL,
+    CONF_DIAGNOSTICS_REFRESH,
+    CONF_IDLE_INTERVAL,
+    CONF_PUSH,
+    DEFAULT_ACTIVE_INTERVAL,
+    DEFAULT_IDLE_INTERVAL,
+    DOMAIN,
+    LOGGER,
+)
 
 
 class EvonicConfigFlow(ConfigFlow, domain=DOMAIN):
@@ -24,6 +34,9 @@ class EvonicConfigFlow(ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    # What validating the fire fetched, handed over to the entry it creates
+    _snapshot: dict[str, Any] | None = None
+
     @staticmethod
     def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
         """Get the options flow for this handler."""
@@ -56,6 +69,7 @@ class EvonicConfigFlow(ConfigFlow, domain=DOMAIN):
                 self._abort_if_unique_id_configured(
                     updates={CONF_HOST: host}
                 )
+                await self._async_hand_off(host)
                 return self.async_create_entry(
                     title=device.info.ssdp, data={CONF_HOST: host}
                 )
@@ -97,6 +111,7 @@ class EvonicConfigFlow(ConfigFlow, domain=DOMAIN):
                 LOGGER.exception("Unexpected error connecting to Evonic host")
                 errors["base"] = "cannot_connect"
             else:
+                await self._async_hand_off(self._host)
                 return self.async_create_entry(
                     title=self._friendly_name,
                     data={CONF_HOST: self._host},
@@ -115,7 +130,14 @@ class EvonicConfigFlow(ConfigFlow, domain=DOMAIN):
         session = async_get_clientsession(self.hass)
         evonic = Evonic(host, session=session)
         await evonic.get_config()
-        return await evonic.get_device()
+        device = await evonic.get_device()
+        self._snapshot = evonic.export_config(include_live=True)
+        return device
+
+    async def _async_hand_off(self, host):
+        """Pass what validating the fire fetched on to the entry about to be created."""
+        cache = await async_get_config_cache(self.hass)
+        cache.hand_off(host, self._snapshot)
 
 
 class EvonicOptionsFlow(OptionsFlow):
@@ -133,6 +155,7 @@ class EvonicOptionsFlow(OptionsFlow):
 
         if user_input is not None:
             new_host = user_input[CONF_HOST].strip()
+            options = {key: value for key, value in user_input.items() if key != CONF_HOST}
             if not new_host:
                 errors["base"] = "invalid_host"
             else:
@@ -143,6 +166,9 @@ class EvonicOptionsFlow(OptionsFlow):
                         session = async_get_clientsession(self.hass)
                         evonic = Evonic(new_host, session=session)
                         await evonic.get_config()
+                        # The reload below sets the entry up from this instead of fetching it again
+                        cache = await async_get_config_cache(self.hass)
+                        cache.hand_off(new_host, evonic.export_config())
                     except (EvonicConnectionError, OSError, asyncio.TimeoutError):
                         errors["base"] = "cannot_connect"
                     except Exception:
@@ -157,9 +183,9 @@ class EvonicOptionsFlow(OptionsFlow):
                         await self.hass.config_entries.async_reload(
                             self.config_entry.entry_id
                         )
-                        return self.async_create_entry(title="", data={})
+                        return self.async_create_entry(title="", data=options)
                 else:
-                    return self.async_create_entry(title="", data={})
+                    return self.async_create_entry(title="", data=options)
 
         return self.async_show_form(
             step_id="init",
@@ -169,6 +195,26 @@ class EvonicOptionsFlow(OptionsFlow):
                         CONF_HOST,
                         default=self.config_entry.data.get(CONF_HOST, ""),
                     ): str,
+                    vol.Optional(
+                        CONF_PUSH,
+                        default=self.config_entry.options.get(CONF_PUSH, False),
+                    ): bool,
+                    vol.Optional(
+                        CONF_ACTIVE_INTERVAL,
+                        default=self.config_entry.options.get(
+                            CONF_ACTIVE_INTERVAL, int(DEFAULT_ACTIVE_INTERVAL.total_seconds())
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=5, max=300)),
+                    vol.Optional(
+                        CONF_IDLE_INTERVAL,
+                        default=self.config_entry.options.get(
+                            CONF_IDLE_INTERVAL, int(DEFAULT_IDLE_INTERVAL.total_seconds())
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=30, max=3600)),
+                    vol.Optional(
+                        CONF_DIAGNOSTICS_REFRESH,
+                        default=self.config_entry.options.get(CONF_DIAGNOSTICS_REFRESH, False),
+                    ): bool,
                 }
             ),
             errors=errors,
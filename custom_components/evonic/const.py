@@ -2,7 +2,25 @@ from datetime import timedelta
 import logging
 
 DOMAIN = "evonic"
+DATA_HUB = f"{DOMAIN}_hub"
+DATA_CONFIG_CACHE = f"{DOMAIN}_config_cache"
 BRAND = "Evonic Fires"
 LOGGER = logging.getLogger(__package__)
 SCAN_INTERVAL = timedelta(seconds=30)
+DEFAULT_ACTIVE_INTERVAL = timedelta(seconds=10)
+DEFAULT_IDLE_INTERVAL = timedelta(minutes=2)
+MAX_BACKOFF_INTERVAL = timedelta(minutes=10)
+COMMAND_ACTIVE_PERIOD = timedelta(minutes=2)
+PUSH_SAFETY_INTERVAL = timedelta(minutes=5)
+COMMAND_CONFIRM_DELAY = timedelta(seconds=3)
+SETUP_REFRESH_INTERVAL = timedelta(minutes=10)
 EFFECTS_REFRESH_INTERVAL = timedelta(hours=1)
+MAX_CONCURRENT_POLLS = 4
+CONFIG_CACHE_SAVE_DELAY = 10
+# How long a config flow's snapshot of a fire may be used to set up its entry
+CONFIG_HANDOFF_MAX_AGE = timedelta(minutes=1)
+
+CONF_PUSH = "push"
+CONF_ACTIVE_INTERVAL = "active_interval"
+CONF_IDLE_INTERVAL = "idle_interval"
+CONF_DIAGNOSTICS_REFRESH = "diagnostics_refresh"
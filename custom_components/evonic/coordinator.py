@@ -1,28 +1,203 @@
+from datetime import timedelta
+import time
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from .pyevonic import Device as EvonicDevice, Evonic, EvonicError
+from .pyevonic import Device as EvonicDevice, Evonic, EvonicError, EvonicPush, deadline
 
-from .const import DOMAIN, LOGGER, SCAN_INTERVAL
+from .const import (
+    COMMAND_ACTIVE_PERIOD,
+    COMMAND_CONFIRM_DELAY,
+    CONF_ACTIVE_INTERVAL,
+    CONF_IDLE_INTERVAL,
+    CONF_PUSH,
+    DEFAULT_ACTIVE_INTERVAL,
+    DEFAULT_IDLE_INTERVAL,
+    DOMAIN,
+    EFFECTS_REFRESH_INTERVAL,
+    LOGGER,
+    MAX_BACKOFF_INTERVAL,
+    PUSH_SAFETY_INTERVAL,
+    SCAN_INTERVAL,
+    SETUP_REFRESH_INTERVAL,
+)
+from .hub import get_hub
 
 
 class EvonicCoordinator(DataUpdateCoordinator[EvonicDevice]):
     config_entry: ConfigEntry
 
     def __init__(self, hass, *, entry):
+        # The client creates its own session, its connector is tuned to this fire alone
         self.evonic = Evonic(
-            entry.data[CONF_HOST], session=async_get_clientsession(hass)
+            entry.data[CONF_HOST],
+            setup_refresh_interval=SETUP_REFRESH_INTERVAL,
+            effects_refresh_interval=EFFECTS_REFRESH_INTERVAL,
+            # Entities only need modules, options and live state to be created
+            defer_config=True,
+        )
+        self.active_interval = timedelta(
+            seconds=entry.options.get(CONF_ACTIVE_INTERVAL, DEFAULT_ACTIVE_INTERVAL.total_seconds())
+        )
+        self.idle_interval = timedelta(
+            seconds=entry.options.get(CONF_IDLE_INTERVAL, DEFAULT_IDLE_INTERVAL.total_seconds())
+        )
+        self._failures = 0
+        self._last_command: float | None = None
+        # How often to poll, DataUpdateCoordinator's own update_interval stays unset
+        self.poll_interval = SCAN_INTERVAL
+        self._unsub_poll: CALLBACK_TYPE | None = None
+        self._stopped = False
+        # Device fields changed by the update listeners are being told about.
+        # None means unknown, so every entity writes its state.
+        self.changed: set[str] | None = None
+
+        self.hub = get_hub(hass)
+        self.hub.register(self)
+
+        self.push: EvonicPush | None = None
+        if entry.options.get(CONF_PUSH):
+            self.push = EvonicPush(
+                self.evonic,
+                on_update=self._handle_push_update,
+                on_connection_change=self._handle_push_connection,
+            )
+        self.evonic.add_listener(self._handle_command_state)
+        self.evonic.add_refresh_listener(self._handle_background_refresh)
+        super().__init__(
+            hass,
+            LOGGER,
+            name=DOMAIN,
+            # Polls are timed by _schedule_poll, on this fire's phase of the interval
+            update_interval=None,
+            # Commands publish their state immediately, so a single trailing
+            # poll after a burst of commands is enough to confirm it
+            request_refresh_debouncer=Debouncer(
+                hass,
+                LOGGER,
+                cooldown=COMMAND_CONFIRM_DELAY.total_seconds(),
+                immediate=False,
+            ),
+        )
+
+    @callback
+    def _handle_command_state(self) -> None:
+        """Publish the state a command is expected to produce."""
+        self._last_command = time.monotonic()
+        self.poll_interval = self._next_update_interval()
+        # Not async_set_updated_data, which would count as a successful poll
+        # and cancel the debounced refresh that confirms the command
+        if self.data is not None:
+            self.changed = self.evonic.pop_changes()
+            self.async_update_listeners()
+
+    @callback
+    def _handle_background_refresh(self) -> None:
+        """Publish configuration that finished loading after the poll that started it."""
+        if self.data is not None:
+            self.changed = self.evonic.pop_changes()
+            self.async_update_listeners()
+
+    @callback
+    def _handle_push_update(self, device: EvonicDevice) -> None:
+        self.changed = self.evonic.pop_changes()
+        self.async_set_updated_data(device)
+
+    @callback
+    def _handle_push_connection(self, connected: bool) -> None:
+        self.poll_interval = self._next_update_interval()
+
+    def _next_update_interval(self, device: EvonicDevice | None = None) -> timedelta:
+        """Pick the polling interval from reachability and what the fire is doing."""
+        device = device or self.data
+        if self._failures:
+            # Clamped, as timedelta overflows long before failures stop counting
+            backoff = SCAN_INTERVAL * 2 ** min(self._failures - 1, 6)
+            return min(backoff, MAX_BACKOFF_INTERVAL)
+
+        # Poll only as a safety net while the push connection is healthy
+        if self.push is not None and self.push.connected:
+            return PUSH_SAFETY_INTERVAL
+
+        recent_command = (
+            self._last_command is not None
+            and time.monotonic() - self._last_command < COMMAND_ACTIVE_PERIOD.total_seconds()
         )
-        super().__init__(hass, LOGGER, name=DOMAIN, update_interval=SCAN_INTERVAL)
+        if recent_command or (device is not None and device.climate.heating):
+            return self.active_interval
+
+        if device is not None and not device.info.on:
+            return self.idle_interval
+
+        return SCAN_INTERVAL
+
+    @callback
+    def async_set_updated_data(self, data: EvonicDevice) -> None:
+        """Publish pushed state and start the polling interval over, like a poll would."""
+        super().async_set_updated_data(data)
+        self._schedule_poll()
+
+    @callback
+    def _schedule_poll(self) -> None:
+        """Schedule the next poll on this fire's phase of the polling interval."""
+        self._cancel_poll()
+        if self._stopped or (self.config_entry and self.config_entry.pref_disable_polling):
+            return
+
+        now = self.hass.loop.time()
+        delay = self.hub.next_poll(self, now, self.poll_interval.total_seconds()) - now
+        self._unsub_poll = async_call_later(self.hass, delay, self._handle_poll)
+
+    @callback
+    def _cancel_poll(self) -> None:
+        if self._unsub_poll is not None:
+            self._unsub_poll()
+            self._unsub_poll = None
+
+    async def _handle_poll(self, _now) -> None:
+        self._unsub_poll = None
+        if not self.hass.is_stopping:
+            await self.async_refresh()
+
+    async def async_shutdown(self) -> None:
+        """Stop polling, the push connection and any background refreshes."""
+        self._stopped = True
+        self._cancel_poll()
+        await super().async_shutdown()
+        self.hub.unregister(self)
+        if self.push is not None:
+            await self.push.stop()
+        await self.evonic.close()
 
     async def _async_update_data(self) -> EvonicDevice:
         try:
-            device = await self.evonic.get_device()
+            return await self._poll()
+        finally:
+            # Polls requested after a command start the interval over too
+            self._schedule_poll()
+
+    async def _poll(self) -> EvonicDevice:
+        # Waiting for a poll slot included, a poll never outlives its interval
+        budget = self.poll_interval.total_seconds()
+        try:
+            async with deadline(budget), self.hub.poll():
+                device = await self.evonic.get_device()
         except EvonicError as error:
+            self.changed = set()
+            self._failures += 1
+            self.poll_interval = self._next_update_interval()
             raise UpdateFailed(f"Invalid response from API: {error}") from error
         except Exception as error:
+            self.changed = set()
+            self._failures += 1
+            self.poll_interval = self._next_update_interval()
             raise UpdateFailed(f"Unexpected error communicating with Evonic device: {error}") from error
 
+        self._failures = 0
+        self.changed = self.evonic.pop_changes()
+        self.poll_interval = self._next_update_interval(device)
         return device
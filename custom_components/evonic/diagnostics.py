@@ -7,7 +7,8 @@ from homeassistant.components.diagnostics import async_redact_data
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
-from .const import DOMAIN
+from .const import CONF_DIAGNOSTICS_REFRESH, DOMAIN
+from .pyevonic.refresh import ADMIN, EFFECTS, LIVE, MODULES, OPTIONS, SETUP
 
 MODULES_REDACT = {"mail"}
 
@@ -19,27 +20,36 @@ SETUP_REDACT = {"ssid", "ssidPass", "ip", "subnet", "getway", "mail", "pass", "s
 async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, entry: ConfigEntry
 ) -> dict[str, Any]:
-    """Return diagnostics for a config entry."""
+    """Return diagnostics for a config entry.
+
+    Served from the payloads and poll history the client already holds, so
+    a fire that is misbehaving is not loaded with extra requests. With the
+    diagnostics refresh option on, the endpoints are fetched again first,
+    waiting their turn behind the polls of every fire.
+    """
     coordinator = hass.data[DOMAIN][entry.entry_id]
     evonic = coordinator.evonic
 
-    async def fetch_json(uri: str) -> dict:
-        try:
-            response = await evonic.http_request(uri, "GET", None)
-            return await response.json(content_type=None)
-        except Exception as err:
-            return {"error": str(err)}
+    fetch_errors = {}
+    if entry.options.get(CONF_DIAGNOSTICS_REFRESH, False):
+        async with coordinator.hub.poll():
+            fetch_errors = await evonic.refresh_payloads()
 
-    modules = await fetch_json("/modules.json")
-    admin = await fetch_json("/config.admin.json")
-    live = await fetch_json("/config.live.json")
-    options = await fetch_json("/config.options.json")
-    setup = await fetch_json("/config.setup.json")
+    payloads = evonic.payloads
 
     return {
-        "modules": async_redact_data(modules, MODULES_REDACT),
-        "config_admin": admin,
-        "config_live": live,
-        "config_options": async_redact_data(options, OPTIONS_REDACT),
-        "config_setup": async_redact_data(setup, SETUP_REDACT),
+        "modules": async_redact_data(payloads.get(MODULES, {}), MODULES_REDACT),
+        "config_admin": payloads.get(ADMIN, {}),
+        "config_live": payloads.get(LIVE, {}),
+        "config_options": async_redact_data(payloads.get(OPTIONS, {}), OPTIONS_REDACT),
+        "config_setup": async_redact_data(payloads.get(SETUP, {}), SETUP_REDACT),
+        "effects": payloads.get(EFFECTS, {}),
+        "fetch_errors": fetch_errors,
+        "polls": evonic.history.as_list(),
+        "scheduler": evonic.scheduler.stats.as_dict(),
+        "single_flight": evonic.single_flight.as_dict(),
+        "transports": evonic.transport_health,
+        "capabilities": evonic.capabilities.as_dict(),
+        "metrics": evonic.metrics.as_dict(),
+        "hub": coordinator.hub.stats.as_dict(),
     }
@@ -0,0 +1,115 @@
+"""Hub shared by every Evonic config entry.
+
+Each fire has its own coordinator, and left alone they all poll on the same
+grid, so a room full of fires hits the access point in one burst. The hub
+gives every coordinator its own phase within the polling interval, caps how
+many fires are polled at once and keeps fleet-wide poll statistics.
+"""
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_HUB, MAX_CONCURRENT_POLLS
+
+if TYPE_CHECKING:
+    from .coordinator import EvonicCoordinator
+
+# Golden ratio conjugate; slot n sits at n * PHI mod 1, which keeps any number
+# of slots close to evenly spread without moving the ones already placed
+PHI = (math.sqrt(5) - 1) / 2
+
+
+@dataclass
+class HubStats:
+    """Poll latency and failure counts across all fires."""
+
+    fires: int = 0
+    polls: int = 0
+    failures: int = 0
+    in_flight: int = 0
+    max_in_flight: int = 0
+    last_latency: float = 0.0
+    max_latency: float = 0.0
+    total_latency: float = 0.0
+    max_wait: float = 0.0
+
+    @property
+    def average_latency(self) -> float:
+        return self.total_latency / self.polls if self.polls else 0.0
+
+    def as_dict(self) -> dict:
+        return {**asdict(self), "average_latency": self.average_latency}
+
+
+class EvonicHub:
+    """Staggers and limits the polls of every Evonic fire in Home Assistant."""
+
+    def __init__(self, max_concurrent: int = MAX_CONCURRENT_POLLS) -> None:
+        self.max_concurrent = max_concurrent
+        self.stats = HubStats()
+        self._slots: dict[EvonicCoordinator, int] = {}
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+
+    def register(self, coordinator: EvonicCoordinator) -> None:
+        """Give ``coordinator`` the lowest free phase slot."""
+        if coordinator in self._slots:
+            return
+        taken = set(self._slots.values())
+        self._slots[coordinator] = next(slot for slot in range(len(taken) + 1) if slot not in taken)
+        self.stats.fires = len(self._slots)
+
+    def unregister(self, coordinator: EvonicCoordinator) -> None:
+        self._slots.pop(coordinator, None)
+        self.stats.fires = len(self._slots)
+
+    def phase(self, coordinator: EvonicCoordinator) -> float:
+        """Return the coordinator's phase as a fraction of its polling interval."""
+        return (self._slots.get(coordinator, 0) * PHI) % 1
+
+    def next_poll(self, coordinator: EvonicCoordinator, now: float, interval: float) -> float:
+        """Return when the coordinator should next poll, on its own phase of ``interval``.
+
+        The result is the first point of the coordinator's grid at least half an
+        interval after ``now``, so a poll is never pulled in by more than half.
+        """
+        offset = self.phase(coordinator) * interval
+        return offset + interval * math.ceil((now + interval / 2 - offset) / interval)
+
+    @asynccontextmanager
+    async def poll(self) -> AsyncIterator[None]:
+        """Hold one of the fleet's poll slots and record the poll's latency and outcome."""
+        queued = time.monotonic()
+        async with self._semaphore:
+            start = time.monotonic()
+            stats = self.stats
+            stats.max_wait = max(stats.max_wait, start - queued)
+            stats.in_flight += 1
+            stats.max_in_flight = max(stats.max_in_flight, stats.in_flight)
+            try:
+                yield
+            except BaseException:
+                stats.failures += 1
+                raise
+            finally:
+                stats.in_flight -= 1
+                latency = time.monotonic() - start
+                stats.polls += 1
+                stats.last_latency = latency
+                stats.max_latency = max(stats.max_latency, latency)
+                stats.total_latency += latency
+
+
+def get_hub(hass: HomeAssistant) -> EvonicHub:
+    """Return the hub shared by every Evonic config entry, creating it on first use."""
+    hub = hass.data.get(DATA_HUB)
+    if hub is None:
+        hub = hass.data[DATA_HUB] = EvonicHub()
+    return hub
@@ -31,6 +31,7 @@ class EvonicFeatureLight(EvonicEntity, LightEntity):
     _attr_name = "Feature Light"
     _attr_color_mode = ColorMode.ONOFF
     _attr_supported_color_modes = {ColorMode.ONOFF}
+    _depends_on = frozenset({"info.on", "light.feature_light"})
 
     def __init__(self, coordinator: EvonicCoordinator) -> None:
         super().__init__(coordinator=coordinator)
@@ -49,20 +50,26 @@ class EvonicFeatureLight(EvonicEntity, LightEntity):
 
     async def async_turn_off(self) -> None:
         """Turn off the power"""
-        if self.is_on:
-            await self.coordinator.evonic.toggle_feature_light()
-        await self.coordinator.async_request_refresh()
+        try:
+            if self.is_on:
+                await self.coordinator.evonic.toggle_feature_light()
+        finally:
+            await self.coordinator.async_request_refresh()
 
     async def async_turn_on(self) -> None:
         """Turn on the power"""
-        if not self.is_on:
-            await self.coordinator.evonic.toggle_feature_light()
-        await self.coordinator.async_request_refresh()
+        try:
+            if not self.is_on:
+                await self.coordinator.evonic.toggle_feature_light()
+        finally:
+            await self.coordinator.async_request_refresh()
 
 
 class EvonicFireLight(EvonicEntity, LightEntity):
     """Define the Fire Light.  This is the fire 'power', as it must always be on, if the Heater is on"""
 
+    _depends_on = frozenset({"info.on", "light.effect", "effects.available_effects"})
+
     def __init__(self, coordinator: EvonicCoordinator) -> None:
         super().__init__(coordinator=coordinator)
 
@@ -89,23 +96,25 @@ class EvonicFireLight(EvonicEntity, LightEntity):
 
         if not self.coordinator.data.effects.available_effects:
             return ["Eos"]
-        return self.coordinator.data.effects.available_effects
+        return list(self.coordinator.data.effects.available_effects)
 
     async def async_turn_off(self) -> None:
         """Turn off the power"""
-        await self.coordinator.evonic.power("off")
-        await self.coordinator.async_request_refresh()
+        try:
+            await self.coordinator.evonic.power("off")
+        finally:
+            await self.coordinator.async_request_refresh()
 
     async def async_turn_on(self, **kwargs) -> None:
         """Turn on the power"""
-        if not self.is_on:
-            await self.coordinator.evonic.power("on")
-
-        if ATTR_EFFECT in kwargs:
-            await self.coordinator.evonic.set_effect(kwargs[ATTR_EFFECT])
-            self.async_write_ha_state()
-
-        await self.coordinator.async_request_refresh()
+        try:
+            if not self.is_on:
+                await self.coordinator.evonic.power("on")
+
+            if ATTR_EFFECT in kwargs:
+                await self.coordinator.evonic.set_effect(kwargs[ATTR_EFFECT])
+        finally:
+            await self.coordinator.async_request_refresh()
 
 
 @callback
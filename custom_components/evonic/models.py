@@ -1,3 +1,4 @@
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.const import CONF_HOST
@@ -8,6 +9,30 @@ from .const import DOMAIN, BRAND
 
 class EvonicEntity(CoordinatorEntity[EvonicCoordinator]):
     _attr_has_entity_name = True
+    # Device fields the state is built from, e.g. "climate.target_temp".
+    # None writes state on every coordinator update.
+    _depends_on: frozenset[str] | None = None
+    _last_available: bool | None = None
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self._last_available = self.available
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when availability or a field the entity depends on changed."""
+        available = self.available
+        changed = self.coordinator.changed
+        if (
+            self._depends_on is not None
+            and changed is not None
+            and available == self._last_available
+            and self._depends_on.isdisjoint(changed)
+        ):
+            return
+
+        self._last_available = available
+        super()._handle_coordinator_update()
 
     @property
     def device_info(self) -> DeviceInfo:
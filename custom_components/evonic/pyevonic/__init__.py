@@ -1,9 +1,23 @@
+from .breaker import BreakerState, CircuitBreaker
+from .capabilities import CapabilityMap
+from .coalescer import CommandCoalescer
+from .deadline import Deadline, current_deadline, deadline
+from .effects import EffectFamily, EffectList
 from .evonic import Evonic
 from .exceptions import (
+    EvonicCircuitOpenError,
     EvonicConnectionClosed,
     EvonicConnectionError,
     EvonicConnectionTimeoutError,
     EvonicError,
+    EvonicResponseError,
     EvonicUnsupportedFeature,
 )
-from .models import Climate, Device, Effects, Info, Light, Network
\ No newline at end of file
+from .fleet import EvonicFleet, FleetResult
+from .metrics import EndpointMetrics, RequestMetrics
+from .models import Climate, Device, Effects, Info, Light, Network
+from .push import EvonicPush
+from .response import EvonicResponse
+from .scheduler import RequestPriority, RequestScheduler, SchedulerStats
+from .singleflight import SingleFlight, SingleFlightStats
+from .timers import Schedule, TimerDiff, TimerTable
@@ -0,0 +1,79 @@
+"""Circuit breakers tracking the health of each transport to an Evonic Fire.
+
+When a fire's HTTP server wedges, every request used to wait out the full
+timeout before falling back to the WebSocket. A breaker opens after repeated
+failures so requests go straight to the healthy transport, and lets a single
+probe through once ``reset_timeout`` has passed to find out if it recovered.
+"""
+from __future__ import annotations
+
+import time
+from enum import Enum
+
+
+class BreakerState(str, Enum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Closed/open/half-open circuit breaker for one transport."""
+
+    def __init__(self, name: str, failure_threshold: int = 3, reset_timeout: float = 60.0) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.trips = 0
+        self.rejected = 0
+        self.last_error: str | None = None
+        self._opened_at: float | None = None
+
+    @property
+    def state(self) -> BreakerState:
+        if self._opened_at is None:
+            return BreakerState.CLOSED
+        if time.monotonic() - self._opened_at < self.reset_timeout:
+            return BreakerState.OPEN
+        return BreakerState.HALF_OPEN
+
+    def allow(self) -> bool:
+        """Return whether a request may use this transport.
+
+        In the half-open state one probe is let through, and the breaker reads
+        as open again until that probe reports back or another timeout passes.
+        """
+        state = self.state
+        if state is BreakerState.CLOSED:
+            return True
+        if state is BreakerState.HALF_OPEN:
+            self._opened_at = time.monotonic()
+            return True
+
+        self.rejected += 1
+        return False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self._opened_at = None
+
+    def record_failure(self, error: Exception | str | None = None) -> None:
+        self.failures += 1
+        if error is not None:
+            self.last_error = str(error)
+        if self._opened_at is not None or self.failures >= self.failure_threshold:
+            if self._opened_at is None:
+                self.trips += 1
+            self._opened_at = time.monotonic()
+
+    def as_dict(self) -> dict:
+        return {
+            "state": self.state.value,
+            "failures": self.failures,
+            "trips": self.trips,
+            "rejected": self.rejected,
+            "last_error": self.last_error,
+        }
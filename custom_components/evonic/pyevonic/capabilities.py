@@ -0,0 +1,107 @@
+"""Which endpoints and transports a fire's firmware answers.
+
+Older firmwares have no /effect.json, and some never accept a WebSocket.
+Asking them anyway costs a full request timeout every time. The capability
+map remembers what each firmware build answered, so known-missing endpoints
+are not requested again until the build changes. The map is tied to the
+build it was learned on and has to be confirmed against the fire's current
+build once ``ttl`` has passed. An endpoint only given up on after timeouts
+is tried again once ``ttl`` has passed, as timeouts can also be the network.
+"""
+from __future__ import annotations
+
+import time
+from datetime import timedelta
+
+HTTP = "http"
+WEBSOCKET = "websocket"
+# Whether the firmware keeps HTTP connections open for another request
+KEEP_ALIVE = "keep_alive"
+
+# Timeouts on an endpoint of an otherwise responsive fire before it counts as missing
+TIMEOUTS_BEFORE_UNSUPPORTED = 2
+
+# Seconds since the fire last answered anything for it to count as responsive
+RESPONSIVE_WINDOW = 60.0
+
+
+class CapabilityMap:
+    """Supported and unsupported endpoints and transports of one fire.
+
+    Args:
+        ttl: How long the map holds before the firmware build must be confirmed again
+    """
+
+    def __init__(self, ttl: timedelta = timedelta(days=1)) -> None:
+        self.ttl = ttl
+        self.build: str | None = None
+        self._confirmed = 0.0
+        self._supported: dict[str, bool] = {}
+        self._timeouts: dict[str, int] = {}
+        # When endpoints given up on after timeouts are tried again, as a Unix timestamp
+        self._retry_at: dict[str, float] = {}
+        self._answered = float("-inf")
+
+    @property
+    def expired(self) -> bool:
+        """Whether the firmware build should be checked again."""
+        return time.time() - self._confirmed >= self.ttl.total_seconds()
+
+    def supports(self, key: str) -> bool | None:
+        """Return whether the endpoint or transport ``key`` works, or None if not known yet."""
+        retry_at = self._retry_at.get(key)
+        if retry_at is not None and time.time() >= retry_at:
+            del self._retry_at[key]
+            self._supported.pop(key, None)
+        return self._supported.get(key)
+
+    def record(self, key: str, supported: bool) -> None:
+        self._supported[key] = supported
+        self._timeouts.pop(key, None)
+        self._retry_at.pop(key, None)
+        if supported:
+            self._answered = time.monotonic()
+
+    def record_timeout(self, key: str) -> None:
+        """Count a timeout on ``key``, marking it unsupported once it keeps happening.
+
+        Timeouts only count while the fire answers other requests, a stalled
+        network times out every one of them.
+        """
+        if time.monotonic() - self._answered > RESPONSIVE_WINDOW:
+            return
+        self._timeouts[key] = self._timeouts.get(key, 0) + 1
+        if self._timeouts[key] >= TIMEOUTS_BEFORE_UNSUPPORTED:
+            self.record(key, False)
+            self._retry_at[key] = time.time() + self.ttl.total_seconds()
+
+    def confirm(self, build: str | None) -> bool:
+        """Confirm the map against the fire's current firmware build.
+
+        Returns:
+            True when the build changed and everything known was forgotten.
+        """
+        changed = build != self.build
+        if changed:
+            self._supported.clear()
+            self._timeouts.clear()
+            self._retry_at.clear()
+            self.build = build
+        self._confirmed = time.time()
+        return changed
+
+    def as_dict(self) -> dict:
+        return {
+            "build": self.build,
+            "confirmed": self._confirmed,
+            "supported": dict(self._supported),
+            "retry_at": dict(self._retry_at),
+        }
+
+    def restore(self, data: dict) -> None:
+        """Load a map saved with ``as_dict``."""
+        self.build = data.get("build")
+        self._confirmed = data.get("confirmed", 0.0)
+        self._supported = dict(data.get("supported", {}))
+        self._retry_at = dict(data.get("retry_at", {}))
+        self._timeouts.clear()
@@ -0,0 +1,86 @@
+"""Last-write-wins coalescing of commands for continuous controls.
+
+Dragging a slider produces a stream of setpoints, but only the final one
+matters. Commands submitted for the same family within a short window are
+merged: superseded values are dropped, only the last value is sent and every
+caller in the window resolves with its result.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class _PendingCommand:
+    value: Any
+    send: Callable[[Any], Awaitable[Any]]
+    future: asyncio.Future
+
+
+class CommandCoalescer:
+    """Sends only the latest value submitted per command family within ``window`` seconds."""
+
+    def __init__(self, window: float = 0.3) -> None:
+        self.window = window
+        self.sent = 0
+        self.superseded = 0
+        self._pending: dict[str, _PendingCommand] = {}
+        # The event loop only keeps weak references to tasks
+        self._tasks: set[asyncio.Task] = set()
+
+    async def submit(self, family: str, value: Any, send: Callable[[Any], Awaitable[Any]]) -> Any:
+        """Queue ``value`` for ``family`` and wait until the window's final value is sent.
+
+        Args:
+            family: Command family, e.g. ``templevel`` or ``rgb set 0 brightness``
+            value: The value to send
+            send: Coroutine function that sends a value to the fire
+
+        Returns:
+            The result of sending the final value in the window.
+        """
+        pending = self._pending.get(family)
+        if pending is None:
+            pending = _PendingCommand(value, send, asyncio.get_running_loop().create_future())
+            self._pending[family] = pending
+            task = asyncio.create_task(self._flush(family, pending))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            task.add_done_callback(lambda _: self._finished(family, pending))
+        else:
+            pending.value = value
+            pending.send = send
+            self.superseded += 1
+
+        # Shield the shared future so one cancelled caller does not cancel the rest
+        return await asyncio.shield(pending.future)
+
+    async def close(self) -> None:
+        """Cancel commands still waiting to be sent, their callers get CancelledError."""
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _flush(self, family: str, pending: _PendingCommand) -> None:
+        await asyncio.sleep(self.window)
+        # Values submitted from here on start a window of their own
+        del self._pending[family]
+        self.sent += 1
+        try:
+            result = await pending.send(pending.value)
+        except Exception as err:  # pylint: disable=broad-except
+            pending.future.set_exception(err)
+            # Every caller may have been cancelled, leaving no one to retrieve it
+            pending.future.exception()
+        else:
+            pending.future.set_result(result)
+
+    def _finished(self, family: str, pending: _PendingCommand) -> None:
+        # A flush cancelled before it resolved must not leave its callers, or later submits, waiting on it
+        if self._pending.get(family) is pending:
+            del self._pending[family]
+        pending.future.cancel()
@@ -0,0 +1,77 @@
+"""Time budgets shared by every request an operation makes.
+
+A poll chains several requests, each with its own timeout, and a WebSocket
+fallback can follow a failed HTTP request. Without a shared budget a poll
+of a dead fire takes the sum of all of them. Inside ``deadline`` every
+request only waits as long as the operation has left, and whatever is
+still running when the budget runs out is cancelled.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+
+import async_timeout
+
+from .exceptions import EvonicConnectionTimeoutError
+
+_CURRENT: ContextVar[Deadline | None] = ContextVar("evonic_deadline", default=None)
+
+
+class Deadline:
+    """The point in time an operation has to be finished by.
+
+    Args:
+        budget: Seconds the operation may take
+        parent: An enclosing deadline, which this one never outlasts
+    """
+
+    __slots__ = ("budget", "expires")
+
+    def __init__(self, budget: float, parent: Deadline | None = None) -> None:
+        self.budget = budget
+        self.expires = time.monotonic() + budget
+        if parent is not None and parent.expires < self.expires:
+            self.expires = parent.expires
+
+    @property
+    def remaining(self) -> float:
+        """Seconds left, never below zero."""
+        return max(0.0, self.expires - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires
+
+    def timeout(self, cap: float) -> float:
+        """Return how long one step may take: ``cap``, or less if the budget is nearly spent."""
+        return min(cap, self.remaining)
+
+    def __repr__(self) -> str:
+        return f"Deadline(budget={self.budget}, remaining={self.remaining:.3f})"
+
+
+def current_deadline() -> Deadline | None:
+    """Return the deadline of the operation running in this task, if any."""
+    return _CURRENT.get()
+
+
+@asynccontextmanager
+async def deadline(budget: float) -> AsyncIterator[Deadline]:
+    """Run the block within ``budget`` seconds, or within the enclosing deadline if that ends sooner.
+
+    Raises:
+        EvonicConnectionTimeoutError: The budget ran out, the block was cancelled
+    """
+    current = Deadline(budget, _CURRENT.get())
+    token = _CURRENT.set(current)
+    try:
+        async with async_timeout.timeout(current.remaining):
+            yield current
+    except asyncio.TimeoutError as err:
+        raise EvonicConnectionTimeoutError(f"Gave up after the {budget:.1f}s deadline ran out") from err
+    finally:
+        _CURRENT.reset(token)
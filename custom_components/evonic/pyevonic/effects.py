@@ -0,0 +1,248 @@
+"""Effect catalog for Evonic Fires.
+
+Built-in effects per model config, derived from docs/device-features.md. Most
+models share one of a handful of effect families, so each family is built
+once at import and shared by every model and every fire that uses it. A fire's
+EffectList layers the extra effects it reports in /effect.json (e.g. purchased
+effects) on top of its family, with constant-time membership and index lookup.
+"""
+from __future__ import annotations
+
+import sys
+import weakref
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from types import MappingProxyType
+
+
+class EffectFamily:
+    """An immutable, ordered set of effect names shared between models."""
+
+    __slots__ = ("name", "names", "_index", "__weakref__")
+
+    def __init__(self, name: str, names: Iterable[str]) -> None:
+        self.name = name
+        self.names: tuple[str, ...] = tuple(dict.fromkeys(sys.intern(effect) for effect in names))
+        self._index: Mapping[str, int] = MappingProxyType({effect: i for i, effect in enumerate(self.names)})
+
+    def __contains__(self, effect: object) -> bool:
+        return effect in self._index
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+
+    def index(self, effect: str) -> int:
+        """Return the position of ``effect``, raising ValueError when it is unknown."""
+        try:
+            return self._index[effect]
+        except KeyError:
+            raise ValueError(f"{effect!r} is not in effect family {self.name}") from None
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        # Immutable and shared, copies would only cost memory
+        return self
+
+    def __repr__(self) -> str:
+        return f"EffectFamily({self.name!r}, {list(self.names)!r})"
+
+
+EMPTY = EffectFamily("none", ())
+
+
+class EffectList(Sequence[str]):
+    """A fire's effects: its model's shared family followed by device-specific extras.
+
+    Use ``effect_list`` to build one, which reuses an existing view when
+    another fire has the same family and extras.
+    """
+
+    __slots__ = ("base", "extra", "_extra_index", "__weakref__")
+
+    def __init__(self, base: EffectFamily, extra: Iterable[str] = ()) -> None:
+        self.base = base
+        self.extra: tuple[str, ...] = tuple(
+            dict.fromkeys(sys.intern(effect) for effect in extra if effect not in base)
+        )
+        self._extra_index = {effect: len(base) + i for i, effect in enumerate(self.extra)}
+
+    def __contains__(self, effect: object) -> bool:
+        return effect in self.base or effect in self._extra_index
+
+    def __len__(self) -> int:
+        return len(self.base) + len(self.extra)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.base.names
+        yield from self.extra
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self)[index]
+        if index < 0:
+            index += len(self)
+        base = len(self.base)
+        if 0 <= index < base:
+            return self.base.names[index]
+        if base <= index < len(self):
+            return self.extra[index - base]
+        raise IndexError("effect index out of range")
+
+    def index(self, effect: str, start: int = 0, stop: int | None = None) -> int:
+        """Return the position of ``effect``, raising ValueError when it is unknown."""
+        position = self.base._index.get(effect)
+        if position is None:
+            position = self._extra_index.get(effect)
+        if position is None or position < start or (stop is not None and position >= stop):
+            raise ValueError(f"{effect!r} is not an effect of this fire")
+        return position
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, EffectList):
+            return self.base is other.base and self.extra == other.extra
+        if isinstance(other, (list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self.base.name, self.extra))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        # Immutable and shared, copies would only cost memory
+        return self
+
+    def __repr__(self) -> str:
+        return f"EffectList({self.base.name!r}, extra={list(self.extra)!r})"
+
+
+def _family(name: str, *effects: str) -> EffectFamily:
+    return EffectFamily(name, effects)
+
+
+GOLD = _family("gold", "Gold")
+ELEMENT4 = _family(
+    "element4", "Gold", "Orbit", "Ignite", "Vero", "Spectrum", "Embers", "Red", "Green", "Blue", "Violet", "White"
+)
+ELECTRAC = _family(
+    "electrac", "Gold", "Ignite", "Vero", "Spectrum", "Embers", "Red", "Green", "Blue", "Violet", "White"
+)
+EUROPEAN_HOME = _family("european_home", "Evoflame", "Party")
+EVONIC = _family(
+    "evonic", "Eos", "Ignite", "Vero", "Breathe", "Spectrum", "Embers", "Odyssey", "Aurora",
+    "Red", "Orange", "Green", "Blue", "Violet", "White",
+)
+EVONIC_DS = _family(
+    "evonic_ds", "Eos", "Ignite", "Vero", "Breathe", "Spectrum", "Embers", "Odyssey", "Aurora",
+    "Red", "Orange", "Yellow", "Green", "Blue", "Violet", "White",
+)
+ALENTE = _family("alente", "Eseries", "Party")
+ILUSION = _family("ilusion", "Ilusion", "Aurora", "Patriot", "Verona", "Charm", "Viva", "Cocktail", "Campfire")
+SF = _family("sf", "Low", "Medium", "High")
+SL = _family("sl", "Ignite", "Fiesta")
+ALISIO = _family(
+    "alisio", "Ilusion", "Aurora", "Patriot", "Verona", "Charm", "Viva", "Cocktail", "Campfire",
+    "Royal", "Scarlett", "Lava", "Magma",
+)
+
+# Model config (``configs`` in /modules.json) -> effect family
+DEFAULT_EFFECTS: Mapping[str, EffectFamily] = MappingProxyType({
+    # Aura
+    "aurac1": GOLD,
+    "aurac1s": GOLD,
+    # Element4 Electra
+    "electra1030": ELEMENT4,
+    "electra1030s": ELEMENT4,
+    "electra1250": ELEMENT4,
+    "electra1250s": ELEMENT4,
+    "electra1350": ELEMENT4,
+    "electra1350s": ELEMENT4,
+    "electra1500": ELEMENT4,
+    "electra1500s": ELEMENT4,
+    "electra1800": ELEMENT4,
+    "electra1800s": ELEMENT4,
+    "electra850s": ELEMENT4,
+    # Element4 Electrac
+    "electrac1": ELECTRAC,
+    "electrac1s": ELECTRAC,
+    "electrac600": ELECTRAC,
+    "electrac600s": ELECTRAC,
+    # European Home
+    "e1030": EUROPEAN_HOME,
+    "e1250": EUROPEAN_HOME,
+    "e1500": EUROPEAN_HOME,
+    "e1800": EUROPEAN_HOME,
+    "e2400": EUROPEAN_HOME,
+    "e500": EUROPEAN_HOME,
+    "e800": EUROPEAN_HOME,
+    # Evonic Generic / 1800
+    "evonicfires": EVONIC,
+    "1800": EVONIC,
+    # Evonic Alente
+    "alente": ALENTE,
+    # Evonic Chin
+    "chin1800": ELEMENT4,
+    "chin1800s": ELEMENT4,
+    # Evonic DH
+    "dh1500": EVONIC,
+    # Evonic DS
+    "ds1030": EVONIC_DS,
+    # Evonic HAL
+    "hal1030": EVONIC,
+    "hal1500": EVONIC,
+    "hal2400": EVONIC,
+    "hal800": EVONIC,
+    "halev4": EVONIC,
+    "halev8": EVONIC,
+    # Evonic Ilusion
+    "ilusion2": ILUSION,
+    # Evonic ROT
+    "rot1250": ELEMENT4,
+    "rot1500": ELEMENT4,
+    # Evonic SF
+    "sf1": SF,
+    "sf1-40": SF,
+    "sf2": SF,
+    "sf3": SF,
+    # Evonic SL
+    "sl1000": SL,
+    "sl1250": SL,
+    "sl1500": SL,
+    "sl600": SL,
+    "sl700": SL,
+    # Evonic V-Series
+    "v1030": EVONIC,
+    "v630": EVONIC,
+    "v730": EVONIC,
+    # Micon Alisio
+    "alisio1150": ALISIO,
+    "alisio1550": ALISIO,
+    "alisio1850": ALISIO,
+    "alisio850": ALISIO,
+})
+
+_VIEWS: weakref.WeakValueDictionary[tuple[str, tuple[str, ...]], EffectList] = weakref.WeakValueDictionary()
+
+
+def effect_list(configs: str | None, device_effects: Iterable[str] = ()) -> EffectList:
+    """Return the effects for a fire, shared with any fire that has the same ones.
+
+    Args:
+        configs: The fire's model config, e.g. ``hal1500``
+        device_effects: Effects reported by the fire's /effect.json
+
+    Returns:
+        The built-in effects for the model followed by any extra effects of the fire.
+    """
+    view = EffectList(DEFAULT_EFFECTS.get(configs, EMPTY), device_effects)
+    key = (view.base.name, view.extra)
+    shared = _VIEWS.get(key)
+    if shared is None:
+        _VIEWS[key] = shared = view
+    return shared
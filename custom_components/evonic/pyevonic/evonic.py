@@ -1,107 +1,70 @@
 """Asynchronous Python client for Evonic Fires."""
 from __future__ import annotations
 
-# Built-in effects per model config, derived from docs/device-features.md.
-# Used as the base effect list; any additional effects returned by /effect.json
-# (e.g. purchased effects) are appended after these.
-DEFAULT_EFFECTS: dict[str, list[str]] = {
-    # Aura
-    "aurac1":       ["Gold"],
-    "aurac1s":      ["Gold"],
-    # Element4 Electra
-    "electra1030":  ["Gold", "Orbit", "Ignite", "Vero", "Spectrum", "Embers", "Red", "Green", "Blue", "Violet", "White"],
-    "electra1030s": ["Gold", "Orbit", "Ignite", "Vero", "Spectrum", "Embers", "Red", "Green", "Blue", "Violet", "White"],
-    "electra1250":  ["Gold", "Orbit", "Ignite", "Vero", "Spectrum", "Embers", "Red", "Green", "Blue", "Violet", "White"],
-    "electra1250s": ["Gold", "Orbit", "Ignite", "Vero", "Spectrum", "Embers", "Red", "Green", "Blue", "Violet", "White"],
-    "electra1350":  ["Gold", "Orbit", "Ignite", "Vero", "Spectrum", "Embers", "Red", "Green", "Blue", "Violet", "White"],
-    "electra1350s": ["Gold", "Orbit", "Ignite", "Vero", "Spectrum", "Embers", "Red", "Green", "Blue", "Violet", "White"],
-    "electra1500":  ["Gold", "Orbit", "Ignite", "Vero", "Spectrum", "Embers", "Red", "Green", "Blue", "Violet", "White"],
-    "electra1500s": ["Gold", "Orbit", "Ignite", "Vero", "Spectrum", "Embers", "Red", "Green", "Blue", "Violet", "White"],
-    "electra1800":  ["Gold", "Orbit", "Ignite", "Vero", "Spectrum", "Embers", "Red", "Green", "Blue", "Violet", "White"],
-    "electra1800s": ["Gold", "Orbit", "Ignite", "Vero", "Spectrum", "Embers", "Red", "Green", "Blue", "Violet", "White"],
-    "electra850s":  ["Gold", "Orbit", "Ignite", "Vero", "Spectrum", "Embers", "Red", "Green", "Blue", "Violet", "White"],
-    # Element4 Electrac
-    "electrac1":    ["Gold", "Ignite", "Vero", "Spectrum", "Embers", "Red", "Green", "Blue", "Violet", "White"],
-    "electrac1s":   ["Gold", "Ignite", "Vero", "Spectrum", "Embers", "Red", "Green", "Blue", "Violet", "White"],
-    "electrac600":  ["Gold", "Ignite", "Vero", "Spectrum", "Embers", "Red", "Green", "Blue", "Violet", "White"],
-    "electrac600s": ["Gold", "Ignite", "Vero", "Spectrum", "Embers", "Red", "Green", "Blue", "Violet", "White"],
-    # European Home
-    "e1030":        ["Evoflame", "Party"],
-    "e1250":        ["Evoflame", "Party"],
-    "e1500":        ["Evoflame", "Party"],
-    "e1800":        ["Evoflame", "Party"],
-    "e2400":        ["Evoflame", "Party"],
-    "e500":         ["Evoflame", "Party"],
-    "e800":         ["Evoflame", "Party"],
-    # Evonic Generic / 1800
-    "evonicfires":  ["Eos", "Ignite", "Vero", "Breathe", "Spectrum", "Embers", "Odyssey", "Aurora", "Red", "Orange", "Green", "Blue", "Violet", "White"],
-    "1800":         ["Eos", "Ignite", "Vero", "Breathe", "Spectrum", "Embers", "Odyssey", "Aurora", "Red", "Orange", "Green", "Blue", "Violet", "White"],
-    # Evonic Alente
-    "alente":       ["Eseries", "Party"],
-    # Evonic Chin
-    "chin1800":     ["Gold", "Orbit", "Ignite", "Vero", "Spectrum", "Embers", "Red", "Green", "Blue", "Violet", "White"],
-    "chin1800s":    ["Gold", "Orbit", "Ignite", "Vero", "Spectrum", "Embers", "Red", "Green", "Blue", "Violet", "White"],
-    # Evonic DH
-    "dh1500":       ["Eos", "Ignite", "Vero", "Breathe", "Spectrum", "Embers", "Odyssey", "Aurora", "Red", "Orange", "Green", "Blue", "Violet", "White"],
-    # Evonic DS
-    "ds1030":       ["Eos", "Ignite", "Vero", "Breathe", "Spectrum", "Embers", "Odyssey", "Aurora", "Red", "Orange", "Yellow", "Green", "Blue", "Violet", "White"],
-    # Evonic HAL
-    "hal1030":      ["Eos", "Ignite", "Vero", "Breathe", "Spectrum", "Embers", "Odyssey", "Aurora", "Red", "Orange", "Green", "Blue", "Violet", "White"],
-    "hal1500":      ["Eos", "Ignite", "Vero", "Breathe", "Spectrum", "Embers", "Odyssey", "Aurora", "Red", "Orange", "Green", "Blue", "Violet", "White"],
-    "hal2400":      ["Eos", "Ignite", "Vero", "Breathe", "Spectrum", "Embers", "Odyssey", "Aurora", "Red", "Orange", "Green", "Blue", "Violet", "White"],
-    "hal800":       ["Eos", "Ignite", "Vero", "Breathe", "Spectrum", "Embers", "Odyssey", "Aurora", "Red", "Orange", "Green", "Blue", "Violet", "White"],
-    "halev4":       ["Eos", "Ignite", "Vero", "Breathe", "Spectrum", "Embers", "Odyssey", "Aurora", "Red", "Orange", "Green", "Blue", "Violet", "White"],
-    "halev8":       ["Eos", "Ignite", "Vero", "Breathe", "Spectrum", "Embers", "Odyssey", "Aurora", "Red", "Orange", "Green", "Blue", "Violet", "White"],
-    # Evonic Ilusion
-    "ilusion2":     ["Ilusion", "Aurora", "Patriot", "Verona", "Charm", "Viva", "Cocktail", "Campfire"],
-    # Evonic ROT
-    "rot1250":      ["Gold", "Orbit", "Ignite", "Vero", "Spectrum", "Embers", "Red", "Green", "Blue", "Violet", "White"],
-    "rot1500":      ["Gold", "Orbit", "Ignite", "Vero", "Spectrum", "Embers", "Red", "Green", "Blue", "Violet", "White"],
-    # Evonic SF
-    "sf1":          ["Low", "Medium", "High"],
-    "sf1-40":       ["Low", "Medium", "High"],
-    "sf2":          ["Low", "Medium", "High"],
-    "sf3":          ["Low", "Medium", "High"],
-    # Evonic SL
-    "sl1000":       ["Ignite", "Fiesta"],
-    "sl1250":       ["Ignite", "Fiesta"],
-    "sl1500":       ["Ignite", "Fiesta"],
-    "sl600":        ["Ignite", "Fiesta"],
-    "sl700":        ["Ignite", "Fiesta"],
-    # Evonic V-Series
-    "v1030":        ["Eos", "Ignite", "Vero", "Breathe", "Spectrum", "Embers", "Odyssey", "Aurora", "Red", "Orange", "Green", "Blue", "Violet", "White"],
-    "v630":         ["Eos", "Ignite", "Vero", "Breathe", "Spectrum", "Embers", "Odyssey", "Aurora", "Red", "Orange", "Green", "Blue", "Violet", "White"],
-    "v730":         ["Eos", "Ignite", "Vero", "Breathe", "Spectrum", "Embers", "Odyssey", "Aurora", "Red", "Orange", "Green", "Blue", "Violet", "White"],
-    # Micon Alisio
-    "alisio1150":   ["Ilusion", "Aurora", "Patriot", "Verona", "Charm", "Viva", "Cocktail", "Campfire", "Royal", "Scarlett", "Lava", "Magma"],
-    "alisio1550":   ["Ilusion", "Aurora", "Patriot", "Verona", "Charm", "Viva", "Cocktail", "Campfire", "Royal", "Scarlett", "Lava", "Magma"],
-    "alisio1850":   ["Ilusion", "Aurora", "Patriot", "Verona", "Charm", "Viva", "Cocktail", "Campfire", "Royal", "Scarlett", "Lava", "Magma"],
-    "alisio850":    ["Ilusion", "Aurora", "Patriot", "Verona", "Charm", "Viva", "Cocktail", "Campfire", "Royal", "Scarlett", "Lava", "Magma"],
-}
-
 import asyncio
+import contextvars
+import hashlib
 import json
 import socket
 import logging
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import timedelta
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
 from urllib.parse import urlparse, parse_qs
 
 import aiohttp
 import async_timeout
-
-from .models import Device
+from aiohttp import hdrs
+
+from .breaker import CircuitBreaker
+from .capabilities import HTTP, KEEP_ALIVE, WEBSOCKET, CapabilityMap
+from .coalescer import CommandCoalescer
+from .deadline import Deadline, current_deadline, deadline
+from .effects import effect_list
+from .metrics import PollHistory, PollRecord, RequestMetrics
+from .models import DISPATCH, Device
+from .refresh import ADMIN, EFFECTS, LIVE, MODULES, OPTIONS, SETUP, TIMERS, RefreshPlanner
+from .response import EvonicResponse
+from .scheduler import RequestPriority, RequestScheduler, get_scheduler
+from .singleflight import SingleFlight, SingleFlightStats
+from .timers import Schedule, TimerDiff, TimerTable
 
 from .exceptions import (
     EvonicError,
+    EvonicCircuitOpenError,
     EvonicConnectionError,
     EvonicConnectionClosed,
+    EvonicResponseError,
     EvonicUnsupportedFeature,
     EvonicConnectionTimeoutError
 )
 
+if TYPE_CHECKING:
+    from .push import EvonicPush
+
 LOGGER = logging.getLogger(__name__)
 
+# Endpoints the WebSocket can carry when HTTP fails
+WS_COMMANDS = ("/voice", "/cmd")
+
+# Single-flight keys
+DEVICE_FETCH = "device"
+CONFIG_FETCH = "config"
+
+# Filesystem write and timer reload, for saving timer schedules
+EDIT = "/edit"
+SETTIMER = "/settimer"
+
+# Seconds a resolved hostname is cached by the client's own connector
+DNS_CACHE_TTL = 300
+
+# Configuration no entity is created from, loaded after the first poll when deferred
+DEFERRED_CONFIG = (ADMIN, SETUP, EFFECTS)
+
 
 @dataclass
 class Evonic:
@@ -109,28 +72,200 @@ class Evonic:
 
     host: str
     request_timeout: float = 8.0
+    connect_timeout: float = 3.0
+    read_timeout: float = 5.0
+    poll_timeout: float = 25.0
+    device_max_age: float = 1.0
+    keepalive_timeout: float = 10.0
+    defer_config: bool = False
     session: aiohttp.client.ClientSession | None = None
+    max_in_flight: int = 1
+    ws_port: int = 81
+    command_window: float = 0.3
+    setup_refresh_interval: timedelta = timedelta(minutes=10)
+    effects_refresh_interval: timedelta = timedelta(hours=1)
+    timers_refresh_interval: timedelta = timedelta(minutes=15)
+    capability_ttl: timedelta = timedelta(days=1)
+    poll_history_size: int = 20
 
     _close_session: bool = False
+    # Whether the connector of the client's own session pools connections, None without one
+    _session_keep_alive: bool | None = field(default=None, init=False, repr=False)
     _device: Device | None = None
-    _effects_last_fetched: datetime | None = field(default=None, init=False)
+    _scheduler: RequestScheduler = field(init=False, repr=False)
+    _planner: RefreshPlanner = field(init=False, repr=False)
+    _background: dict[str, asyncio.Task] = field(default_factory=dict, init=False, repr=False)
+    _push: EvonicPush | None = field(default=None, init=False, repr=False)
+    _listeners: list[Callable[[], None]] = field(default_factory=list, init=False, repr=False)
+    _refresh_listeners: list[Callable[[], None]] = field(default_factory=list, init=False, repr=False)
+    _changes: set[str] = field(default_factory=set, init=False, repr=False)
+    _payloads: dict[str, dict] = field(default_factory=dict, init=False, repr=False)
+    _coalescer: CommandCoalescer = field(init=False, repr=False)
+    _http_breaker: CircuitBreaker = field(init=False, repr=False)
+    _ws_breaker: CircuitBreaker = field(init=False, repr=False)
+    _capabilities: CapabilityMap = field(init=False, repr=False)
+    _metrics: RequestMetrics = field(init=False, repr=False)
+    _history: PollHistory = field(init=False, repr=False)
+    _timers: TimerTable | None = field(default=None, init=False, repr=False)
+    _timer_lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False, repr=False)
+    _phase_timeout: aiohttp.ClientTimeout = field(init=False, repr=False)
+    _flights: SingleFlight = field(default_factory=SingleFlight, init=False, repr=False)
+    # Digest of the last body applied from each endpoint, and the device generation after applying it
+    _digests: dict[str, tuple[bytes, int]] = field(default_factory=dict, init=False, repr=False)
+    _generation: int = field(default=0, init=False, repr=False)
+
+    def __post_init__(self):
+        self._scheduler = get_scheduler(self.host, self.max_in_flight)
+        self._coalescer = CommandCoalescer(self.command_window)
+        self._http_breaker = CircuitBreaker("http")
+        self._ws_breaker = CircuitBreaker("websocket")
+        self._capabilities = CapabilityMap(self.capability_ttl)
+        self._metrics = RequestMetrics()
+        self._history = PollHistory(self.poll_history_size)
+        # Give up on a dead host or a stalled response long before the request timeout
+        self._phase_timeout = aiohttp.ClientTimeout(
+            total=None, sock_connect=self.connect_timeout, sock_read=self.read_timeout
+        )
+        self._planner = RefreshPlanner({
+            LIVE: timedelta(0),
+            SETUP: self.setup_refresh_interval,
+            EFFECTS: self.effects_refresh_interval,
+            TIMERS: self.timers_refresh_interval,
+            MODULES: None,
+            OPTIONS: None,
+            ADMIN: None,
+        })
+
+    @property
+    def scheduler(self) -> RequestScheduler:
+        """The request scheduler shared by all clients of this host."""
+        return self._scheduler
+
+    @property
+    def transport_health(self) -> dict:
+        """Circuit breaker state for each transport."""
+        return {
+            "http": self._http_breaker.as_dict(),
+            "websocket": self._ws_breaker.as_dict(),
+        }
+
+    @property
+    def capabilities(self) -> CapabilityMap:
+        """Endpoints and transports this fire's firmware is known to answer."""
+        return self._capabilities
+
+    @property
+    def metrics(self) -> RequestMetrics:
+        """Latency, timeout, fallback and error metrics of requests to the fire."""
+        return self._metrics
+
+    @property
+    def timers(self) -> TimerTable | None:
+        """The fire's timer schedules, None until ``get_timers`` has been called."""
+        return self._timers
+
+    @property
+    def single_flight(self) -> SingleFlightStats:
+        """How many get_device and get_config calls shared a fetch instead of making their own."""
+        return self._flights.stats
+
+    @property
+    def history(self) -> PollHistory:
+        """Timings and errors of the most recent polls."""
+        return self._history
+
+    @property
+    def payloads(self) -> dict[str, dict]:
+        """The last raw payload received from each endpoint, keyed by URI."""
+        return dict(self._payloads)
+
+    @property
+    def ws_url(self) -> str:
+        """URL of the fire's WebSocket server."""
+        return f"ws://{urlparse(f'//{self.host}').hostname}:{self.ws_port}"
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self.session is None:
+            LOGGER.debug("No session exists, creating one for %s", self.host)
+            self.session = self._create_session()
+            self._close_session = True
+        return self.session
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Create a session with a connector of its own, set up for how this fire handles connections.
 
-    async def http_request(self, uri, method, data, host=None, scheme=None):
+        Fires known to close every connection get a connector that never
+        pools. Others, including fires not probed yet, keep a connection idle
+        for ``keepalive_timeout`` so the next request can reuse it. The
+        connector is traced to count new and reused connections, which is
+        also how keep-alive support is learned.
+        """
+        keep_alive = self._capabilities.supports(KEEP_ALIVE) is not False
+        if keep_alive:
+            connector = aiohttp.TCPConnector(
+                limit_per_host=self.max_in_flight,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=DNS_CACHE_TTL,
+            )
+        else:
+            connector = aiohttp.TCPConnector(
+                limit_per_host=self.max_in_flight,
+                force_close=True,
+                ttl_dns_cache=DNS_CACHE_TTL,
+            )
+
+        trace = aiohttp.TraceConfig()
+        trace.on_connection_create_end.append(self._on_connection_created)
+        trace.on_connection_reuseconn.append(self._on_connection_reused)
+        self._session_keep_alive = keep_alive
+        return aiohttp.ClientSession(connector=connector, trace_configs=[trace])
+
+    async def _on_connection_created(self, _session, context, _params) -> None:
+        # WebSocket connections carry no request context and are not counted
+        if context.trace_request_ctx is not None:
+            self._metrics.record_connection(reused=False)
+
+    async def _on_connection_reused(self, _session, context, _params) -> None:
+        if context.trace_request_ctx is not None:
+            context.trace_request_ctx.reused = True
+            self._metrics.record_connection(reused=True)
+
+    async def http_request(self, uri, method, data, host=None, scheme=None, priority=RequestPriority.POLL):
         """ Sends a http request to the Evonic Fire
 
+        Waits for a slot on the host's request scheduler, then reads the full
+        body and releases the connection, whether the read succeeds or not, so
+        it is free for the next request. A poll sent on a pooled connection
+        the fire has since closed is sent once more on a new one. Fails
+        straight away while the HTTP circuit breaker is open. Inside a
+        ``deadline`` both the wait and the request draw from its budget.
+
         Args:
             uri: The URI endpoint to send request to
             method: HTTP Method
-            data: Request Content
+            data: Request Content, sent as JSON unless it is form data
             host:? Domain to call
             scheme:? http vs https
+            priority:? Queue priority, commands are sent ahead of polls
 
         Raises:
             EvonicError:  Received an unexpected response from the Evonic Fire
             EvonicConnectionTimeoutError: A timeout occurred while communicating with the Evonic Fire
             EvonicConnectionError:  A error occurred while communicating with the Evonic Fire
+            EvonicCircuitOpenError: HTTP has been failing and is not being retried yet
+
+        Returns:
+            The EvonicResponse, its body already read.
         """
 
+        budget = current_deadline()
+        if budget is not None and budget.expired:
+            raise EvonicConnectionTimeoutError(f"No time left to request {uri} from Evonic device at {self.host}")
+
+        breaker = self._http_breaker if host is None else None
+        if breaker is not None and not breaker.allow():
+            raise EvonicCircuitOpenError(f"HTTP to Evonic device at {self.host} is failing, not retrying yet")
+
         if host is None:
             host = self.host
 
@@ -138,51 +273,105 @@ class Evonic:
             scheme = "http"
 
         url = f"http://{host}{uri}"
-
-        if self.session is None:
-            LOGGER.debug("No session exists, using ClientSession")
-            self.session = aiohttp.ClientSession()
-            self._close_session = True
+        path = uri.partition("?")[0]
+        metrics = self._metrics if breaker is not None else None
+        session = self._get_session()
 
         LOGGER.debug("Sending HTTP %s request to %s", method, url)
 
         try:
-            async with async_timeout.timeout(self.request_timeout):
-                response = await self.session.request(method, url, json=data)
+            async with self._scheduler.slot(priority):
+                started = time.monotonic()
+                async with async_timeout.timeout(self._timeout(budget)):
+                    # Commands are never sent twice, a toggle the fire did see would be undone
+                    response, keep_alive = await self._send(
+                        session, method, url, data, started, retry=priority != RequestPriority.COMMAND
+                    )
+
+            if breaker is not None:
+                breaker.record_success()
+                self._capabilities.record(HTTP, True)
+                if keep_alive is not None and keep_alive != self._capabilities.supports(KEEP_ALIVE):
+                    LOGGER.debug("%s %s HTTP keep-alive", self.host, "supports" if keep_alive else "does not support")
+                    self._capabilities.record(KEEP_ALIVE, keep_alive)
+                metrics.record(HTTP, path, response.elapsed, response.size)
 
             if (response.status // 100) in [4, 5]:
-                contents = await response.read()
-                response.close()
-                content_type = response.headers.get("Content-Type", "")
+                if metrics is not None:
+                    metrics.record_error(HTTP, path, f"HTTP {response.status}")
 
-                if content_type == "application/json":
-                    raise EvonicError(json.loads(contents.decode("utf8")))
-                raise EvonicError(response.status, {"message": contents.decode("utf8")})
+                if response.content_type == "application/json":
+                    raise EvonicResponseError(response.json(), status=response.status)
+                raise EvonicResponseError(response.status, {"message": response.text()}, status=response.status)
 
             LOGGER.debug("HTTP request to %s completed with status %s", url, response.status)
             return response
 
         except asyncio.TimeoutError as exception:
             LOGGER.error("Timeout communicating with Evonic device at %s (url=%s)", self.host, url)
+            if breaker is not None:
+                breaker.record_failure("timeout")
+                metrics.record_error(HTTP, path, "timeout", timeout=True)
             raise EvonicConnectionTimeoutError(
                 f"Timeout occurred while connecting to Evonic device at {self.host}") from exception
         except (aiohttp.ClientError, socket.gaierror) as exception:
             LOGGER.error("Error communicating with Evonic device at %s (url=%s): %s", self.host, url, exception)
+            if breaker is not None:
+                breaker.record_failure(exception)
+                metrics.record_error(HTTP, path, repr(exception))
             raise EvonicConnectionError(
                 f"Error occurred while communicating with Evonic device at {self.host}") from exception
 
-    async def ws_request(self, uri):
+    async def _send(self, session, method, url, data, started, retry=False):
+        """Send one request and read its response in full.
+
+        Args:
+            retry: Send the request again on a new connection if the fire
+                closed the pooled one it was sent on
+
+        Returns:
+            The response, and whether the fire kept the connection open: True
+            once a pooled connection served a request, False when the fire
+            said it would close it, None when that is not known yet.
+        """
+        trace = SimpleNamespace(reused=False)
+        form = isinstance(data, (aiohttp.FormData, aiohttp.MultipartWriter))
+        payload = {"data": data} if form else {"json": data}
+        try:
+            async with session.request(
+                method, url, timeout=self._phase_timeout, trace_request_ctx=trace, **payload
+            ) as raw:
+                response = EvonicResponse(
+                    status=raw.status,
+                    body=await raw.read(),
+                    elapsed=time.monotonic() - started,
+                    content_type=raw.content_type,
+                )
+        except aiohttp.ServerDisconnectedError:
+            if not (retry and trace.reused):
+                raise
+            LOGGER.debug("%s closed a pooled connection, sending %s on a new one", self.host, url)
+            return await self._send(session, method, url, data, started)
+
+        if raw.version < aiohttp.HttpVersion11 or "close" in raw.headers.get(hdrs.CONNECTION, "").lower():
+            return response, False
+        return response, True if trace.reused else None
+
+    async def ws_request(self, uri, priority=RequestPriority.POLL):
         """Send a command to the Evonic Fire via WebSocket.
 
-        Opens a connection, sends the command, then closes immediately.
+        Uses the push connection when one is open, otherwise opens a
+        connection, sends the command, then closes immediately.
         Only supports /voice and /cmd endpoints.
 
         Args:
             uri: The URI endpoint (e.g. /voice?command=Fire_ON)
+            priority:? Queue priority, commands are sent ahead of polls
 
         Raises:
             EvonicConnectionError: Unable to communicate via WebSocket
             EvonicConnectionTimeoutError: A timeout occurred while communicating
+            EvonicCircuitOpenError: The WebSocket has been failing and is not being retried yet
         """
         parsed = urlparse(uri)
         command_type = parsed.path.lstrip("/")  # "voice" or "cmd"
@@ -192,62 +381,183 @@ class Evonic:
         if command_value is None:
             raise EvonicConnectionError(f"Cannot convert URI to WebSocket command: {uri}")
 
-        message = json.dumps({command_type: command_value})
-        ws_url = f"ws://{self.host}:81"
+        budget = current_deadline()
+        if budget is not None and budget.expired:
+            raise EvonicConnectionTimeoutError(f"No time left to send {uri} to Evonic device at {self.host}")
 
-        if self.session is None:
-            LOGGER.debug("No session exists, using ClientSession")
-            self.session = aiohttp.ClientSession()
-            self._close_session = True
+        path = parsed.path
+        if self._push is not None and self._push.connected:
+            started = time.monotonic()
+            try:
+                await self._push.send({command_type: command_value})
+            except (EvonicConnectionClosed, ConnectionResetError, aiohttp.ClientError) as exception:
+                # The push socket dropped under us, send over a connection of our own instead
+                LOGGER.debug("Push connection to %s failed, sending %s directly: %r", self.host, uri, exception)
+                self._ws_breaker.record_failure(exception)
+                # Counted like a timeout, one dropped socket says nothing about the firmware
+                self._capabilities.record_timeout(WEBSOCKET)
+                self._metrics.record_error(WEBSOCKET, path, repr(exception))
+            else:
+                self._ws_breaker.record_success()
+                self._capabilities.record(WEBSOCKET, True)
+                self._metrics.record(WEBSOCKET, path, time.monotonic() - started)
+                return
+
+        if not self._ws_breaker.allow():
+            raise EvonicCircuitOpenError(f"WebSocket to Evonic device at {self.host} is failing, not retrying yet")
+
+        message = json.dumps({command_type: command_value})
+        ws_url = self.ws_url
+        session = self._get_session()
 
         LOGGER.debug("Connecting to WebSocket at %s, sending: %s", ws_url, message)
 
         try:
-            async with async_timeout.timeout(self.request_timeout):
-                async with self.session.ws_connect(ws_url, protocols=["arduino"]) as ws:
-                    await ws.send_str(message)
-                    LOGGER.debug("WebSocket message sent to %s, closing connection", ws_url)
+            async with self._scheduler.slot(priority):
+                started = time.monotonic()
+                async with async_timeout.timeout(self._timeout(budget)):
+                    async with session.ws_connect(ws_url, protocols=["arduino"]) as ws:
+                        await ws.send_str(message)
+                        LOGGER.debug("WebSocket message sent to %s, closing connection", ws_url)
+            self._ws_breaker.record_success()
+            self._capabilities.record(WEBSOCKET, True)
+            self._metrics.record(WEBSOCKET, path, time.monotonic() - started)
         except asyncio.TimeoutError as exception:
             LOGGER.error("Timeout connecting to Evonic device at %s via WebSocket", self.host)
+            self._ws_breaker.record_failure("timeout")
+            self._metrics.record_error(WEBSOCKET, path, "timeout", timeout=True)
             raise EvonicConnectionTimeoutError(
                 f"Timeout occurred while connecting to Evonic device at {self.host} via WebSocket") from exception
         except (aiohttp.ClientError, socket.gaierror) as exception:
             LOGGER.error("Error communicating with Evonic device at %s via WebSocket: %s", self.host, exception)
+            self._ws_breaker.record_failure(exception)
+            self._metrics.record_error(WEBSOCKET, path, repr(exception))
+            if isinstance(exception, aiohttp.WSServerHandshakeError):
+                # The fire answered but refused the upgrade, this firmware has no WebSocket
+                self._capabilities.record(WEBSOCKET, False)
             raise EvonicConnectionError(
                 f"Error occurred while communicating with Evonic device at {self.host} via WebSocket") from exception
 
-    async def request(self, uri, method, data, host=None, scheme=None):
+    def _timeout(self, budget: Deadline | None) -> float:
+        """Seconds one request may take, within the deadline of the operation it is part of."""
+        return self.request_timeout if budget is None else budget.timeout(self.request_timeout)
+
+    async def request(self, uri, method, data, host=None, scheme=None, priority=RequestPriority.POLL):
         """Send a request to the Evonic Fire, falling back to WebSocket if HTTP fails.
 
+        While the HTTP circuit breaker is open the request goes straight to the
+        WebSocket instead of waiting for HTTP to time out first. Only commands
+        fall back, and only when the firmware is not known to lack a WebSocket.
+
         Args:
             uri: The URI endpoint
             method: HTTP Method
             data: Request Content
             host: Domain to call (WebSocket fallback only used for local device requests)
             scheme: http vs https
+            priority: Queue priority, commands are sent ahead of polls
 
         Returns:
-            HTTP response if HTTP succeeded, None if WebSocket fallback was used.
+            The EvonicResponse, with transport ``websocket`` and no body if the
+            WebSocket fallback was used.
 
         Raises:
             EvonicConnectionError: Both HTTP and WebSocket requests failed
         """
         try:
-            return await self.http_request(uri, method, data, host, scheme)
+            return await self.http_request(uri, method, data, host, scheme, priority)
         except (EvonicConnectionError, EvonicConnectionTimeoutError) as err:
-            if host is not None:
+            budget = current_deadline()
+            if (
+                host is not None
+                or urlparse(uri).path not in WS_COMMANDS
+                or self._capabilities.supports(WEBSOCKET) is False
+                or (budget is not None and budget.expired)
+            ):
                 raise
 
-            LOGGER.warning("HTTP request to %s failed, falling back to WebSocket: %s", uri, err)
+            if isinstance(err, EvonicCircuitOpenError):
+                LOGGER.debug("HTTP circuit is open, sending %s via WebSocket", uri)
+            else:
+                LOGGER.warning("HTTP request to %s failed, falling back to WebSocket: %s", uri, err)
+            self._metrics.record_fallback(uri.partition("?")[0])
             try:
-                await self.ws_request(uri)
+                started = time.monotonic()
+                await self.ws_request(uri, priority)
                 LOGGER.debug("WebSocket fallback succeeded for %s", uri)
-                return None
+                return EvonicResponse(status=0, transport=WEBSOCKET, elapsed=time.monotonic() - started)
             except (EvonicConnectionError, EvonicConnectionTimeoutError) as ws_err:
                 LOGGER.error(
                     "WebSocket fallback also failed for %s: %s", uri, ws_err)
                 raise
 
+    def add_listener(self, update_callback):
+        """Register a callback for state changes applied by commands.
+
+        Commands apply their known effect to the cached device before they are
+        sent, so listeners can show the new state straight away.
+
+        Returns:
+            A function that removes the listener.
+        """
+        self._listeners.append(update_callback)
+        return lambda: self._listeners.remove(update_callback)
+
+    def add_refresh_listener(self, update_callback):
+        """Register a callback for changes applied by refreshes running in the background.
+
+        Configuration deferred by ``defer_config`` arrives this way, so
+        listeners can show it without waiting for the next poll.
+
+        Returns:
+            A function that removes the listener.
+        """
+        self._refresh_listeners.append(update_callback)
+        return lambda: self._refresh_listeners.remove(update_callback)
+
+    def pop_changes(self) -> set[str]:
+        """Return the device fields changed since the last call and forget them.
+
+        Fields are named ``section.field``, e.g. ``climate.target_temp``.
+        """
+        changes, self._changes = self._changes, set()
+        return changes
+
+    def _update_device(self, data):
+        """Apply a payload to the cached device, recording which fields changed."""
+        if self._device.update_from_dict(data, self._changes):
+            self._generation += 1
+
+    def _apply_state(self, state):
+        """Apply a command's expected state to the cached device and notify listeners."""
+        if self._device is None:
+            return
+
+        self._update_device(state)
+        # The next get_device must confirm the command, not reuse an earlier poll
+        self._flights.forget(DEVICE_FETCH)
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    @contextmanager
+    def _optimistic(self, state) -> Iterator[None]:
+        """Apply a command's expected state while it is sent, rolling it back if sending fails."""
+        if self._device is None:
+            yield
+            return
+
+        previous = self._device.wire_values(state)
+        self._apply_state(state)
+        try:
+            yield
+        except BaseException:
+            # Leave fields something else has updated since, e.g. a poll that saw the real state
+            current = self._device.wire_values(state)
+            restore = {key: value for key, value in previous.items() if current.get(key) == state[key]}
+            if restore:
+                self._apply_state(restore)
+            raise
+
     async def power(self, cmd):
         """ Controls the main lighting for the Evonic Fire.
 
@@ -263,13 +573,17 @@ class Evonic:
 
         if cmd == "off":
             voice_command = "Fire_OFF"
+            state = {"Fire": 0}
         elif cmd == "on":
             voice_command = "Fire_ON"
+            state = {"Fire": 1}
         else:
             voice_command = "Fire_ON/OFF"
+            state = {"Fire": 0 if self._device and self._device.info.on else 1}
 
         LOGGER.debug("Sending fire power command: %s", voice_command)
-        return await self.request(f"/voice?command={voice_command}", "GET", None)
+        with self._optimistic(state):
+            return await self.request(f"/voice?command={voice_command}", "GET", None, priority=RequestPriority.COMMAND)
 
     async def set_effect(self, effect):
         """ Set an effect on Evonic Fire.
@@ -280,14 +594,17 @@ class Evonic:
         Raises:
             EvonicUnsupportedFeature: Not a valid effect for this device
         """
+        # Purchased effects only arrive with the effect list, which defer_config loads late
+        await self._wait_for_payload(EFFECTS)
         # Check effect is available for this device
-        if effect not in self._device.effects.available_effects:
+        available_effects = self._device.effects.available_effects
+        if not available_effects or effect not in available_effects:
             raise EvonicUnsupportedFeature("Not a valid effect for this device")
 
         LOGGER.debug("Setting effect: %s", effect)
-        await self.request(f"/voice?command={effect}", "GET", None)
-        self._device.light.effect = effect
-        return await self.get_device()
+        with self._optimistic({"effect": effect}):
+            await self.request(f"/voice?command={effect}", "GET", None, priority=RequestPriority.COMMAND)
+        return self._device
 
     async def toggle_feature_light(self):
         """ Toggles the feature light of an Evonic Fire
@@ -300,11 +617,17 @@ class Evonic:
             raise EvonicUnsupportedFeature("Feature Light is not supported on this device")
 
         LOGGER.debug("Toggling feature light")
-        return await self.request(f"/voice?command=Featurelight_NOT", "GET", None)
+        with self._optimistic({"pinout3": 0 if self._device.light.feature_light else 1}):
+            return await self.request(
+                f"/voice?command=Featurelight_NOT", "GET", None, priority=RequestPriority.COMMAND
+            )
 
     async def set_temperature(self, temp):
         """ Sets the heater temperature on an Evonic Fire
 
+        Setpoints sent within ``command_window`` seconds of each other are
+        coalesced, only the last one is sent to the fire.
+
         Raises:
             EvonicUnsupportedFeature: Temperature Control is not supported on this device
         """
@@ -315,6 +638,8 @@ class Evonic:
         if not isinstance(temp, int):
             raise EvonicError("temp must be an Integer")
 
+        # The temperature unit is part of setup, which defer_config loads late
+        await self._wait_for_payload(SETUP)
         if self._device.climate.fahrenheit:
             LOGGER.debug("Temperature is set to Fahrenheit")
             # Must be 50 - 90
@@ -328,7 +653,14 @@ class Evonic:
                 raise EvonicError(f"{temp} is not a valid value. Must be between 11 - 32")
 
         LOGGER.debug("Setting temperature to %s", temp)
-        return await self.request(f"/cmd?command=templevel {temp}", "GET", None)
+        with self._optimistic({"templevel": temp}):
+            return await self._coalescer.submit(
+                "templevel",
+                temp,
+                lambda value: self.request(
+                    f"/cmd?command=templevel {value}", "GET", None, priority=RequestPriority.COMMAND
+                ),
+            )
 
     async def heater_power(self, cmd):
         """ Controls the Heater for the Evonic Fire.
@@ -345,105 +677,488 @@ class Evonic:
 
         if cmd == "off":
             voice_command = "Heater_OFF"
+            state = {"Heater": 0}
         elif cmd == "on":
             voice_command = "Heater_ON"
+            state = {"Heater": 1}
         else:
             voice_command = "Heater_NOT"
+            state = {"Heater": 0 if self._device and self._device.climate.heating else 1}
 
         LOGGER.debug("Sending heater power command: %s", voice_command)
-        return await self.request(f"/voice?command={voice_command}", "GET", None)
+        with self._optimistic(state):
+            return await self.request(f"/voice?command={voice_command}", "GET", None, priority=RequestPriority.COMMAND)
 
     async def get_device(self):
         """Get the device information.
 
+        Live state is fetched on every call. Setup and the effect list are
+        fetched inline the first time, then refreshed in the background
+        whenever their interval is due so they never hold up a poll. With
+        ``defer_config`` the first poll only waits for modules, options and
+        live state, and admin, setup and the effect list load in the
+        background straight after. The whole poll shares a deadline of
+        ``poll_timeout``, or the caller's if shorter.
+
+        Concurrent callers share one poll, and a poll that finished less than
+        ``device_max_age`` seconds ago is reused, unless a command was sent since.
+
         Raises:
             EvonicConnectionError:  Unable to connect to device
+            EvonicConnectionTimeoutError: The poll ran out of time
         """
 
+        return await self._flights.run(DEVICE_FETCH, self._poll, max_age=self.device_max_age)
+
+    async def _poll(self):
+        async with deadline(self.poll_timeout):
+            return await self._get_device()
+
+    async def _get_device(self):
         if self._device is None:
             await self.get_config()
 
         LOGGER.debug("Fetching device state from %s", self.host)
+        started = time.time()
+        http = self._metrics.transports[HTTP]
+        requests = http.requests + http.errors
+        bytes_read = http.bytes_read
+        error = None
         try:
-            response = await self.http_request("/config.live.json", "GET", None)
-            self._device.update_from_dict(data=await response.json(content_type=None))
-
-            setup_response = await self.http_request("/config.setup.json", "GET", None)
-            setup_data = await setup_response.json(content_type=None)
-            setup_data.pop("effect", None)
-            self._device.update_from_dict(data=setup_data)
-
+            await self._refresh_live()
+            if not self.defer_config:
+                if not self._planner.fetched(SETUP):
+                    await self._refresh_setup()
+                if not self._planner.fetched(EFFECTS):
+                    await self.__available_effects()
         except EvonicError as err:
+            error = str(err)
             raise EvonicConnectionError("Unable to connect to device") from err
-
-        effects_stale = (
-            self._effects_last_fetched is None or
-            datetime.now() - self._effects_last_fetched > timedelta(hours=1)
-        )
-        if effects_stale:
-            await self.__available_effects()
+        except asyncio.CancelledError:
+            error = "cancelled"
+            raise
+        finally:
+            self._history.record(PollRecord(
+                started=started,
+                elapsed=time.time() - started,
+                requests=http.requests + http.errors - requests,
+                bytes_read=http.bytes_read - bytes_read,
+                error=error,
+            ))
+
+        for uri in DEFERRED_CONFIG:
+            if self._planner.due(uri):
+                self._refresh_in_background(uri)
+        # Timers are only kept up to date once something has asked for them
+        if self._timers is not None and self._planner.due(TIMERS):
+            self._refresh_in_background(TIMERS)
+        if self._capabilities.expired:
+            self._refresh_in_background(MODULES)
 
         return self._device
 
     async def get_config(self):
         """Get the initial device configuration.
 
+        Concurrent callers share one fetch, so none of them sees a device
+        whose configuration is only partly loaded.
+
         Raises:
             EvonicConnectionError:  Unable to connect to device
         """
 
+        if self._device is not None and not self._flights.running(CONFIG_FETCH):
+            return self._device
+        return await self._flights.run(CONFIG_FETCH, self._get_config)
+
+    async def _get_config(self):
         if self._device is None:
             LOGGER.debug("Fetching initial device configuration from %s", self.host)
             try:
-                response = await self.http_request("/modules.json", "GET", None)
-                response_data = await response.json(content_type=None)
-                self._device = Device(response_data)
+                await self._refresh_modules()
+                await self._refresh_options()
+                if not self.defer_config:
+                    await self._refresh_admin()
+
+            except EvonicError as err:
+                raise EvonicConnectionError("Unable to connect to device") from err
 
-                opt_response = await self.http_request("/config.options.json", "GET", None)
-                self._device.update_from_dict(data=await opt_response.json(content_type=None))
+            if not self.defer_config:
+                # Learn whether this firmware serves the effect list
+                await self.__available_effects(priority=RequestPriority.POLL)
 
-                admin_response = await self.http_request("/config.admin.json", "GET", None)
+        return self._device
 
-                admin_response_data = await admin_response.json(content_type=None, encoding="latin-1")
-                admin_response_data.pop('AT+RFID', None)
-                self._device.update_from_dict(data=admin_response_data)
+    async def wait_for_config(self):
+        """Wait until configuration loading in the background, e.g. deferred by ``defer_config``, has finished."""
+        tasks = [self._background[uri] for uri in DEFERRED_CONFIG if uri in self._background]
+        if tasks:
+            await asyncio.wait(tasks)
 
-            except EvonicError as err:
-                raise EvonicConnectionError("Unable to connect to device") from err
+    async def _wait_for_payload(self, uri):
+        """Wait for ``uri`` to load in the background, or fetch it now if nothing has yet."""
+        task = self._background.get(uri)
+        if task is not None:
+            await asyncio.wait((task,))
+        if not self._planner.fetched(uri):
+            await self._refresher(uri)(priority=RequestPriority.COMMAND)
 
+    async def refresh_payloads(self, priority=RequestPriority.BACKGROUND):
+        """Fetch every configuration and state endpoint again, one after another.
+
+        Requests queue on the host's scheduler like any other, so this never
+        adds to the load a poll already puts on the fire.
+
+        Returns:
+            The error of each endpoint that could not be fetched, keyed by URI.
+        """
+        errors = {}
+        for uri in (MODULES, ADMIN, LIVE, OPTIONS, SETUP):
+            try:
+                await self._refresher(uri)(priority=priority)
+            except (EvonicError, ValueError) as err:
+                errors[uri] = str(err)
+        return errors
+
+    def export_config(self, include_live=False):
+        """Return the static configuration of the fire, for restoring on the next start.
+
+        Holds the modules, options, admin, setup and effects payloads, cut down
+        to the fields the models read so no credentials are included.
+
+        Args:
+            include_live: Add the live state too, for a snapshot restored
+                moments later rather than on the next start
+
+        Returns:
+            A JSON serialisable snapshot, or None before the configuration has been fetched.
+        """
+        if self._device is None or MODULES not in self._payloads:
+            return None
+
+        payloads = {
+            uri: {key: value for key, value in self._payloads[uri].items() if key in DISPATCH}
+            for uri in (MODULES, OPTIONS, ADMIN, SETUP, *((LIVE,) if include_live else ()))
+            if uri in self._payloads
+        }
+        if EFFECTS in self._payloads:
+            payloads[EFFECTS] = self._payloads[EFFECTS]
+
+        return {
+            "mac": self._device.network.mac,
+            "buildData": self._device.info.buildData,
+            "payloads": payloads,
+            "capabilities": self._capabilities.as_dict(),
+        }
+
+    def restore_config(self, snapshot, fresh=False):
+        """Build the device from a snapshot made by ``export_config`` instead of fetching it.
+
+        Restored endpoints are treated as stale, so setup and the effect list
+        are refreshed in the background after the next poll. Call
+        ``revalidate_config`` to check the rest against the fire.
+
+        Args:
+            snapshot: The snapshot to restore
+            fresh: The snapshot was exported moments ago, e.g. by a config
+                flow that just validated the fire, so its endpoints count as
+                just fetched and nothing needs checking again
+
+        Returns:
+            The restored Device.
+        """
+        mark = self._planner.mark if fresh else self._planner.mark_stale
+        payloads = snapshot["payloads"]
+        self._capabilities.restore(snapshot.get("capabilities", {}))
+        self._generation += 1
+        self._device = Device(payloads[MODULES])
+        self._payloads[MODULES] = payloads[MODULES]
+        mark(MODULES)
+        for uri in (OPTIONS, ADMIN, SETUP, LIVE):
+            if uri in payloads:
+                self._payloads[uri] = payloads[uri]
+                self._device.update_from_dict(payloads[uri])
+                mark(uri)
+        if EFFECTS in payloads:
+            self._apply_effects(payloads[EFFECTS].get("effect") or [])
+            mark(EFFECTS)
+
+        LOGGER.debug("Restored configuration of %s from %s", self.host, "a fresh snapshot" if fresh else "cache")
+        self._changes.clear()
         return self._device
 
-    async def __available_effects(self):
-        """ Returns a list of available effects for the device.
+    async def revalidate_config(self, priority=RequestPriority.BACKGROUND):
+        """Refetch the static configuration and check whether the firmware changed.
+
+        When buildData differs from what was known, setup and the effect list
+        are refetched on the next poll and the capability map starts over.
+
+        Returns:
+            True when the firmware build changed.
+
+        Raises:
+            EvonicConnectionError:  Unable to connect to device
+        """
+        build = self._device.info.buildData if self._device is not None else None
+        try:
+            await self._refresh_modules(priority=priority)
+            await self._refresh_options(priority=priority)
+            await self._refresh_admin(priority=priority)
+        except EvonicError as err:
+            raise EvonicConnectionError("Unable to connect to device") from err
+
+        return self._device.info.buildData != build
+
+    async def refresh(self, uri):
+        """Refresh a single endpoint now, regardless of its interval.
 
-        Starts with the known built-in effects for the model (from DEFAULT_EFFECTS),
-        then appends any additional effects returned by /effect.json that are not
-        already in that list (e.g. purchased effects synced via the Evonic app).
+        Args:
+            uri: The endpoint to refetch, e.g. /config.options.json
+
+        Raises:
+            EvonicConnectionError:  Unable to connect to device
         """
 
         if self._device is None:
-            raise Exception("No device initialised")
+            await self.get_config()
+
+        try:
+            await self._refresher(uri)()
+        except EvonicError as err:
+            raise EvonicConnectionError("Unable to connect to device") from err
 
-        configs = self._device.info.configs
-        base_effects = list(DEFAULT_EFFECTS.get(configs, []))
-        LOGGER.debug("Base effects for configs=%s: %s", configs, base_effects)
+        return self._device
+
+    def _refresher(self, uri):
+        return {
+            MODULES: self._refresh_modules,
+            LIVE: self._refresh_live,
+            SETUP: self._refresh_setup,
+            OPTIONS: self._refresh_options,
+            ADMIN: self._refresh_admin,
+            EFFECTS: self.__available_effects,
+            TIMERS: self.get_timers,
+        }[uri]
+
+    def _refresh_in_background(self, uri):
+        """Refresh an endpoint off the poll path, unless a refresh is already running."""
+        if uri in self._background:
+            return
+
+        # A fresh context, so the refresh does not inherit the deadline of the poll that started it
+        task = asyncio.create_task(self._background_refresh(uri), context=contextvars.Context())
+        self._background[uri] = task
+        task.add_done_callback(lambda _: self._background.pop(uri, None))
+
+    async def _background_refresh(self, uri):
+        LOGGER.debug("Refreshing %s from %s in the background", uri, self.host)
+        try:
+            await self._refresher(uri)(priority=RequestPriority.BACKGROUND)
+        except (EvonicError, ValueError) as err:
+            # Wait a full interval before retrying rather than hitting a failing endpoint every poll,
+            # including one whose body does not decode
+            LOGGER.warning("Background refresh of %s failed: %s", uri, err)
+            self._planner.mark(uri)
+            return
+
+        if self._changes:
+            for update_callback in list(self._refresh_listeners):
+                update_callback()
+
+    async def _refresh_modules(self, priority=RequestPriority.POLL):
+        response = await self.http_request(MODULES, "GET", None, priority=priority)
+        modules = response.json()
+        self._payloads[MODULES] = modules
+        if self._device is None:
+            self._device = Device(modules)
+        else:
+            self._update_device(modules)
+        self._planner.mark(MODULES)
+
+        known_build = self._capabilities.build
+        if self._capabilities.confirm(self._device.info.buildData) and known_build is not None:
+            LOGGER.info("Firmware of %s changed from %s to %s", self.host, known_build, self._device.info.buildData)
+            self._planner.invalidate(SETUP)
+            self._planner.invalidate(EFFECTS)
+
+    async def _refresh_live(self, priority=RequestPriority.POLL):
+        response = await self.http_request(LIVE, "GET", None, priority=priority)
+        digest = self._changed_digest(LIVE, response)
+        if digest is not None:
+            live = response.json()
+            self._payloads[LIVE] = live
+            self._update_device(live)
+            self._digests[LIVE] = (digest, self._generation)
+        self._planner.mark(LIVE)
+
+    async def _refresh_setup(self, priority=RequestPriority.POLL):
+        response = await self.http_request(SETUP, "GET", None, priority=priority)
+        digest = self._changed_digest(SETUP, response)
+        if digest is not None:
+            setup_data = response.json()
+            setup_data.pop("effect", None)
+            self._payloads[SETUP] = setup_data
+            self._update_device(setup_data)
+            self._digests[SETUP] = (digest, self._generation)
+        self._planner.mark(SETUP)
+
+    def _changed_digest(self, uri, response):
+        """Return the digest of a response body, or None when applying it would change nothing.
+
+        Most polls return exactly the bytes of the previous one, which then
+        need neither decoding nor applying to the device again. That only
+        holds while nothing else, e.g. a command or a push, changed the device
+        since the previous body was applied.
+        """
+        digest = hashlib.blake2b(response.body, digest_size=16).digest()
+        if self._digests.get(uri) == (digest, self._generation):
+            self._metrics.record_unchanged(uri)
+            return None
+        return digest
+
+    async def _refresh_options(self, priority=RequestPriority.POLL):
+        response = await self.http_request(OPTIONS, "GET", None, priority=priority)
+        options = response.json()
+        self._payloads[OPTIONS] = options
+        self._update_device(options)
+        self._planner.mark(OPTIONS)
+
+    async def _refresh_admin(self, priority=RequestPriority.POLL):
+        response = await self.http_request(ADMIN, "GET", None, priority=priority)
+        admin_response_data = response.json(encoding="latin-1")
+        admin_response_data.pop('AT+RFID', None)
+        self._payloads[ADMIN] = admin_response_data
+        self._update_device(admin_response_data)
+        self._planner.mark(ADMIN)
+
+    async def get_timers(self, priority=RequestPriority.POLL):
+        """Read the timer schedules stored on the fire.
 
+        Raises:
+            EvonicError: The fire did not return a timer list
+
+        Returns:
+            The fire's TimerTable.
+        """
+        response = await self.http_request(TIMERS, "GET", None, priority=priority)
         try:
-            response = await self.request("/effect.json", "GET", None)
-            data = await response.json(content_type=None)
-            device_effects = data.get("effect") or []
-            LOGGER.debug("Device effects response: %s", device_effects)
-        except Exception as err:
-            LOGGER.warning("Failed to fetch effects from device: %s", err)
-            device_effects = []
-
-        base_set = set(base_effects)
-        extra_effects = [e for e in device_effects if e not in base_set]
-        supported_effects = base_effects + extra_effects
+            table = TimerTable.parse(response.json())
+        except ValueError as err:
+            raise EvonicError(f"Invalid timer list from {self.host}: {err}") from err
+
+        self._store_timers(table)
+        return table
+
+    async def set_timers(self, table: TimerTable) -> TimerDiff:
+        """Save timer schedules to the fire, which then runs them on its own.
+
+        Args:
+            table: The schedules the fire should have. Entries the client does
+                not understand are kept as they are on the fire
+
+        Raises:
+            EvonicError: Reading or writing the timers failed
+
+        Returns:
+            The schedules that were added, changed and removed.
+        """
+        return await self._edit_timers(table.rebase)
 
+    async def save_schedule(self, schedule: Schedule) -> TimerDiff:
+        """Add a timer schedule to the fire, or replace the one with the same id.
+
+        Raises:
+            EvonicError: Reading or writing the timers failed
+        """
+        return await self._edit_timers(lambda current: current.with_schedule(schedule))
+
+    async def remove_schedule(self, schedule_id: int) -> TimerDiff:
+        """Remove a timer schedule from the fire.
+
+        Raises:
+            EvonicError: Reading or writing the timers failed
+            KeyError: The fire has no such schedule
+        """
+        return await self._edit_timers(lambda current: current.without_schedule(schedule_id))
+
+    async def _edit_timers(self, edit: Callable[[TimerTable], TimerTable]) -> TimerDiff:
+        """Apply ``edit`` to the timers currently on the fire and write the result back.
+
+        The edited table is diffed against the current one, and nothing is
+        written when no schedule changed. The firmware can only replace
+        /timer.save.json as a whole, so any change rewrites the file, with the
+        entries of unchanged schedules copied back exactly as they were read.
+        """
+        async with self._timer_lock:
+            current = await self.get_timers(priority=RequestPriority.COMMAND)
+            table = edit(current)
+            diff = current.diff(table)
+            if not diff:
+                LOGGER.debug("Timers of %s unchanged, nothing to write", self.host)
+                return diff
+
+            form = aiohttp.MultipartWriter("form-data")
+            part = form.append(json.dumps(table.as_payload()), {hdrs.CONTENT_TYPE: "text/json"})
+            # The fire saves the upload under its filename verbatim, which FormData would percent-encode
+            part.set_content_disposition("form-data", quote_fields=False, name="data", filename=TIMERS)
+            LOGGER.debug("Writing timers to %s: %s", self.host, diff)
+            await self.http_request(EDIT, "POST", form, priority=RequestPriority.COMMAND)
+            await self.http_request(SETTIMER, "GET", None, priority=RequestPriority.COMMAND)
+            self._store_timers(table)
+            return diff
+
+    def _store_timers(self, table: TimerTable) -> None:
+        if self._timers is None or self._timers.diff(table):
+            self._changes.add("timers")
+        self._timers = table
+        self._planner.mark(TIMERS)
+
+    async def __available_effects(self, priority=RequestPriority.BACKGROUND):
+        """ Returns a list of available effects for the device.
+
+        Starts with the shared built-in effect family for the model, then
+        layers on any additional effects returned by /effect.json that are not
+        already in it (e.g. purchased effects synced via the Evonic app).
+        """
+
+        if self._device is None:
+            raise Exception("No device initialised")
+
+        device_effects = []
+        if self._capabilities.supports(EFFECTS) is False:
+            LOGGER.debug("%s does not serve %s, using the built-in effects", self.host, EFFECTS)
+        else:
+            # Keep the effects the fire served before if this fetch fails
+            device_effects = self._payloads.get(EFFECTS, {}).get("effect") or []
+            try:
+                response = await self.http_request(EFFECTS, "GET", None, priority=priority)
+                data = response.json()
+            except EvonicConnectionTimeoutError as err:
+                LOGGER.warning("Failed to fetch effects from device: %s", err)
+                self._capabilities.record_timeout(EFFECTS)
+            except EvonicResponseError as err:
+                if err.status == 404:
+                    LOGGER.info("%s does not serve %s, using the built-in effects", self.host, EFFECTS)
+                    self._capabilities.record(EFFECTS, False)
+                    device_effects = []
+                else:
+                    # A firmware without the endpoint answers 404, anything else is retried next refresh
+                    LOGGER.warning("Failed to fetch effects from device: %s", err)
+            except (EvonicError, ValueError) as err:
+                LOGGER.warning("Failed to fetch effects from device: %s", err)
+            else:
+                device_effects = data.get("effect") or []
+                LOGGER.debug("Device effects response: %s", device_effects)
+                self._capabilities.record(EFFECTS, True)
+                self._payloads[EFFECTS] = {"effect": device_effects}
+
+        self._apply_effects(device_effects)
+        self._planner.mark(EFFECTS)
+
+    def _apply_effects(self, device_effects):
+        supported_effects = effect_list(self._device.info.configs, device_effects)
         LOGGER.debug("Supported effects: %s", supported_effects)
-        self._device.update_from_dict({"available_effects": supported_effects})
-        self._effects_last_fetched = datetime.now()
+        self._update_device({"available_effects": supported_effects})
 
     async def __aenter__(self):
         """Async enter.
@@ -454,7 +1169,11 @@ class Evonic:
         return self
 
     async def close(self) -> None:
-        """Close the aiohttp session if it was created internally."""
+        """Cancel background refreshes and pending commands, and close the session if it was created internally."""
+        for task in list(self._background.values()):
+            task.cancel()
+        await self._coalescer.close()
+
         if self._close_session and self.session:
             await self.session.close()
 
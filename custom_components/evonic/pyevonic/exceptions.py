@@ -5,6 +5,14 @@ class EvonicError(Exception):
     """Generic Evonic Exception"""
 
 
+class EvonicResponseError(EvonicError):
+    """Evonic Fire answered with an HTTP error status"""
+
+    def __init__(self, *args, status: int) -> None:
+        super().__init__(*args)
+        self.status = status
+
+
 class EvonicUnsupportedFeature(Exception):
     """Unsupported feature exception"""
 
@@ -17,5 +25,9 @@ class EvonicConnectionTimeoutError(EvonicConnectionError):
     """Evonic connection Timeout exception"""
 
 
+class EvonicCircuitOpenError(EvonicConnectionError):
+    """Evonic transport is failing and requests are not being sent to it"""
+
+
 class EvonicConnectionClosed(EvonicConnectionError):
     """Evonic Websocket connection has been closed"""
\ No newline at end of file
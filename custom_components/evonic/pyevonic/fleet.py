@@ -0,0 +1,131 @@
+"""Concurrent snapshots of many Evonic Fires.
+
+Fleet health checks talk to hundreds of fires. EvonicFleet keeps one Evonic
+client per host on a single shared session and fetches their snapshots with a
+bounded number of workers, yielding each result as soon as it is ready.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import asdict, dataclass
+
+import aiohttp
+
+from .evonic import Evonic
+from .exceptions import EvonicError
+from .models import Device
+
+
+@dataclass
+class FleetResult:
+    """Outcome of snapshotting one fire."""
+
+    host: str
+    device: Device | None = None
+    error: str | None = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def as_dict(self) -> dict:
+        result = {"host": self.host, "ok": self.ok, "elapsed": round(self.elapsed, 4)}
+        if self.device is not None:
+            for section in ("info", "climate", "light", "network", "effects"):
+                result[section] = asdict(getattr(self.device, section))
+        if self.error is not None:
+            result["error"] = self.error
+        return result
+
+
+class EvonicFleet:
+    """Fetches device snapshots from many fires concurrently.
+
+    Args:
+        hosts: Fire addresses, e.g. ``192.168.1.50`` or ``192.168.1.50:8080``
+        max_concurrency: Fires fetched at the same time
+        request_timeout: Seconds allowed for each request
+        session: Session to use, by default one is created for the fleet
+    """
+
+    def __init__(
+        self,
+        hosts: Iterable[str],
+        *,
+        max_concurrency: int = 20,
+        request_timeout: float = 8.0,
+        session: aiohttp.ClientSession | None = None,
+    ) -> None:
+        self.hosts = list(dict.fromkeys(hosts))
+        self.max_concurrency = max_concurrency
+        self.request_timeout = request_timeout
+        self._session = session
+        self._close_session = session is None
+        self._clients: dict[str, Evonic] = {}
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None:
+            # Fires serve one connection at a time, so keep at most one open to
+            # each, reused where the fire keeps it alive, and cap the total
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrency,
+                limit_per_host=1,
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    def client(self, host: str) -> Evonic:
+        """Return the fleet's client for ``host``."""
+        evonic = self._clients.get(host)
+        if evonic is None:
+            evonic = Evonic(host, request_timeout=self.request_timeout, session=self._get_session())
+            self._clients[host] = evonic
+        return evonic
+
+    async def snapshot(self, host: str) -> FleetResult:
+        """Fetch the current state of one fire, never raising for device errors."""
+        evonic = self.client(host)
+        start = time.monotonic()
+        try:
+            device = await evonic.get_device()
+        except (EvonicError, asyncio.TimeoutError, aiohttp.ClientError, ValueError) as err:
+            return FleetResult(host, error=str(err) or type(err).__name__, elapsed=time.monotonic() - start)
+        return FleetResult(host, device=device, elapsed=time.monotonic() - start)
+
+    async def snapshots(self) -> AsyncIterator[FleetResult]:
+        """Snapshot every fire, yielding results in the order they complete."""
+        hosts: asyncio.Queue[str] = asyncio.Queue()
+        for host in self.hosts:
+            hosts.put_nowait(host)
+        results: asyncio.Queue[FleetResult] = asyncio.Queue()
+
+        async def worker() -> None:
+            while not hosts.empty():
+                results.put_nowait(await self.snapshot(hosts.get_nowait()))
+
+        workers = [asyncio.create_task(worker()) for _ in range(min(self.max_concurrency, len(self.hosts)))]
+        try:
+            for _ in self.hosts:
+                yield await results.get()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def close(self) -> None:
+        """Close every client and the session if the fleet created it."""
+        for evonic in self._clients.values():
+            await evonic.close()
+        if self._close_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> EvonicFleet:
+        return self
+
+    async def __aexit__(self, *_exc_info) -> None:
+        await self.close()
@@ -0,0 +1,220 @@
+"""Request metrics for each endpoint and transport of an Evonic Fire.
+
+Counts requests, timeouts, WebSocket fallbacks and bytes read, keeps a
+latency histogram with fixed buckets and remembers the last error. HTTP
+connections opened and reused are counted when the client owns its
+session, as only then can it trace the connector. Every
+counter is allocated up front, so recording a request only increments
+existing slots. Endpoints are keyed by path without the query string and
+capped at ``MAX_ENDPOINTS``, anything past that is counted under ``other``.
+``PollHistory`` keeps the most recent polls in a ring buffer of fixed size.
+"""
+from __future__ import annotations
+
+import time
+from bisect import bisect_left
+from collections import deque
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass
+
+from .capabilities import HTTP, WEBSOCKET
+
+# Upper bounds of the latency histogram buckets, in seconds
+LATENCY_BUCKETS = (0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+MAX_ENDPOINTS = 16
+OTHER = "other"
+
+
+class EndpointMetrics:
+    """Counters and latency histogram for one endpoint or transport."""
+
+    __slots__ = (
+        "requests",
+        "errors",
+        "timeouts",
+        "fallbacks",
+        "unchanged",
+        "bytes_read",
+        "total_latency",
+        "max_latency",
+        "last_latency",
+        "histogram",
+        "last_error",
+        "last_error_at",
+    )
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.fallbacks = 0
+        # Responses identical to the previous one, which were not decoded again
+        self.unchanged = 0
+        self.bytes_read = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.last_latency = 0.0
+        # One slot per bucket plus one for anything slower than the last
+        self.histogram = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.last_error: str | None = None
+        self.last_error_at: float | None = None
+
+    @property
+    def average_latency(self) -> float:
+        return self.total_latency / self.requests if self.requests else 0.0
+
+    @property
+    def unchanged_rate(self) -> float:
+        return self.unchanged / self.requests if self.requests else 0.0
+
+    def record(self, latency: float, size: int) -> None:
+        self.requests += 1
+        self.bytes_read += size
+        self.total_latency += latency
+        self.last_latency = latency
+        if latency > self.max_latency:
+            self.max_latency = latency
+        self.histogram[bisect_left(LATENCY_BUCKETS, latency)] += 1
+
+    def record_error(self, error: str, timeout: bool = False) -> None:
+        self.errors += 1
+        if timeout:
+            self.timeouts += 1
+        self.last_error = error
+        self.last_error_at = time.time()
+
+    def quantile(self, q: float) -> float | None:
+        """Estimate a latency quantile from the histogram, as the upper bound of its bucket.
+
+        Returns:
+            The latency in seconds, None when nothing was recorded yet or it
+            falls past the last bucket.
+        """
+        if not self.requests:
+            return None
+        target = q * self.requests
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS, self.histogram):
+            seen += count
+            if seen >= target:
+                return bound
+        return None
+
+    def as_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "fallbacks": self.fallbacks,
+            "unchanged": self.unchanged,
+            "unchanged_rate": self.unchanged_rate,
+            "bytes_read": self.bytes_read,
+            "average_latency": self.average_latency,
+            "max_latency": self.max_latency,
+            "last_latency": self.last_latency,
+            "p50_latency": self.quantile(0.5),
+            "p95_latency": self.quantile(0.95),
+            "histogram": {
+                **{f"le_{bound}": count for bound, count in zip(LATENCY_BUCKETS, self.histogram)},
+                "le_inf": self.histogram[-1],
+            },
+            "last_error": self.last_error,
+            "last_error_at": self.last_error_at,
+        }
+
+
+class RequestMetrics:
+    """Metrics of every request to one fire, per transport and per endpoint."""
+
+    def __init__(self) -> None:
+        self.transports: dict[str, EndpointMetrics] = {HTTP: EndpointMetrics(), WEBSOCKET: EndpointMetrics()}
+        self._endpoints: dict[str, dict[str, EndpointMetrics]] = {HTTP: {}, WEBSOCKET: {}}
+        self.connections_opened = 0
+        self.connections_reused = 0
+
+    def endpoint(self, transport: str, path: str) -> EndpointMetrics:
+        """Return the metrics of ``path`` on ``transport``, creating them on first use."""
+        endpoints = self._endpoints[transport]
+        metrics = endpoints.get(path)
+        if metrics is None:
+            if len(endpoints) >= MAX_ENDPOINTS:
+                path = OTHER
+            metrics = endpoints.get(path)
+            if metrics is None:
+                metrics = endpoints[path] = EndpointMetrics()
+        return metrics
+
+    def record(self, transport: str, path: str, latency: float, size: int = 0) -> None:
+        """Record a request that completed."""
+        self.transports[transport].record(latency, size)
+        self.endpoint(transport, path).record(latency, size)
+
+    def record_error(self, transport: str, path: str, error: str, timeout: bool = False) -> None:
+        """Record a request that failed or timed out."""
+        self.transports[transport].record_error(error, timeout)
+        self.endpoint(transport, path).record_error(error, timeout)
+
+    def record_fallback(self, path: str) -> None:
+        """Record an HTTP request that was sent over the WebSocket instead."""
+        self.transports[HTTP].fallbacks += 1
+        self.endpoint(HTTP, path).fallbacks += 1
+
+    def record_unchanged(self, path: str) -> None:
+        """Record an HTTP response identical to the previous one from ``path``."""
+        self.transports[HTTP].unchanged += 1
+        self.endpoint(HTTP, path).unchanged += 1
+
+    def record_connection(self, reused: bool) -> None:
+        """Record an HTTP request sent on a pooled connection, or on a new one."""
+        if reused:
+            self.connections_reused += 1
+        else:
+            self.connections_opened += 1
+
+    @property
+    def last_error(self) -> str | None:
+        """The most recent error on any transport."""
+        latest = max(self.transports.values(), key=lambda metrics: metrics.last_error_at or 0.0)
+        return latest.last_error
+
+    def as_dict(self) -> dict:
+        data = {
+            transport: {
+                **metrics.as_dict(),
+                "endpoints": {path: endpoint.as_dict() for path, endpoint in self._endpoints[transport].items()},
+            }
+            for transport, metrics in self.transports.items()
+        }
+        data[HTTP]["connections"] = {"opened": self.connections_opened, "reused": self.connections_reused}
+        return data
+
+
+@dataclass(frozen=True, slots=True)
+class PollRecord:
+    """Timing and outcome of one poll of a fire."""
+
+    started: float
+    elapsed: float
+    requests: int
+    bytes_read: int
+    error: str | None = None
+
+
+class PollHistory:
+    """Ring buffer of the most recent polls, the oldest dropped first."""
+
+    def __init__(self, size: int = 20) -> None:
+        self._polls: deque[PollRecord] = deque(maxlen=size)
+
+    def record(self, poll: PollRecord) -> None:
+        self._polls.append(poll)
+
+    def __len__(self) -> int:
+        return len(self._polls)
+
+    def __iter__(self) -> Iterator[PollRecord]:
+        return iter(self._polls)
+
+    def as_list(self) -> list[dict]:
+        return [asdict(poll) for poll in self._polls]
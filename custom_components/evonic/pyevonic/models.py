@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from typing import Any
 import logging
@@ -7,172 +8,231 @@ import logging
 LOGGER = logging.getLogger(__name__)
 
 
-@dataclass
+def to_int(value) -> int:
+    if isinstance(value, int):
+        return value
+    elif isinstance(value, str):
+        return int(value)
+    else:
+        return 0
+
+
+def to_float(value) -> float:
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+@dataclass(slots=True)
 class Network:
-    ip: str
-    subnet: str
-    ssidAP: str
-    signal_strength: str
-    mac: str
+    ip: str | None = None
+    subnet: str | None = None
+    ssidAP: str | None = None
+    signal_strength: str | None = None
+    mac: str | None = None
 
     @staticmethod
     def from_dict(data):
-        return Network(
-            ip=data.get('ip'),
-            subnet=data.get('subnet'),
-            ssidAP=data.get('ssidAP'),
-            signal_strength=data.get('dbm'),
-            mac=data.get("mac")
-        )
+        network = Network()
+        network.update_from_dict(data)
+        return network
 
     def update_from_dict(self, data):
-        self.ip = data.get('ip', self.ip)
-        self.subnet = data.get('subnet', self.subnet)
-        self.ssidAP = data.get('ssidAP', self.ssidAP)
-        self.signal_strength = data.get('dbm', self.signal_strength)
-        self.mac = data.get('mac', self.mac)
+        return _apply(_section_targets("network", self), {}, data)
 
 
-@dataclass
+@dataclass(slots=True)
 class Info:
-    on: Any
-    ssdp: str | None
-    ssidAP: str | None
-    configs: str | None
-    product: str | None
-    buildData: str | None
-    last_ping: str | None
-    modules: list
-    email: str | None
-    cost: float
-    heater_power: int
-    led_power: int
-    flashChip: str | None
+    on: Any = None
+    ssdp: str | None = None
+    ssidAP: str | None = None
+    configs: str | None = None
+    product: str | None = None
+    buildData: str | None = None
+    last_ping: str | None = None
+    modules: list | None = None
+    email: str | None = None
+    cost: float = 0.0
+    heater_power: int = 0
+    led_power: int = 0
+    flashChip: str | None = None
 
     @staticmethod
     def from_dict(data):
-        return Info(
-            on=data.get("Fire"),
-            ssdp=data.get("SSDP"),
-            ssidAP=data.get('ssidAP'),
-            configs=data.get('configs'),
-            product=data.get('product'),
-            buildData=data.get('buildData'),
-            last_ping=data.get('time'),
-            modules=data.get('module'),
-            email=data.get('mail'),
-            cost=float(data.get('cost') or 0),
-            heater_power=to_int(data.get('powerHeater')),
-            led_power=to_int(data.get('powerLed')),
-            flashChip=data.get('flashChip'),
-        )
+        info = Info()
+        info.update_from_dict(data)
+        return info
 
     def update_from_dict(self, data):
-        self.on = data.get("Fire", self.on)
-        self.ssdp = data.get('SSDP', self.ssdp)
-        self.ssidAP = data.get('ssidAP', self.ssidAP)
-        self.configs = data.get('configs', self.configs)
-        self.product = data.get('product', self.product)
-        self.buildData = data.get('buildData', self.buildData)
-        self.last_ping = data.get('time', self.last_ping)
-        self.modules = data.get('module', self.modules)
-        self.email = data.get('mail', self.email)
-        if isinstance(data.get('cost'), str):
-            self.cost = float(0)
-        else:
-            self.cost = float(data.get('cost', self.cost))
-        self.heater_power = to_int(data.get('powerHeater', self.heater_power))
-        self.led_power = to_int(data.get('powerLed', self.led_power))
-        self.flashChip = data.get('flashChip', self.flashChip)
-
-
-@dataclass
+        return _apply(_section_targets("info", self), {}, data)
+
+
+@dataclass(slots=True)
 class Climate:
-    current_temp: int
-    target_temp: int
-    heating: Any
-    fahrenheit: int
+    current_temp: int = 0
+    target_temp: int = 0
+    heating: Any = None
+    fahrenheit: int = 0
 
     @staticmethod
     def from_dict(data):
-        return Climate(
-            current_temp=to_int(data.get("temperature")),
-            target_temp=to_int(data.get('templevel')),
-            heating=data.get("Heater"),
-            fahrenheit=to_int(data.get("fahrenheit")),
-        )
+        climate = Climate()
+        climate.update_from_dict(data)
+        return climate
 
     def update_from_dict(self, data):
-        self.current_temp = to_int(data.get("temperature", self.current_temp))
-        self.target_temp = to_int(data.get("templevel", self.target_temp))
-        self.heating = data.get('Heater', self.heating)
-        self.fahrenheit = to_int(data.get('fahrenheit', self.fahrenheit))
+        return _apply(_section_targets("climate", self), {}, data)
 
 
-@dataclass
+@dataclass(slots=True)
 class Effects:
-    available_effects: list | None
+    available_effects: Sequence[str] | None = None
 
     @staticmethod
     def from_dict(data):
-        return Effects(
-            available_effects=data.get('available_effects')
-        )
+        effects = Effects()
+        effects.update_from_dict(data)
+        return effects
 
     def update_from_dict(self, data):
-        self.available_effects = data.get('available_effects', self.available_effects)
+        return _apply(_section_targets("effects", self), {}, data)
 
 
-@dataclass
+@dataclass(slots=True)
 class Light:
-    effect: str | None
-    feature_light: Any
-    flame_brightness: int
-    flame_speed: int
-    fuelbed_brightness: int
-    fuelbed_speed: int
+    effect: str | None = None
+    feature_light: Any = None
+    flame_brightness: int = 0
+    flame_speed: int = 0
+    fuelbed_brightness: int = 0
+    fuelbed_speed: int = 0
 
     @staticmethod
     def from_dict(data):
-        return Light(
-            effect=data.get("effect"),
-            feature_light=data.get("pinout3"),
-            flame_brightness=to_int(data.get("brightnessRGB0")),
-            flame_speed=to_int(data.get("speedRGB0")),
-            fuelbed_brightness=to_int(data.get("brightnessRGB1")),
-            fuelbed_speed=to_int(data.get("speedRGB1")),
-        )
+        light = Light()
+        light.update_from_dict(data)
+        return light
 
     def update_from_dict(self, data):
-        self.effect = data.get("effect", self.effect)
-        self.feature_light = data.get("pinout3", self.feature_light)
-        self.flame_brightness = to_int(data.get("brightnessRGB0", self.flame_brightness))
-        self.flame_speed = to_int(data.get("speedRGB0", self.flame_speed))
-        self.fuelbed_brightness = to_int(data.get("brightnessRGB1", self.fuelbed_brightness))
-        self.fuelbed_speed = to_int(data.get("speedRGB1", self.fuelbed_speed))
+        return _apply(_section_targets("light", self), {}, data)
+
+
+# Wire key -> (section, field, converter) for every field the models own.
+# A key may feed more than one field, e.g. ssidAP is kept on Info and Network.
+FIELDS: tuple[tuple[str, str, str, Callable[[Any], Any] | None], ...] = (
+    ("ip", "network", "ip", None),
+    ("subnet", "network", "subnet", None),
+    ("ssidAP", "network", "ssidAP", None),
+    ("dbm", "network", "signal_strength", None),
+    ("mac", "network", "mac", None),
+    ("Fire", "info", "on", None),
+    ("SSDP", "info", "ssdp", None),
+    ("ssidAP", "info", "ssidAP", None),
+    ("configs", "info", "configs", None),
+    ("product", "info", "product", None),
+    ("buildData", "info", "buildData", None),
+    ("time", "info", "last_ping", None),
+    ("module", "info", "modules", None),
+    ("mail", "info", "email", None),
+    ("cost", "info", "cost", to_float),
+    ("powerHeater", "info", "heater_power", to_int),
+    ("powerLed", "info", "led_power", to_int),
+    ("flashChip", "info", "flashChip", None),
+    ("temperature", "climate", "current_temp", to_int),
+    ("templevel", "climate", "target_temp", to_int),
+    ("Heater", "climate", "heating", None),
+    ("fahrenheit", "climate", "fahrenheit", to_int),
+    ("available_effects", "effects", "available_effects", None),
+    ("effect", "light", "effect", None),
+    ("pinout3", "light", "feature_light", None),
+    ("brightnessRGB0", "light", "flame_brightness", to_int),
+    ("speedRGB0", "light", "flame_speed", to_int),
+    ("brightnessRGB1", "light", "fuelbed_brightness", to_int),
+    ("speedRGB1", "light", "fuelbed_speed", to_int),
+)
+
+SECTIONS = ("info", "climate", "network", "light", "effects")
+
+# Compiled from FIELDS: wire key -> (section index, field, converter, changed name)
+DISPATCH: dict[str, tuple[tuple[int, str, Callable[[Any], Any] | None, str], ...]] = {}
+for _key, _section, _field, _convert in FIELDS:
+    _entry = (SECTIONS.index(_section), _field, _convert, f"{_section}.{_field}")
+    DISPATCH[_key] = (*DISPATCH.get(_key, ()), _entry)
+
+_MISSING = object()
+
+
+def _section_targets(section, target):
+    """Return the targets for ``_apply`` that update only ``section``."""
+    targets = [None] * len(SECTIONS)
+    targets[SECTIONS.index(section)] = target
+    return targets
+
+
+def _apply(targets, raw, data, changes=None):
+    """Apply the keys in ``data`` the models own to ``targets``, the sections in ``SECTIONS`` order.
+
+    ``raw`` holds the wire value each key was last applied with. A key whose
+    value is the same as last time is skipped with that single lookup,
+    before it is dispatched or converted. Sections whose target is None are
+    left alone.
+
+    Returns:
+        Whether any field changed.
+    """
+    changed = False
+    for key, value in data.items():
+        if raw.get(key, _MISSING) == value:
+            continue
+        entries = DISPATCH.get(key)
+        if entries is None:
+            continue
+        raw[key] = value
+        for index, name, convert, change in entries:
+            target = targets[index]
+            if target is None:
+                continue
+            new = value if convert is None else convert(value)
+            if getattr(target, name) != new:
+                setattr(target, name, new)
+                changed = True
+                if changes is not None:
+                    changes.add(change)
+    return changed
 
 
 class Device:
-    def __init__(self, data):
-        self.info = Info.from_dict(data)
-        self.climate = Climate.from_dict(data)
-        self.network = Network.from_dict(data)
-        self.light = Light.from_dict(data)
-        self.effects = Effects.from_dict(data)
-
-    def update_from_dict(self, data):
-        self.info.update_from_dict(data)
-        self.climate.update_from_dict(data)
-        self.network.update_from_dict(data)
-        self.light.update_from_dict(data)
-        self.effects.update_from_dict(data)
-        return self
+    __slots__ = ("info", "climate", "network", "light", "effects", "_raw")
 
-
-def to_int(value) -> int:
-    if isinstance(value, int):
-        return value
-    elif isinstance(value, str):
-        return int(value)
-    else:
-        return 0
\ No newline at end of file
+    def __init__(self, data):
+        self.info = Info()
+        self.climate = Climate()
+        self.network = Network()
+        self.light = Light()
+        self.effects = Effects()
+        self._raw: dict[str, Any] = {}
+        self.update_from_dict(data)
+
+    def update_from_dict(self, data, changes: set[str] | None = None) -> bool:
+        """Apply a payload from the fire.
+
+        Keys whose wire value is the same as last time are skipped, the rest
+        are looked up in ``DISPATCH`` and only assigned to the fields they
+        feed when the converted value changed.
+
+        Args:
+            data: The payload
+            changes: A set to add the changed fields to, as ``section.field``
+                names, e.g. ``climate.target_temp``
+
+        Returns:
+            Whether any field changed.
+        """
+        targets = (self.info, self.climate, self.network, self.light, self.effects)
+        return _apply(targets, self._raw, data, changes)
+
+    def wire_values(self, keys) -> dict[str, Any]:
+        """Return the payload values last applied for those of ``keys`` that have been."""
+        raw = self._raw
+        return {key: raw[key] for key in keys if key in raw}
@@ -0,0 +1,251 @@
+"""Persistent WebSocket push transport for Evonic Fires.
+
+Keeps a single long-lived connection to the fire's ``arduino`` WebSocket and
+feeds the state frames it pushes into the cached Device. The ESP8266 was
+overloaded by the WebSocket connections used before 0.3.0, so the transport
+holds a hard budget: one connection per fire, a capped outbound message rate,
+throttled update callbacks and jittered exponential backoff between reconnects.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import random
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+import aiohttp
+import async_timeout
+
+from .exceptions import EvonicConnectionClosed, EvonicError
+from .models import Device
+from .scheduler import RequestPriority
+
+if TYPE_CHECKING:
+    from .evonic import Evonic
+
+LOGGER = logging.getLogger(__name__)
+
+# The firmware reports some fields in either case depending on the page that triggered them
+PUSH_ALIASES = {
+    "fire": "Fire",
+    "heater": "Heater",
+    "relay1": "Relay1",
+    "relay2": "Relay2",
+    "relay3": "Relay3",
+}
+
+_ACTIVE: dict[str, EvonicPush] = {}
+
+
+class RateLimiter:
+    """Token bucket allowing ``rate`` events per second with bursts of ``burst``."""
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def wait(self) -> None:
+        """Wait until an event is allowed, then consume it."""
+        self._refill()
+        while self._tokens < 1:
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+            self._refill()
+        self._tokens -= 1
+
+
+class EvonicPush:
+    """Streams state from an Evonic Fire over one long-lived WebSocket.
+
+    Args:
+        evonic: The client whose Device should receive pushed state.
+        on_update: Called with the Device after pushed state has been applied.
+        on_connection_change: Called with ``True``/``False`` as the socket connects and drops.
+        max_messages_per_second: Outbound message budget.
+        max_updates_per_second: How often ``on_update`` may be called.
+        backoff_min: First reconnect delay in seconds.
+        backoff_max: Longest reconnect delay in seconds.
+        heartbeat: Seconds between WebSocket pings used to detect a dead socket.
+    """
+
+    def __init__(
+        self,
+        evonic: Evonic,
+        *,
+        on_update: Callable[[Device], None],
+        on_connection_change: Callable[[bool], None] | None = None,
+        max_messages_per_second: float = 2.0,
+        max_updates_per_second: float = 2.0,
+        backoff_min: float = 2.0,
+        backoff_max: float = 300.0,
+        heartbeat: float = 60.0,
+    ) -> None:
+        self.evonic = evonic
+        self.on_update = on_update
+        self.on_connection_change = on_connection_change
+        self.backoff_min = backoff_min
+        self.backoff_max = backoff_max
+        self.heartbeat = heartbeat
+        self.reconnects = 0
+
+        self._limiter = RateLimiter(max_messages_per_second, burst=2)
+        self._update_interval = 1 / max_updates_per_second
+        self._last_update = 0.0
+        self._pending_update: asyncio.TimerHandle | None = None
+        self._ws: aiohttp.ClientWebSocketResponse | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def connected(self) -> bool:
+        """Whether the socket is currently open."""
+        return self._ws is not None and not self._ws.closed
+
+    def start(self) -> None:
+        """Start the connection loop.
+
+        Raises:
+            EvonicError: Another push connection is already open to this fire
+        """
+        if self._task is not None:
+            return
+
+        active = _ACTIVE.get(self.evonic.host)
+        if active is not None and active is not self:
+            raise EvonicError(f"A push connection to {self.evonic.host} is already running")
+
+        _ACTIVE[self.evonic.host] = self
+        self.evonic._push = self
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Close the socket and stop reconnecting."""
+        if _ACTIVE.get(self.evonic.host) is self:
+            del _ACTIVE[self.evonic.host]
+        if self.evonic._push is self:
+            self.evonic._push = None
+        if self._pending_update is not None:
+            self._pending_update.cancel()
+            self._pending_update = None
+
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def send(self, message: dict) -> None:
+        """Send a message over the open socket, within the outbound budget.
+
+        Raises:
+            EvonicConnectionClosed: The socket is not connected, or failed and was closed
+        """
+        if not self.connected:
+            raise EvonicConnectionClosed(f"Push connection to {self.evonic.host} is not open")
+
+        await self._limiter.wait()
+        if not self.connected:
+            raise EvonicConnectionClosed(f"Push connection to {self.evonic.host} closed while waiting to send")
+        LOGGER.debug("Sending push message to %s: %s", self.evonic.host, message)
+        ws = self._ws
+        try:
+            await ws.send_str(json.dumps(message))
+        except (ConnectionResetError, aiohttp.ClientError) as err:
+            # Close the broken socket, which frees its connection and lets _run reconnect
+            await ws.close()
+            raise EvonicConnectionClosed(f"Push connection to {self.evonic.host} failed: {err!r}") from err
+
+    async def _run(self) -> None:
+        attempt = 0
+        while True:
+            try:
+                await self._connect()
+                attempt = 0
+                await self.send({"cmd": "get config.live"})
+                await self._listen()
+            except (aiohttp.ClientError, asyncio.TimeoutError, OSError, EvonicError) as err:
+                LOGGER.debug("Push connection to %s failed: %s", self.evonic.host, err)
+            finally:
+                await self._disconnect()
+
+            attempt += 1
+            self.reconnects += 1
+            delay = min(self.backoff_max, self.backoff_min * 2 ** (attempt - 1))
+            delay = random.uniform(delay / 2, delay)
+            LOGGER.debug("Reconnecting push connection to %s in %.1fs", self.evonic.host, delay)
+            await asyncio.sleep(delay)
+
+    async def _connect(self) -> None:
+        session = self.evonic._get_session()
+        url = self.evonic.ws_url
+        LOGGER.debug("Opening push connection to %s", url)
+
+        # Wait for queued commands and polls to go first, but do not hold the
+        # slot through the handshake, so a fire slow to answer it stalls no one
+        async with self.evonic.scheduler.slot(RequestPriority.BACKGROUND):
+            pass
+
+        # ws_connect's own timeout only bounds the close handshake
+        async with async_timeout.timeout(self.evonic.request_timeout):
+            self._ws = await session.ws_connect(url, protocols=["arduino"], heartbeat=self.heartbeat)
+
+        LOGGER.info("Push connection to %s established", self.evonic.host)
+        if self.on_connection_change is not None:
+            self.on_connection_change(True)
+
+    async def _disconnect(self) -> None:
+        if self._ws is None:
+            return
+
+        ws, self._ws = self._ws, None
+        await ws.close()
+        LOGGER.info("Push connection to %s closed", self.evonic.host)
+        if self.on_connection_change is not None:
+            self.on_connection_change(False)
+
+    async def _listen(self) -> None:
+        async for message in self._ws:
+            if message.type == aiohttp.WSMsgType.TEXT:
+                self._handle_message(message.data)
+            elif message.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                break
+
+    def _handle_message(self, text: str) -> None:
+        try:
+            data = json.loads(text)
+        except ValueError:
+            LOGGER.debug("Ignoring non-JSON push frame from %s: %s", self.evonic.host, text)
+            return
+
+        if not isinstance(data, dict) or self.evonic._device is None:
+            return
+
+        state = {PUSH_ALIASES.get(key, key): value for key, value in data.items()}
+        self.evonic._update_device(state)
+        self._schedule_update()
+
+    def _schedule_update(self) -> None:
+        """Call ``on_update`` now, or once at the end of the current throttle window."""
+        if self._pending_update is not None:
+            return
+
+        wait = self._last_update + self._update_interval - time.monotonic()
+        if wait <= 0:
+            self._send_update()
+        else:
+            self._pending_update = asyncio.get_running_loop().call_later(wait, self._send_update)
+
+    def _send_update(self) -> None:
+        self._pending_update = None
+        self._last_update = time.monotonic()
+        self.on_update(self.evonic._device)
@@ -0,0 +1,64 @@
+"""Refresh cadence for the Evonic Fire endpoints.
+
+Live state changes all the time, while setup, options, admin and the effect
+list almost never do. Each endpoint gets its own refresh interval so a poll
+only fetches what is actually due.
+"""
+from __future__ import annotations
+
+import time
+from datetime import timedelta
+
+MODULES = "/modules.json"
+LIVE = "/config.live.json"
+SETUP = "/config.setup.json"
+OPTIONS = "/config.options.json"
+ADMIN = "/config.admin.json"
+EFFECTS = "/effect.json"
+TIMERS = "/timer.save.json"
+
+
+class RefreshPlanner:
+    """Tracks when each endpoint was last refreshed and which are due.
+
+    An interval of ``None`` means the endpoint is only fetched once, at
+    startup, or when a refresh is explicitly requested.
+    """
+
+    def __init__(self, intervals: dict[str, timedelta | None]) -> None:
+        self.intervals = intervals
+        self._refreshed: dict[str, float] = {}
+
+    def fetched(self, uri: str) -> bool:
+        """Return whether ``uri`` has been fetched at least once."""
+        return uri in self._refreshed
+
+    def due(self, uri: str) -> bool:
+        """Return whether ``uri`` should be refreshed now."""
+        last = self._refreshed.get(uri)
+        if last is None:
+            return True
+
+        interval = self.intervals.get(uri, timedelta(0))
+        if interval is None:
+            return False
+        return time.monotonic() - last >= interval.total_seconds()
+
+    def mark(self, uri: str) -> None:
+        """Record that ``uri`` was just refreshed."""
+        self._refreshed[uri] = time.monotonic()
+
+    def mark_stale(self, uri: str) -> None:
+        """Record ``uri`` as fetched long ago, e.g. restored from a cache.
+
+        It no longer needs fetching inline, but is due on the next poll unless
+        its interval is ``None``.
+        """
+        self._refreshed[uri] = float("-inf")
+
+    def invalidate(self, uri: str | None = None) -> None:
+        """Make ``uri`` (or every endpoint) due on the next poll."""
+        if uri is None:
+            self._refreshed.clear()
+        else:
+            self._refreshed.pop(uri, None)
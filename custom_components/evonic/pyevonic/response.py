@@ -0,0 +1,48 @@
+"""Responses from an Evonic Fire, read in full before they are handed out.
+
+``Evonic.http_request`` reads the body and releases the connection before
+returning, so no caller can hold a pooled connection open by forgetting to
+read or release a response. Decoding is left to the caller, which can skip
+it for a body it has already seen.
+"""
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import Any
+
+from .capabilities import HTTP
+
+
+@dataclass(frozen=True, slots=True)
+class EvonicResponse:
+    """A response from the fire.
+
+    Args:
+        status: HTTP status, 0 when the request was sent over the WebSocket
+        body: The raw body, empty for WebSocket commands
+        transport: ``http`` or ``websocket``
+        elapsed: Seconds from sending the request to reading the last byte
+        content_type: The Content-Type header, without parameters
+    """
+
+    status: int
+    body: bytes = b""
+    transport: str = HTTP
+    elapsed: float = 0.0
+    content_type: str = ""
+
+    @property
+    def size(self) -> int:
+        return len(self.body)
+
+    def json(self, encoding: str = "utf-8") -> Any:
+        """Decode the body as JSON, whatever the Content-Type claims.
+
+        Raises:
+            ValueError: The body is not JSON
+        """
+        return json.loads(self.body.decode(encoding))
+
+    def text(self, encoding: str = "utf-8") -> str:
+        return self.body.decode(encoding, errors="replace")
@@ -0,0 +1,114 @@
+"""Per-host request scheduling for Evonic Fires.
+
+The ESP8266 in the fire serves one client at a time and stalls when several
+requests arrive together, so every request to a host goes through a shared
+scheduler that limits how many are in flight and sends user commands ahead
+of background reads.
+"""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+import weakref
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+from enum import IntEnum
+
+
+class RequestPriority(IntEnum):
+    """Order in which queued requests are sent, lowest first."""
+
+    COMMAND = 0
+    POLL = 1
+    BACKGROUND = 2
+
+
+@dataclass
+class SchedulerStats:
+    """Queue depth and wait time metrics for a scheduler."""
+
+    requests: int = 0
+    in_flight: int = 0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    last_wait: float = 0.0
+    max_wait: float = 0.0
+    total_wait: float = 0.0
+
+    @property
+    def average_wait(self) -> float:
+        return self.total_wait / self.requests if self.requests else 0.0
+
+    def as_dict(self) -> dict:
+        return {**asdict(self), "average_wait": self.average_wait}
+
+
+class RequestScheduler:
+    """Limits concurrent requests to a single fire and orders the backlog by priority."""
+
+    def __init__(self, max_in_flight: int = 1) -> None:
+        self.max_in_flight = max_in_flight
+        self.stats = SchedulerStats()
+        self._queue: list[tuple[int, int, asyncio.Future]] = []
+        self._counter = itertools.count()
+
+    @asynccontextmanager
+    async def slot(self, priority: RequestPriority = RequestPriority.POLL):
+        """Hold one in-flight slot for the duration of the block."""
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def acquire(self, priority: RequestPriority = RequestPriority.POLL) -> None:
+        """Wait until a slot is free, serving higher priorities first."""
+        started = time.monotonic()
+
+        if self.stats.in_flight < self.max_in_flight and not self.stats.queue_depth:
+            self.stats.in_flight += 1
+        else:
+            future = asyncio.get_running_loop().create_future()
+            heapq.heappush(self._queue, (priority, next(self._counter), future))
+            self.stats.queue_depth += 1
+            self.stats.max_queue_depth = max(self.stats.max_queue_depth, self.stats.queue_depth)
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    # The slot was handed over just as we were cancelled, pass it on
+                    self.release()
+                else:
+                    future.cancel()
+                    self.stats.queue_depth -= 1
+                raise
+
+        wait = time.monotonic() - started
+        self.stats.requests += 1
+        self.stats.last_wait = wait
+        self.stats.max_wait = max(self.stats.max_wait, wait)
+        self.stats.total_wait += wait
+
+    def release(self) -> None:
+        """Release a slot, handing it to the next queued request if there is one."""
+        while self._queue:
+            _priority, _order, future = heapq.heappop(self._queue)
+            if not future.done():
+                self.stats.queue_depth -= 1
+                future.set_result(None)
+                return
+        self.stats.in_flight -= 1
+
+
+_SCHEDULERS: weakref.WeakValueDictionary[str, RequestScheduler] = weakref.WeakValueDictionary()
+
+
+def get_scheduler(host: str, max_in_flight: int = 1) -> RequestScheduler:
+    """Return the scheduler shared by every client talking to ``host``."""
+    scheduler = _SCHEDULERS.get(host)
+    if scheduler is None:
+        scheduler = RequestScheduler(max_in_flight)
+        _SCHEDULERS[host] = scheduler
+    return scheduler
@@ -0,0 +1,88 @@
+"""Single-flight deduplication of identical fetches.
+
+A scheduled poll, a refresh requested after a command and diagnostics can
+all ask for the device at the same moment, and each used to fetch it in
+full. Callers of the same key now share one in-flight fetch, and callers
+shortly after can reuse its result while it is younger than ``max_age``.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from typing import Any
+
+
+@dataclass
+class SingleFlightStats:
+    """How many calls were served by a fetch of their own, or deduplicated."""
+
+    calls: int = 0
+    fetches: int = 0
+    joined: int = 0
+    reused: int = 0
+
+    @property
+    def deduplicated(self) -> int:
+        """Calls that did not need a fetch of their own."""
+        return self.joined + self.reused
+
+    def as_dict(self) -> dict:
+        return {**asdict(self), "deduplicated": self.deduplicated}
+
+
+class SingleFlight:
+    """Runs at most one fetch per key at a time and shares its result."""
+
+    def __init__(self) -> None:
+        self.stats = SingleFlightStats()
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._results: dict[str, tuple[float, Any]] = {}
+
+    async def run(self, key: str, fetch: Callable[[], Awaitable[Any]], max_age: float = 0.0) -> Any:
+        """Return the result of ``fetch``, shared with every concurrent caller of ``key``.
+
+        The fetch runs in its own task, so a caller giving up does not cancel
+        it for the others. Failures are passed to every waiting caller and
+        never reused.
+
+        Args:
+            key: What is being fetched
+            fetch: Starts the fetch when none is running
+            max_age: Seconds a finished fetch's result may be handed out again
+        """
+        self.stats.calls += 1
+        result = self._results.get(key)
+        if result is not None and time.monotonic() - result[0] < max_age:
+            self.stats.reused += 1
+            return result[1]
+
+        task = self._inflight.get(key)
+        if task is None:
+            self.stats.fetches += 1
+            task = self._inflight[key] = asyncio.ensure_future(fetch())
+            task.add_done_callback(lambda done: self._finished(key, done))
+        else:
+            self.stats.joined += 1
+        return await asyncio.shield(task)
+
+    def running(self, key: str) -> bool:
+        """Return whether a fetch of ``key`` is in flight."""
+        return key in self._inflight
+
+    def forget(self, key: str) -> None:
+        """Make the next call of ``key`` fetch again, e.g. after a command changed the device."""
+        self._results.pop(key, None)
+        self._inflight.pop(key, None)
+
+    def _finished(self, key: str, task: asyncio.Future) -> None:
+        # A fetch forgotten while running may predate a command, its result is not kept
+        current = self._inflight.get(key) is task
+        if current:
+            del self._inflight[key]
+        if task.cancelled():
+            return
+        # Retrieved here so a failure nobody waited for is not logged as never retrieved
+        if task.exception() is None and current:
+            self._results[key] = (time.monotonic(), task.result())
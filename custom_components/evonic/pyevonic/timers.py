@@ -0,0 +1,254 @@
+"""Timer schedules stored on an Evonic Fire.
+
+The firmware runs its own timer engine from /timer.save.json, so schedules
+keep working when the network or Home Assistant is down. The file holds a
+list of entries stored in pairs sharing an ``id``: one turning the fire or
+heater on, one turning it off. A ``Schedule`` is one such pair. Entries
+that do not form a pair this client understands are kept as they are.
+"""
+from __future__ import annotations
+
+import random
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from typing import Any
+
+FIRE = "Fire"
+HEATER = "Heater"
+TARGETS = (FIRE, HEATER)
+
+# Position of each weekday (0=Monday) in the firmware's day mask, which starts on Sunday
+_MASK_INDEX = (1, 2, 3, 4, 5, 6, 0)
+
+
+def _parse_days(mask: str) -> frozenset[int]:
+    return frozenset(weekday for weekday, index in enumerate(_MASK_INDEX) if mask[index:index + 1] == "1")
+
+
+def _format_days(days: Iterable[int]) -> str:
+    mask = ["0"] * 7
+    for weekday in days:
+        mask[_MASK_INDEX[weekday]] = "1"
+    return "".join(mask)
+
+
+def _parse_command(command: Any) -> tuple[str, bool] | None:
+    """Return the target and on/off state of a ``com1`` like ``voice Fire_ON``."""
+    if not isinstance(command, str) or not command.startswith("voice "):
+        return None
+    target, _, state = command[6:].partition("_")
+    if target not in TARGETS or state not in ("ON", "OFF"):
+        return None
+    return target, state == "ON"
+
+
+@dataclass(frozen=True, slots=True)
+class Schedule:
+    """Turn the fire or heater on at ``start`` and off at ``end`` on the given weekdays.
+
+    Args:
+        id: Identifier shared by the pair of timer entries on the fire
+        days: Weekdays the schedule runs on, 0 is Monday
+        start: Time to turn on
+        end: Time to turn off, before ``start`` means the next day. None only turns on
+        target: ``Fire`` or ``Heater``
+        active: Whether the fire runs the schedule
+    """
+
+    id: int
+    days: frozenset[int]
+    start: time
+    end: time | None = None
+    target: str = FIRE
+    active: bool = True
+
+    def __post_init__(self) -> None:
+        if self.target not in TARGETS:
+            raise ValueError(f"Unknown timer target {self.target!r}")
+        if any(not 0 <= day <= 6 for day in self.days):
+            raise ValueError(f"Weekdays must be 0-6, got {sorted(self.days)}")
+
+    def entries(self) -> list[dict[str, Any]]:
+        """Return the timer entries the firmware stores for this schedule."""
+        common = {"id": self.id, "day": _format_days(self.days), "run1": 0, "active": int(self.active)}
+        entries = [{**common, "time1": self.start.strftime("%H:%M:%S"), "com1": f"voice {self.target}_ON"}]
+        if self.end is not None:
+            entries.append({**common, "time1": self.end.strftime("%H:%M:%S"), "com1": f"voice {self.target}_OFF"})
+        return entries
+
+    def occurrences(self, start: datetime, end: datetime) -> Iterator[tuple[datetime, datetime]]:
+        """Yield the on and off times of each run overlapping ``start`` to ``end``.
+
+        Runs without an off time last one minute. Times take the time zone
+        of ``start``, which should be the fire's.
+        """
+        if not self.active or not self.days:
+            return
+
+        day: date = start.date() - timedelta(days=1)
+        while day <= end.date():
+            if day.weekday() in self.days:
+                on = datetime.combine(day, self.start, tzinfo=start.tzinfo)
+                if self.end is None:
+                    off = on + timedelta(minutes=1)
+                else:
+                    off = datetime.combine(day, self.end, tzinfo=start.tzinfo)
+                    if off <= on:
+                        off += timedelta(days=1)
+                if on < end and off > start:
+                    yield on, off
+            day += timedelta(days=1)
+
+    @classmethod
+    def from_entries(cls, entries: list[dict[str, Any]]) -> Schedule | None:
+        """Build a schedule from the entries sharing one id, None if they are not a pair it understands."""
+        on = off = None
+        target = None
+        for entry in entries:
+            command = _parse_command(entry.get("com1"))
+            if command is None or (target is not None and command[0] != target):
+                return None
+            target = command[0]
+            if command[1]:
+                if on is not None:
+                    return None
+                on = entry
+            else:
+                if off is not None:
+                    return None
+                off = entry
+
+        if on is None or (off is not None and (off.get("day"), off.get("active")) != (on.get("day"), on.get("active"))):
+            return None
+        try:
+            return cls(
+                id=int(on["id"]),
+                days=_parse_days(str(on.get("day", ""))),
+                start=time.fromisoformat(on["time1"]),
+                end=time.fromisoformat(off["time1"]) if off is not None else None,
+                target=target,
+                active=bool(int(on.get("active", 1))),
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+
+
+@dataclass(frozen=True, slots=True)
+class TimerDiff:
+    """Schedules added, changed and removed between two timer tables."""
+
+    added: tuple[Schedule, ...] = ()
+    changed: tuple[Schedule, ...] = ()
+    removed: tuple[int, ...] = ()
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+
+@dataclass(frozen=True)
+class TimerTable:
+    """The timer schedules of a fire, plus any entries kept verbatim.
+
+    Tables are immutable, ``with_schedule`` and ``without_schedule`` return
+    a new table to hand to ``Evonic.set_timers``.
+    """
+
+    schedules: dict[int, Schedule] = field(default_factory=dict)
+    other: tuple[dict[str, Any], ...] = ()
+    # The entries each schedule was read from, written back untouched while it is unchanged
+    _source: dict[int, tuple[Schedule, list[dict[str, Any]]]] = field(default_factory=dict, repr=False, compare=False)
+    _wrapped: bool = field(default=True, repr=False, compare=False)
+
+    @classmethod
+    def parse(cls, data: Any) -> TimerTable:
+        """Build a table from the contents of /timer.save.json.
+
+        Raises:
+            ValueError: The data is not a timer list
+        """
+        wrapped = isinstance(data, dict)
+        entries = data.get("timer", []) if wrapped else data
+        if not isinstance(entries, list):
+            raise ValueError("Timer data has no timer list")
+
+        groups: dict[Any, list[dict[str, Any]]] = {}
+        for entry in entries:
+            if not isinstance(entry, dict):
+                raise ValueError(f"Unexpected timer entry {entry!r}")
+            groups.setdefault(entry.get("id"), []).append(entry)
+
+        schedules = {}
+        source = {}
+        other = []
+        for group in groups.values():
+            schedule = Schedule.from_entries(group)
+            if schedule is None or schedule.id in schedules:
+                other.extend(group)
+            else:
+                schedules[schedule.id] = schedule
+                source[schedule.id] = (schedule, group)
+        return cls(schedules, tuple(other), source, wrapped)
+
+    def __iter__(self) -> Iterator[Schedule]:
+        return iter(self.schedules.values())
+
+    def __len__(self) -> int:
+        return len(self.schedules)
+
+    def get(self, schedule_id: int) -> Schedule | None:
+        return self.schedules.get(schedule_id)
+
+    def new_id(self) -> int:
+        """Return an unused schedule id, random like the ones the Evonic app picks."""
+        taken = set(self.schedules) | {entry.get("id") for entry in self.other}
+        while (schedule_id := random.randint(1000, 9999)) in taken:
+            pass
+        return schedule_id
+
+    def with_schedule(self, schedule: Schedule) -> TimerTable:
+        """Return a table with ``schedule`` added, or replacing the one with its id."""
+        return TimerTable({**self.schedules, schedule.id: schedule}, self.other, self._source, self._wrapped)
+
+    def without_schedule(self, schedule_id: int) -> TimerTable:
+        """Return a table without the schedule ``schedule_id``.
+
+        Raises:
+            KeyError: There is no such schedule
+        """
+        if schedule_id not in self.schedules:
+            raise KeyError(schedule_id)
+        schedules = {key: value for key, value in self.schedules.items() if key != schedule_id}
+        return TimerTable(schedules, self.other, self._source, self._wrapped)
+
+    def rebase(self, current: TimerTable) -> TimerTable:
+        """Return this table's schedules on top of the entries ``current`` was read from.
+
+        Keeps entries this table was not built from, e.g. ones added in the
+        Evonic app since it was read.
+        """
+        return TimerTable(self.schedules, current.other, current._source, current._wrapped)
+
+    def diff(self, other: TimerTable) -> TimerDiff:
+        """Return what changes going from this table to ``other``."""
+        return TimerDiff(
+            added=tuple(schedule for key, schedule in other.schedules.items() if key not in self.schedules),
+            changed=tuple(
+                schedule for key, schedule in other.schedules.items()
+                if key in self.schedules and self.schedules[key] != schedule
+            ),
+            removed=tuple(key for key in self.schedules if key not in other.schedules),
+        )
+
+    def as_payload(self) -> Any:
+        """Return the contents of /timer.save.json for this table, in the shape it was read in.
+
+        Entries of unchanged schedules are written back as read, so the
+        firmware's record of which timers already ran today is kept.
+        """
+        entries = []
+        for schedule in self.schedules.values():
+            source = self._source.get(schedule.id)
+            entries.extend(source[1] if source is not None and source[0] == schedule else schedule.entries())
+        entries.extend(self.other)
+        return {"timer": entries} if self._wrapped else entries
@@ -12,9 +12,11 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from .coordinator import EvonicCoordinator
 from .const import DOMAIN
 from .models import EvonicEntity
-from .pyevonic import Device as EvonicDevice
+from .pyevonic import Device as EvonicDevice, RequestMetrics
 from homeassistant.const import (
+    UnitOfInformation,
     UnitOfPower,
+    UnitOfTime,
     SIGNAL_STRENGTH_DECIBELS_MILLIWATT)
 
 from homeassistant.components.sensor import (
@@ -39,6 +41,22 @@ class EvonicSensorEntityDescription(
     """Describes Evonic sensor entity."""
 
     exists_fn: Callable[[EvonicDevice], bool] = lambda _: True
+    # Device fields value_fn reads, e.g. "info.led_power"; None means any field
+    depends_on: frozenset[str] | None = None
+
+
+@dataclass
+class EvonicMetricSensorEntityDescriptionMixin:
+    """Mixin for required keys."""
+
+    value_fn: Callable[[RequestMetrics], StateType]
+
+
+@dataclass
+class EvonicMetricSensorEntityDescription(
+    SensorEntityDescription, EvonicMetricSensorEntityDescriptionMixin
+):
+    """Describes an Evonic request metric sensor entity."""
 
 
 SENSORS: tuple[EvonicSensorEntityDescription, ...] = (
@@ -50,7 +68,8 @@ SENSORS: tuple[EvonicSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.SIGNAL_STRENGTH,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda device: device.network.signal_strength
+        value_fn=lambda device: device.network.signal_strength,
+        depends_on=frozenset({"network.signal_strength"}),
     ),
     EvonicSensorEntityDescription(
         key="current_heater_usage",
@@ -60,6 +79,7 @@ SENSORS: tuple[EvonicSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
         value_fn=lambda device: device.info.heater_power if device.climate.heating else 0,
+        depends_on=frozenset({"info.heater_power", "climate.heating"}),
     ),
     EvonicSensorEntityDescription(
         key="current_led_usage",
@@ -69,6 +89,7 @@ SENSORS: tuple[EvonicSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
         value_fn=lambda device: device.info.led_power if device.info.on else 0,
+        depends_on=frozenset({"info.led_power", "info.on"}),
     ),
     EvonicSensorEntityDescription(
         key="current_total_usage",
@@ -79,6 +100,7 @@ SENSORS: tuple[EvonicSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         value_fn=lambda device: (device.info.led_power if device.info.on else 0) + (
             device.info.heater_power if device.climate.heating else 0),
+        depends_on=frozenset({"info.led_power", "info.on", "info.heater_power", "climate.heating"}),
     ),
     EvonicSensorEntityDescription(
         key="cost_per_hour",
@@ -86,7 +108,8 @@ SENSORS: tuple[EvonicSensorEntityDescription, ...] = (
         entity_category=EntityCategory.DIAGNOSTIC,
         device_class=SensorDeviceClass.MONETARY,
         state_class=SensorStateClass.TOTAL,
-        value_fn=lambda device: calculate_cost(device)
+        value_fn=lambda device: calculate_cost(device),
+        depends_on=frozenset({"info.led_power", "info.on", "info.heater_power", "climate.heating", "info.cost"}),
     ),
     EvonicSensorEntityDescription(
         key="cost_per_kwh",
@@ -95,6 +118,58 @@ SENSORS: tuple[EvonicSensorEntityDescription, ...] = (
         entity_category=EntityCategory.DIAGNOSTIC,
         device_class=SensorDeviceClass.MONETARY,
         value_fn=lambda device: device.info.cost if device.info.cost else 0,
+        depends_on=frozenset({"info.cost"}),
+    ),
+)
+
+# Disabled by default, for looking into how a fire behaves on the network
+METRIC_SENSORS: tuple[EvonicMetricSensorEntityDescription, ...] = (
+    EvonicMetricSensorEntityDescription(
+        key="http_latency",
+        name="HTTP Latency",
+        icon="mdi:timer-outline",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda metrics: round(metrics.transports["http"].last_latency * 1000, 1),
+    ),
+    EvonicMetricSensorEntityDescription(
+        key="request_timeouts",
+        name="Request Timeouts",
+        icon="mdi:timer-alert-outline",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda metrics: sum(transport.timeouts for transport in metrics.transports.values()),
+    ),
+    EvonicMetricSensorEntityDescription(
+        key="websocket_fallbacks",
+        name="WebSocket Fallbacks",
+        icon="mdi:swap-horizontal",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda metrics: metrics.transports["http"].fallbacks,
+    ),
+    EvonicMetricSensorEntityDescription(
+        key="bytes_read",
+        name="Bytes Read",
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda metrics: sum(transport.bytes_read for transport in metrics.transports.values()),
+    ),
+    EvonicMetricSensorEntityDescription(
+        key="last_request_error",
+        name="Last Request Error",
+        icon="mdi:alert-circle-outline",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda metrics: (metrics.last_error or "")[:255] or None,
     ),
 )
 
@@ -111,6 +186,10 @@ async def async_setup_entry(
         for description in SENSORS
         if description.exists_fn(coordinator.data)
     )
+    async_add_entities(
+        EvonicMetricSensorEntity(coordinator, description)
+        for description in METRIC_SENSORS
+    )
 
 
 def calculate_cost(device):
@@ -139,6 +218,7 @@ class EvonicSensorEntity(EvonicEntity, SensorEntity):
         """Initialize a Evonic sensor entity."""
         super().__init__(coordinator=coordinator)
         self.entity_description = description
+        self._depends_on = description.depends_on
         self._attr_unique_id = f"{coordinator.data.network.mac}_{description.key}"
 
     @property
@@ -151,4 +231,25 @@ class EvonicSensorEntity(EvonicEntity, SensorEntity):
     @property
     def native_value(self) -> datetime | StateType:
         """Return the state of the sensor."""
-        return self.entity_description.value_fn(self.coordinator.data)
\ No newline at end of file
+        return self.entity_description.value_fn(self.coordinator.data)
+
+
+class EvonicMetricSensorEntity(EvonicEntity, SensorEntity):
+    """Defines an Evonic sensor reporting on the requests made to the fire."""
+
+    entity_description: EvonicMetricSensorEntityDescription
+
+    def __init__(
+            self,
+            coordinator: EvonicCoordinator,
+            description: EvonicMetricSensorEntityDescription,
+    ) -> None:
+        """Initialize an Evonic metric sensor entity."""
+        super().__init__(coordinator=coordinator)
+        self.entity_description = description
+        self._attr_unique_id = f"{coordinator.data.network.mac}_{description.key}"
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the state of the sensor."""
+        return self.entity_description.value_fn(self.coordinator.evonic.metrics)
@@ -0,0 +1,59 @@
+"""Sets the integration up in a Home Assistant instance of its own, against the fire simulator."""
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+from types import SimpleNamespace
+
+from homeassistant import bootstrap, config_entries, loader
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.evonic.const import DOMAIN
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@asynccontextmanager
+async def setup_integration(config_dir: Path, address: str, enable_sensors: tuple[str, ...] = ()) -> AsyncIterator:
+    """Add a config entry for the fire at ``address`` and wait until its entities exist.
+
+    Args:
+        config_dir: An empty directory for the Home Assistant configuration
+        address: Host of the fire
+        enable_sensors: Unique ids of sensors disabled by default to enable
+
+    Yields:
+        Home Assistant and the entry's coordinator.
+    """
+    (config_dir / "custom_components").symlink_to(ROOT / "custom_components")
+    hass = HomeAssistant(str(config_dir))
+    hass.config.skip_pip = True
+    loader.async_setup(hass)
+    hass.config_entries = config_entries.ConfigEntries(hass, {})
+    await bootstrap.async_load_base_functionality(hass)
+    # The calendar component registers its API views, nothing serves them here
+    hass.http = SimpleNamespace(register_view=lambda view: None)
+    await hass.async_start()
+    # Dependencies of the manifest that need a full server, the integration does not use them here
+    hass.config.components.update({"ssdp", "network", "http", "websocket_api", "diagnostics"})
+
+    registry = er.async_get(hass)
+    for unique_id in enable_sensors:
+        registry.async_get_or_create("sensor", DOMAIN, unique_id)
+
+    try:
+        await hass.config_entries.flow.async_init(DOMAIN, context={"source": "user"}, data={CONF_HOST: address})
+        await hass.async_block_till_done()
+        entry = hass.config_entries.async_entries(DOMAIN)[0]
+        coordinator = hass.data[DOMAIN][entry.entry_id]
+        await coordinator.evonic.wait_for_config()
+        await hass.async_block_till_done()
+        yield hass, coordinator
+    finally:
+        # Closes the client sessions, which stopping Home Assistant leaves open
+        for entry in hass.config_entries.async_entries(DOMAIN):
+            await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_stop(force=True)
@@ -0,0 +1,15 @@
+"""Shared setup for the pyevonic unit tests.
+
+The tests import pyevonic and the fire simulator the way the benchmarks do.
+The integration directory is appended to ``sys.path``, not inserted, so its
+calendar.py does not shadow the standard library module. The repository
+root is added too, for the few tests of the integration itself, which are
+skipped when Home Assistant is not installed.
+"""
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT / "custom_components" / "evonic"))
+sys.path.append(str(ROOT / "benchmarks"))
+sys.path.append(str(ROOT))
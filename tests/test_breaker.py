@@ -0,0 +1,67 @@
+"""Tests for the per-transport circuit breaker."""
+from pyevonic import BreakerState, CircuitBreaker
+
+
+def _open(breaker):
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure("timeout")
+
+
+def test_opens_after_the_failure_threshold():
+    breaker = CircuitBreaker("http", failure_threshold=3)
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state is BreakerState.CLOSED
+    assert breaker.allow()
+
+    breaker.record_failure(OSError("unreachable"))
+    assert breaker.state is BreakerState.OPEN
+    assert not breaker.allow()
+    assert breaker.as_dict() == {
+        "state": "open",
+        "failures": 3,
+        "trips": 1,
+        "rejected": 1,
+        "last_error": "unreachable",
+    }
+
+
+def test_success_resets_failures():
+    breaker = CircuitBreaker("http", failure_threshold=2)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state is BreakerState.CLOSED
+
+
+def test_half_open_lets_one_probe_through():
+    breaker = CircuitBreaker("websocket", reset_timeout=60)
+    _open(breaker)
+    breaker._opened_at -= 60
+    assert breaker.state is BreakerState.HALF_OPEN
+
+    assert breaker.allow()
+    # Open again until the probe reports back
+    assert not breaker.allow()
+
+
+def test_failed_probe_reopens_without_another_trip():
+    breaker = CircuitBreaker("http", reset_timeout=60)
+    _open(breaker)
+    breaker._opened_at -= 60
+    assert breaker.allow()
+
+    breaker.record_failure("timeout")
+    assert breaker.state is BreakerState.OPEN
+    assert breaker.trips == 1
+
+
+def test_successful_probe_closes():
+    breaker = CircuitBreaker("http", reset_timeout=60)
+    _open(breaker)
+    breaker._opened_at -= 60
+    assert breaker.allow()
+
+    breaker.record_success()
+    assert breaker.state is BreakerState.CLOSED
+    assert breaker.failures == 0
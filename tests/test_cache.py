@@ -0,0 +1,49 @@
+"""Tests for handing a config flow's snapshot to the entry it creates."""
+import asyncio
+import time
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.evonic.cache import EvonicConfigCache  # noqa: E402
+
+SNAPSHOT = {"mac": "AA:BB:CC:DD:EE:FF"}
+
+
+def _cache(tmp_path, handle):
+    async def main():
+        hass = HomeAssistant(str(tmp_path))
+        try:
+            return handle(EvonicConfigCache(hass))
+        finally:
+            await hass.async_stop(force=True)
+
+    return asyncio.run(main())
+
+
+def test_handoff_is_taken_once(tmp_path):
+    def handle(cache):
+        cache.hand_off("192.0.2.1", SNAPSHOT)
+        return cache.take_handoff("192.0.2.2"), cache.take_handoff("192.0.2.1"), cache.take_handoff("192.0.2.1")
+
+    assert _cache(tmp_path, handle) == (None, SNAPSHOT, None)
+
+
+def test_stale_handoff_is_dropped(tmp_path):
+    def handle(cache):
+        # Handed over by a flow that finished two minutes ago
+        cache._handoffs["192.0.2.1"] = (time.monotonic() - 120, SNAPSHOT)
+        return cache.take_handoff("192.0.2.1")
+
+    assert _cache(tmp_path, handle) is None
+
+
+def test_failed_validation_hands_nothing_over(tmp_path):
+    def handle(cache):
+        cache.hand_off("192.0.2.1", None)
+        return cache.take_handoff("192.0.2.1")
+
+    assert _cache(tmp_path, handle) is None
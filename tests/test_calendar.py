@@ -0,0 +1,66 @@
+"""Tests for the calendar of the fire's timer schedules."""
+import asyncio
+from datetime import timedelta
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from homeassistant.util import dt as dt_util  # noqa: E402
+
+from common import setup_integration  # noqa: E402
+from pyevonic.refresh import TIMERS  # noqa: E402
+from simulator import FireSimulator  # noqa: E402
+
+
+class BusyTimersFire(FireSimulator):
+    """A fire whose timer list fails with a server error once."""
+
+    failures = 1
+
+    def _route(self, method, target, headers, payload):
+        if target == TIMERS and self.failures:
+            self.failures -= 1
+            self.stats.paths[TIMERS] += 1
+            return 503, b"Busy", "text/plain"
+        return super()._route(method, target, headers, payload)
+
+
+async def _settle(done):
+    """Wait for the calendar's background read, which async_block_till_done does not wait for."""
+    for _ in range(100):
+        if done():
+            return
+        await asyncio.sleep(0.01)
+
+
+def test_unreadable_timers_do_not_hold_up_setup(tmp_path):
+    async def main():
+        async with BusyTimersFire() as fire:
+            async with setup_integration(tmp_path, fire.address) as (hass, coordinator):
+                await _settle(lambda: fire.stats.paths[TIMERS])
+                await hass.async_block_till_done()
+                (state,) = hass.states.async_all("calendar")
+                calendar = hass.data["calendar"].get_entity(state.entity_id)
+                assert coordinator.evonic.timers is None
+
+                # Read again when the calendar is asked for its events
+                now = dt_util.now()
+                events = await calendar.async_get_events(hass, now, now + timedelta(days=7))
+                return events, fire.stats.paths[TIMERS]
+
+    events, reads = asyncio.run(main())
+    assert events
+    assert reads == 2
+
+
+def test_timers_load_in_the_background(tmp_path):
+    async def main():
+        async with FireSimulator() as fire:
+            async with setup_integration(tmp_path, fire.address) as (hass, coordinator):
+                await _settle(lambda: coordinator.evonic.timers is not None)
+                return coordinator.evonic.timers, hass.states.async_all("calendar")
+
+    timers, states = asyncio.run(main())
+    assert len(timers) == 1
+    assert len(states) == 1
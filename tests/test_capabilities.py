@@ -0,0 +1,126 @@
+"""Tests for remembering what a fire's firmware serves."""
+import asyncio
+import time
+from datetime import timedelta
+
+from pyevonic import CapabilityMap, Evonic
+from pyevonic.capabilities import HTTP, RESPONSIVE_WINDOW, WEBSOCKET
+from pyevonic.refresh import EFFECTS
+from simulator import FireSimulator
+
+
+def test_unknown_until_recorded():
+    capabilities = CapabilityMap()
+    assert capabilities.supports(EFFECTS) is None
+    capabilities.record(EFFECTS, False)
+    assert capabilities.supports(EFFECTS) is False
+
+
+def test_repeated_timeouts_mark_unsupported():
+    capabilities = CapabilityMap()
+    capabilities.record(HTTP, True)
+    capabilities.record_timeout(WEBSOCKET)
+    assert capabilities.supports(WEBSOCKET) is None
+    capabilities.record_timeout(WEBSOCKET)
+    assert capabilities.supports(WEBSOCKET) is False
+
+
+def test_timeouts_of_an_unresponsive_fire_do_not_count():
+    capabilities = CapabilityMap()
+    for _ in range(5):
+        capabilities.record_timeout(WEBSOCKET)
+    assert capabilities.supports(WEBSOCKET) is None
+
+    capabilities.record(HTTP, True)
+    capabilities._answered -= RESPONSIVE_WINDOW + 1
+    for _ in range(5):
+        capabilities.record_timeout(WEBSOCKET)
+    assert capabilities.supports(WEBSOCKET) is None
+
+
+def test_timed_out_endpoints_are_tried_again_after_the_ttl():
+    capabilities = CapabilityMap(ttl=timedelta(hours=1))
+    capabilities.record(HTTP, True)
+    capabilities.record_timeout(WEBSOCKET)
+    capabilities.record_timeout(WEBSOCKET)
+    assert capabilities.supports(WEBSOCKET) is False
+
+    restored = CapabilityMap()
+    restored.restore(capabilities.as_dict())
+    assert restored.supports(WEBSOCKET) is False
+    restored._retry_at[WEBSOCKET] = time.time() - 1
+    assert restored.supports(WEBSOCKET) is None
+
+
+def test_success_clears_counted_timeouts():
+    capabilities = CapabilityMap()
+    capabilities.record(HTTP, True)
+    capabilities.record_timeout(WEBSOCKET)
+    capabilities.record(WEBSOCKET, True)
+    capabilities.record_timeout(WEBSOCKET)
+    assert capabilities.supports(WEBSOCKET) is True
+
+
+def test_new_firmware_build_forgets_everything():
+    capabilities = CapabilityMap(ttl=timedelta(0))
+    assert capabilities.confirm("build-1")
+    capabilities.record(EFFECTS, False)
+    assert capabilities.expired
+    assert not capabilities.confirm("build-1")
+    assert capabilities.supports(EFFECTS) is False
+    assert capabilities.confirm("build-2")
+    assert capabilities.supports(EFFECTS) is None
+
+
+def test_round_trips_through_as_dict():
+    capabilities = CapabilityMap()
+    capabilities.confirm("build-1")
+    capabilities.record(EFFECTS, False)
+    restored = CapabilityMap()
+    restored.restore(capabilities.as_dict())
+    assert restored.build == "build-1"
+    assert restored.supports(EFFECTS) is False
+
+
+def test_missing_effects_endpoint_is_not_asked_for_again():
+    async def main():
+        async with FireSimulator(effects_endpoint=False) as fire:
+            async with Evonic(fire.address) as evonic:
+                await evonic.get_config()
+                first = fire.stats.paths[EFFECTS]
+                device = await evonic.refresh(EFFECTS)
+                return first, fire.stats.paths[EFFECTS], evonic.capabilities.supports(EFFECTS), device
+
+    first, total, supported, device = asyncio.run(main())
+    assert (first, total) == (1, 1)
+    assert supported is False
+    # The built-in effects of the model are still offered
+    assert device.effects.available_effects
+
+
+class FlakyEffectsFire(FireSimulator):
+    """A fire whose effect list fails with a server error once."""
+
+    failures = 1
+
+    def _route(self, method, target, headers, payload):
+        if target == EFFECTS and self.failures:
+            self.failures -= 1
+            self.stats.paths[EFFECTS] += 1
+            return 503, b"Busy", "text/plain"
+        return super()._route(method, target, headers, payload)
+
+
+def test_a_server_error_does_not_hide_the_effect_list():
+    async def main():
+        async with FlakyEffectsFire() as fire:
+            async with Evonic(fire.address) as evonic:
+                await evonic.get_config()
+                after_error = evonic.capabilities.supports(EFFECTS)
+                device = await evonic.refresh(EFFECTS)
+                return after_error, evonic.capabilities.supports(EFFECTS), device, fire
+
+    after_error, supported, device, fire = asyncio.run(main())
+    assert after_error is None
+    assert supported is True
+    assert fire.effect_list["effect"][0] in device.effects.available_effects
@@ -0,0 +1,122 @@
+"""Tests for last-write-wins command coalescing."""
+import asyncio
+import gc
+
+import pytest
+
+from pyevonic import CommandCoalescer
+
+
+def test_only_the_last_value_in_a_window_is_sent():
+    async def main():
+        coalescer = CommandCoalescer(window=0.02)
+        sent = []
+
+        async def send(value):
+            sent.append(value)
+            return f"sent {value}"
+
+        results = await asyncio.gather(*(coalescer.submit("templevel", value, send) for value in (20, 21, 22)))
+        return sent, results, coalescer
+
+    sent, results, coalescer = asyncio.run(main())
+    assert sent == [22]
+    assert results == ["sent 22"] * 3
+    assert coalescer.sent == 1
+    assert coalescer.superseded == 2
+
+
+def test_families_are_sent_separately():
+    async def main():
+        coalescer = CommandCoalescer(window=0.02)
+        sent = []
+
+        async def send(value):
+            sent.append(value)
+
+        await asyncio.gather(coalescer.submit("templevel", 20, send), coalescer.submit("brightness", 50, send))
+        return sorted(sent)
+
+    assert asyncio.run(main()) == [20, 50]
+
+
+def test_failure_reaches_every_caller():
+    async def main():
+        coalescer = CommandCoalescer(window=0.02)
+
+        async def send(value):
+            raise RuntimeError("fire unreachable")
+
+        return await asyncio.gather(
+            coalescer.submit("templevel", 20, send),
+            coalescer.submit("templevel", 21, send),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(main())
+    assert [str(result) for result in results] == ["fire unreachable"] * 2
+
+
+def test_flush_runs_after_its_caller_is_cancelled(caplog):
+    async def main():
+        coalescer = CommandCoalescer(window=0.02)
+        sent = []
+
+        async def send(value):
+            sent.append(value)
+            raise RuntimeError("fire unreachable")
+
+        caller = asyncio.create_task(coalescer.submit("templevel", 20, send))
+        await asyncio.sleep(0)
+        held = len(coalescer._tasks)
+        caller.cancel()
+        # The flush must survive a garbage collection while nobody awaits it
+        gc.collect()
+        await asyncio.sleep(0.05)
+        return sent, held, len(coalescer._tasks)
+
+    sent, held, left = asyncio.run(main())
+    gc.collect()
+    assert sent == [20]
+    assert (held, left) == (1, 0)
+    assert "never retrieved" not in caplog.text
+
+
+def test_cancelled_caller_does_not_cancel_the_others():
+    async def main():
+        coalescer = CommandCoalescer(window=0.02)
+
+        async def send(value):
+            return value
+
+        first = asyncio.create_task(coalescer.submit("templevel", 20, send))
+        second = asyncio.create_task(coalescer.submit("templevel", 21, send))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(main()) == 21
+
+
+def test_a_cancelled_flush_releases_its_callers():
+    async def main():
+        coalescer = CommandCoalescer(window=10)
+        sent = []
+
+        async def send(value):
+            sent.append(value)
+
+        waiting = asyncio.create_task(coalescer.submit("templevel", 20, send))
+        await asyncio.sleep(0)
+        await coalescer.close()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+
+        # The family is not stuck on the cancelled window
+        coalescer.window = 0.01
+        await coalescer.submit("templevel", 21, send)
+        return sent
+
+    assert asyncio.run(main()) == [21]
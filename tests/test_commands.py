@@ -0,0 +1,84 @@
+"""Tests for commands applying their expected state before the fire confirms it."""
+import asyncio
+
+import pytest
+
+from pyevonic import Evonic, EvonicError
+from simulator import FireSimulator
+
+
+class DeafFire(FireSimulator):
+    """A fire that answers polls but fails every command."""
+
+    def _route(self, method, target, headers, payload):
+        if target.startswith(("/voice", "/cmd")):
+            return 500, b"Busy", "text/plain"
+        return super()._route(method, target, headers, payload)
+
+
+def test_command_state_is_published_before_the_fire_answers():
+    async def main():
+        async with FireSimulator(latency=0.2) as fire:
+            async with Evonic(fire.address) as evonic:
+                await evonic.get_device()
+                evonic.pop_changes()
+                published = []
+                evonic.add_listener(lambda: published.append((evonic._device.info.on, fire.live["Fire"])))
+
+                command = asyncio.create_task(evonic.power("on"))
+                await asyncio.sleep(0.05)
+                changes = evonic.pop_changes()
+                await command
+                return published, changes, fire.live["Fire"]
+
+    published, changes, fire_on = asyncio.run(main())
+    # The device showed the fire on while the fire itself had not been told yet
+    assert published == [(1, 0)]
+    assert changes == {"info.on"}
+    assert fire_on == 1
+
+
+def test_command_state_is_rolled_back_when_sending_fails():
+    async def main():
+        async with DeafFire() as fire:
+            async with Evonic(fire.address, command_window=0) as evonic:
+                device = await evonic.get_device()
+                published = []
+                evonic.add_listener(lambda: published.append((device.info.on, device.climate.target_temp)))
+                with pytest.raises(EvonicError):
+                    await evonic.power("on")
+                with pytest.raises(EvonicError):
+                    await evonic.set_temperature(25)
+                return published, device.info.on, device.climate.target_temp
+
+    published, on, target = asyncio.run(main())
+    assert (on, target) == (0, 21)
+    # Each command was shown, then taken back
+    assert published == [(1, 21), (0, 21), (0, 25), (0, 21)]
+
+
+def test_poll_after_a_command_is_not_reused_from_before_it():
+    async def main():
+        async with FireSimulator() as fire:
+            async with Evonic(fire.address, device_max_age=60) as evonic:
+                await evonic.get_device()
+                await evonic.power("on")
+                fire.reset_stats()
+                await evonic.get_device()
+                return fire.stats.paths["/config.live.json"]
+
+    assert asyncio.run(main()) == 1
+
+
+def test_removed_listener_is_not_called():
+    async def main():
+        async with FireSimulator() as fire:
+            async with Evonic(fire.address) as evonic:
+                await evonic.get_device()
+                published = []
+                remove = evonic.add_listener(lambda: published.append(True))
+                remove()
+                await evonic.power("on")
+                return published
+
+    assert asyncio.run(main()) == []
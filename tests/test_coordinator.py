@@ -0,0 +1,47 @@
+"""Tests for the coordinator timing its polls on the fire's phase of the interval."""
+import asyncio
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from common import setup_integration  # noqa: E402
+from simulator import FireSimulator  # noqa: E402
+
+
+def test_polls_follow_the_hub_phase(tmp_path):
+    async def main():
+        async with FireSimulator() as fire:
+            async with setup_integration(tmp_path, fire.address) as (hass, coordinator):
+                assert coordinator.update_interval is None
+                hub = coordinator.hub
+                scheduled = []
+
+                def next_poll(coord, now, interval):
+                    scheduled.append(interval)
+                    return now + 0.05
+
+                hub.next_poll = next_poll
+                coordinator.evonic.device_max_age = 0
+                coordinator.async_set_updated_data(coordinator.data)
+                polls = hub.stats.polls
+                await asyncio.sleep(0.3)
+                # Each poll schedules the next one, on the interval the coordinator chose
+                assert hub.stats.polls - polls >= 2
+                assert scheduled[-1] == coordinator.poll_interval.total_seconds()
+            return coordinator
+
+    coordinator = asyncio.run(main())
+    assert coordinator._unsub_poll is None
+
+
+def test_disabled_polling_schedules_nothing(tmp_path):
+    async def main():
+        async with FireSimulator() as fire:
+            async with setup_integration(tmp_path, fire.address) as (hass, coordinator):
+                coordinator._cancel_poll()
+                coordinator.config_entry.pref_disable_polling = True
+                coordinator.async_set_updated_data(coordinator.data)
+                assert coordinator._unsub_poll is None
+
+    asyncio.run(main())
@@ -0,0 +1,59 @@
+"""Tests for time budgets shared by the requests of an operation."""
+import asyncio
+import time
+
+import pytest
+
+from pyevonic import Evonic, EvonicConnectionTimeoutError
+from pyevonic.deadline import Deadline, current_deadline, deadline
+from simulator import FireSimulator
+
+
+def test_never_outlasts_its_parent():
+    parent = Deadline(1.0)
+    child = Deadline(60.0, parent)
+    assert child.expires == parent.expires
+    assert Deadline(0.5, parent).expires < parent.expires
+
+
+def test_step_timeout_is_capped_by_what_is_left():
+    budget = Deadline(1.0)
+    assert budget.timeout(0.1) == 0.1
+    assert budget.timeout(30.0) <= 1.0
+    spent = Deadline(0.0)
+    assert spent.expired
+    assert spent.timeout(30.0) == 0.0
+
+
+def test_deadline_is_current_inside_the_block_only():
+    async def main():
+        async with deadline(5.0) as outer:
+            async with deadline(10.0) as inner:
+                assert current_deadline() is inner
+                assert inner.expires == outer.expires
+            assert current_deadline() is outer
+        return current_deadline()
+
+    assert asyncio.run(main()) is None
+
+
+def test_running_out_raises_a_timeout_error():
+    async def main():
+        async with deadline(0.05):
+            await asyncio.sleep(5)
+
+    with pytest.raises(EvonicConnectionTimeoutError):
+        asyncio.run(main())
+
+
+def test_a_slow_fire_is_given_up_on_when_the_budget_runs_out():
+    async def main():
+        async with FireSimulator(latency=2.0) as fire:
+            async with Evonic(fire.address) as evonic:
+                started = time.monotonic()
+                with pytest.raises(EvonicConnectionTimeoutError):
+                    async with deadline(0.3):
+                        await evonic.get_config()
+                return time.monotonic() - started
+
+    assert asyncio.run(main()) < 1.0
@@ -0,0 +1,36 @@
+"""Tests for creating entities before the whole configuration has loaded."""
+import asyncio
+
+from pyevonic import Evonic
+from pyevonic.refresh import ADMIN, EFFECTS, LIVE, MODULES, OPTIONS, SETUP
+from simulator import FireSimulator
+
+
+def test_first_poll_waits_only_for_what_entities_need():
+    async def main():
+        async with FireSimulator(latency=0.05) as fire:
+            async with Evonic(fire.address, defer_config=True) as evonic:
+                device = await evonic.get_device()
+                first = dict(fire.stats.paths)
+                await evonic.wait_for_config()
+                return device, first, dict(fire.stats.paths)
+
+    device, first, total = asyncio.run(main())
+    assert set(first) == {MODULES, OPTIONS, LIVE}
+    assert device.network.mac is not None
+    # The rest loads in the background straight after
+    assert {ADMIN, SETUP, EFFECTS} <= set(total)
+
+
+def test_commands_wait_for_the_configuration_they_validate_against():
+    async def main():
+        async with FireSimulator(latency=0.05) as fire:
+            fire.setup["fahrenheit"] = 1
+            async with Evonic(fire.address, defer_config=True, command_window=0) as evonic:
+                await evonic.get_device()
+                # A purchased effect, only listed by /effect.json
+                await evonic.set_effect("Christmas")
+                await evonic.set_temperature(75)
+                return fire.setup["effect"], fire.live["templevel"]
+
+    assert asyncio.run(main()) == ("Christmas", 75)
@@ -0,0 +1,64 @@
+"""Tests for diagnostics served from what the client already holds."""
+import asyncio
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.evonic.const import CONF_DIAGNOSTICS_REFRESH, DOMAIN  # noqa: E402
+from custom_components.evonic.diagnostics import async_get_config_entry_diagnostics  # noqa: E402
+
+from common import setup_integration  # noqa: E402
+from pyevonic.refresh import ADMIN, LIVE, MODULES, OPTIONS, SETUP  # noqa: E402
+from simulator import FireSimulator  # noqa: E402
+
+
+def test_diagnostics_make_no_requests(tmp_path):
+    async def main():
+        async with FireSimulator() as fire:
+            async with setup_integration(tmp_path, fire.address) as (hass, coordinator):
+                entry = hass.config_entries.async_entries(DOMAIN)[0]
+                fire.reset_stats()
+                diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+                return diagnostics, dict(fire.stats.paths), coordinator.evonic.payloads
+
+    diagnostics, paths, payloads = asyncio.run(main())
+    assert paths == {}
+    assert diagnostics["config_live"] == payloads[LIVE]
+    assert diagnostics["config_setup"]["ip"] == "**REDACTED**"
+    assert diagnostics["fetch_errors"] == {}
+
+
+def test_diagnostics_refresh_waits_for_a_poll_slot(tmp_path):
+    async def main():
+        async with FireSimulator() as fire:
+            async with setup_integration(tmp_path, fire.address) as (hass, coordinator):
+                entry = hass.config_entries.async_entries(DOMAIN)[0]
+                fire.reset_stats()
+                # Reloads the entry from the cached configuration, revalidated in the background
+                hass.config_entries.async_update_entry(entry, options={CONF_DIAGNOSTICS_REFRESH: True})
+                await hass.async_block_till_done()
+                coordinator = hass.data[DOMAIN][entry.entry_id]
+                evonic = coordinator.evonic
+                while not {MODULES, OPTIONS, ADMIN} <= set(fire.stats.paths):
+                    await asyncio.sleep(0.01)
+                await hass.async_block_till_done()
+
+                fire.live["temperature"] = 25
+                fire.reset_stats()
+                polls = coordinator.hub.stats.polls
+                scheduled = evonic.scheduler.stats.requests
+                diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+                return (
+                    diagnostics,
+                    dict(fire.stats.paths),
+                    coordinator.hub.stats.polls - polls,
+                    evonic.scheduler.stats.requests - scheduled,
+                )
+
+    diagnostics, paths, polls, scheduled = asyncio.run(main())
+    assert paths == {uri: 1 for uri in (MODULES, ADMIN, LIVE, OPTIONS, SETUP)}
+    # One of the hub's poll slots, with each request queued on the fire's scheduler
+    assert polls == 1
+    assert scheduled == len(paths)
+    assert diagnostics["config_live"]["temperature"] == 25
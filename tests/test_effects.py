@@ -0,0 +1,50 @@
+"""Tests for the shared effect catalog."""
+import copy
+
+import pytest
+
+from pyevonic.effects import EVONIC, EffectFamily, effect_list
+
+
+def test_model_family_followed_by_extras():
+    effects = effect_list("hal1500", ["Christmas", "Eos", "Rainbow", "Christmas"])
+    assert effects.base is EVONIC
+    assert list(effects) == [*EVONIC.names, "Christmas", "Rainbow"]
+    assert len(effects) == len(EVONIC) + 2
+
+
+def test_unknown_model_has_only_its_extras():
+    assert list(effect_list("unknown", ["Rainbow"])) == ["Rainbow"]
+    assert list(effect_list(None)) == []
+
+
+def test_lookup_and_indexing():
+    effects = effect_list("hal1500", ["Rainbow"])
+    assert "Aurora" in effects
+    assert "Rainbow" in effects
+    assert "Party" not in effects
+    assert effects.index("Rainbow") == len(EVONIC)
+    assert effects[0] == "Eos"
+    assert effects[-1] == "Rainbow"
+    assert effects[:2] == ("Eos", "Ignite")
+    with pytest.raises(ValueError):
+        effects.index("Party")
+    with pytest.raises(IndexError):
+        effects[len(effects)]
+
+
+def test_fires_with_the_same_effects_share_one_list():
+    first = effect_list("hal1500", ["Rainbow"])
+    assert effect_list("hal800", ["Rainbow"]) is first
+    assert effect_list("hal1500", ["Christmas"]) is not first
+    assert copy.deepcopy(first) is first
+
+
+def test_equal_to_a_plain_list():
+    assert effect_list("sf1") == ["Low", "Medium", "High"]
+
+
+def test_family_drops_duplicates():
+    family = EffectFamily("test", ["Red", "Blue", "Red"])
+    assert family.names == ("Red", "Blue")
+    assert family.index("Blue") == 1
@@ -0,0 +1,76 @@
+"""Tests for writing entity state only when the fields an entity reads have changed."""
+import asyncio
+from collections import Counter
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from homeassistant.helpers.entity import Entity  # noqa: E402
+
+from common import setup_integration  # noqa: E402
+from simulator import FireSimulator  # noqa: E402
+
+MAC = "AA:BB:CC:DD:EE:FF"
+
+
+@pytest.fixture
+def writes(monkeypatch):
+    """Count state writes per entity id."""
+    counts = Counter()
+    write = Entity.async_write_ha_state
+
+    def counting_write(self):
+        counts[self.entity_id] += 1
+        write(self)
+
+    monkeypatch.setattr(Entity, "async_write_ha_state", counting_write)
+    return counts
+
+
+def _poll(tmp_path, writes, change=None, enable_sensors=()):
+    """Poll once more after setup, return the entities written by that poll and those available before it."""
+    async def main():
+        async with FireSimulator() as fire:
+            async with setup_integration(tmp_path, fire.address, enable_sensors) as (hass, coordinator):
+                # Every refresh polls the fire instead of reusing the previous poll
+                coordinator.evonic.device_max_age = 0
+                await coordinator.async_refresh()
+                await hass.async_block_till_done()
+                available = {state.entity_id for state in hass.states.async_all() if state.state != "unavailable"}
+                writes.clear()
+                if change is not None:
+                    await change(fire)
+                await coordinator.async_refresh()
+                await hass.async_block_till_done()
+                return set(writes), available
+
+    return asyncio.run(main())
+
+
+def test_idle_poll_writes_nothing(tmp_path, writes):
+    written, available = _poll(tmp_path, writes)
+    assert available
+    assert written == set()
+
+
+def test_changed_field_wakes_only_its_entities(tmp_path, writes):
+    async def warm_room(fire):
+        fire.live["temperature"] = 25
+
+    written, _available = _poll(tmp_path, writes, warm_room)
+    assert written == {"climate.evonicsim_heater"}
+
+
+def test_availability_change_is_written(tmp_path, writes):
+    async def unplug(fire):
+        await fire.stop()
+
+    written, available = _poll(tmp_path, writes, unplug)
+    # Including entities none of whose fields changed
+    assert written == available
+
+
+def test_entities_without_dependencies_write_every_poll(tmp_path, writes):
+    written, _available = _poll(tmp_path, writes, enable_sensors=(f"{MAC}_http_latency",))
+    assert [entity_id.rpartition("_")[2] for entity_id in written] == ["latency"]
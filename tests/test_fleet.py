@@ -0,0 +1,45 @@
+"""Tests for fleet snapshots and the command line that runs them."""
+import asyncio
+import socket
+
+import pytest
+
+from pyevonic import EvonicFleet
+from snapshot import _parse_args
+from simulator import FireSimulator
+
+
+def _closed_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_snapshots_every_fire_and_reports_failures():
+    async def main():
+        async with FireSimulator() as first, FireSimulator() as second:
+            dead = f"127.0.0.1:{_closed_port()}"
+            hosts = [first.address, dead, second.address, first.address]
+            async with EvonicFleet(hosts, max_concurrency=2, request_timeout=1) as fleet:
+                return [result async for result in fleet.snapshots()], first.address, dead
+
+    results, first, dead = asyncio.run(main())
+    by_host = {result.host: result for result in results}
+    assert len(results) == 3
+    assert by_host[first].ok
+    assert by_host[first].as_dict()["climate"]["target_temp"] == 21
+    assert not by_host[dead].ok
+    assert "error" in by_host[dead].as_dict()
+
+
+def test_cli_reads_hosts_from_a_file(tmp_path):
+    hosts = tmp_path / "fires.txt"
+    hosts.write_text("# office\n192.0.2.2\n\n192.0.2.3\n")
+    args = _parse_args(["192.0.2.1", "--hosts-file", str(hosts), "--concurrency", "5"])
+    assert args.hosts == ["192.0.2.1", "192.0.2.2", "192.0.2.3"]
+    assert args.concurrency == 5
+
+
+def test_cli_needs_a_host():
+    with pytest.raises(SystemExit):
+        _parse_args([])
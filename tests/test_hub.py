@@ -0,0 +1,62 @@
+"""Tests for the hub that staggers and caps polls across fires."""
+import asyncio
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.evonic.hub import EvonicHub  # noqa: E402
+
+
+def test_each_fire_gets_its_own_phase():
+    hub = EvonicHub()
+    fires = [object() for _ in range(5)]
+    for fire in fires:
+        hub.register(fire)
+
+    phases = [hub.phase(fire) for fire in fires]
+    assert len(set(phases)) == 5
+    assert all(0 <= phase < 1 for phase in phases)
+    assert hub.stats.fires == 5
+
+
+def test_freed_slot_is_reused():
+    hub = EvonicHub()
+    first, second, third = object(), object(), object()
+    hub.register(first)
+    hub.register(second)
+    phase = hub.phase(first)
+
+    hub.unregister(first)
+    hub.register(third)
+    assert hub.phase(third) == phase
+
+
+def test_next_poll_is_on_the_fire_phase_and_not_pulled_in():
+    hub = EvonicHub()
+    hub.register(object())
+    fire = object()
+    hub.register(fire)
+    offset = hub.phase(fire) * 30
+
+    for now in (0.0, 7.5, 100.0, 1234.5):
+        when = hub.next_poll(fire, now, 30)
+        assert (when - offset) / 30 == pytest.approx(round((when - offset) / 30))
+        assert now + 15 <= when < now + 45
+
+
+def test_caps_polls_in_flight():
+    async def main():
+        hub = EvonicHub(max_concurrent=2)
+
+        async def poll():
+            async with hub.poll():
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(poll() for _ in range(6)))
+        return hub.stats
+
+    stats = asyncio.run(main())
+    assert stats.max_in_flight == 2
+    assert stats.polls == 6
+    assert stats.in_flight == 0
@@ -0,0 +1,23 @@
+"""Tests for learning whether a fire keeps HTTP connections open."""
+import asyncio
+
+import pytest
+
+from pyevonic import Evonic
+from pyevonic.capabilities import KEEP_ALIVE
+from pyevonic.refresh import LIVE
+from simulator import FireSimulator
+
+
+@pytest.mark.parametrize("keep_alive", [True, False])
+def test_keep_alive_support_is_learned(keep_alive):
+    async def main():
+        async with FireSimulator(keep_alive=keep_alive) as fire:
+            async with Evonic(fire.address) as evonic:
+                for _ in range(3):
+                    await evonic.http_request(LIVE, "GET", None)
+                return evonic.capabilities.supports(KEEP_ALIVE), fire.stats.connections
+
+    supported, connections = asyncio.run(main())
+    assert supported is keep_alive
+    assert connections == (1 if keep_alive else 3)
@@ -0,0 +1,87 @@
+"""Tests for the per-endpoint request metrics."""
+import pytest
+
+from pyevonic.capabilities import HTTP, WEBSOCKET
+from pyevonic.metrics import LATENCY_BUCKETS, MAX_ENDPOINTS, OTHER, PollHistory, PollRecord, RequestMetrics
+
+
+def test_request_counts_on_transport_and_endpoint():
+    metrics = RequestMetrics()
+    metrics.record(HTTP, "/config.live.json", 0.03, 120)
+    metrics.record(HTTP, "/config.live.json", 0.2, 80)
+    metrics.record(WEBSOCKET, "/config.live.json", 0.01)
+
+    http = metrics.transports[HTTP]
+    assert (http.requests, http.bytes_read, http.max_latency, http.last_latency) == (2, 200, 0.2, 0.2)
+    assert http.average_latency == pytest.approx(0.115)
+    assert metrics.endpoint(HTTP, "/config.live.json").requests == 2
+    assert metrics.transports[WEBSOCKET].requests == 1
+
+
+def test_latency_lands_in_its_bucket():
+    metrics = RequestMetrics()
+    metrics.record(HTTP, "/config.live.json", LATENCY_BUCKETS[0])
+    metrics.record(HTTP, "/config.live.json", 0.3)
+    metrics.record(HTTP, "/config.live.json", 60.0)
+
+    histogram = metrics.transports[HTTP].histogram
+    assert histogram[0] == 1
+    assert histogram[LATENCY_BUCKETS.index(0.5)] == 1
+    assert histogram[-1] == 1
+    assert metrics.transports[HTTP].quantile(0.5) == 0.5
+    # Past the last bucket there is no upper bound to report
+    assert metrics.transports[HTTP].quantile(1.0) is None
+
+
+def test_errors_and_timeouts():
+    metrics = RequestMetrics()
+    metrics.record_error(HTTP, "/config.live.json", "refused")
+    metrics.record_error(WEBSOCKET, "/config.live.json", "timed out", timeout=True)
+
+    assert (metrics.transports[HTTP].errors, metrics.transports[HTTP].timeouts) == (1, 0)
+    assert (metrics.transports[WEBSOCKET].errors, metrics.transports[WEBSOCKET].timeouts) == (1, 1)
+    assert metrics.last_error == "timed out"
+
+
+def test_unchanged_and_fallbacks_count_against_http():
+    metrics = RequestMetrics()
+    metrics.record(HTTP, "/config.live.json", 0.01)
+    metrics.record(HTTP, "/config.live.json", 0.01)
+    metrics.record_unchanged("/config.live.json")
+    metrics.record_fallback("/config.setup.json")
+
+    live = metrics.endpoint(HTTP, "/config.live.json")
+    assert live.unchanged == 1
+    assert live.unchanged_rate == 0.5
+    assert metrics.endpoint(HTTP, "/config.setup.json").fallbacks == 1
+    assert metrics.transports[HTTP].fallbacks == 1
+
+
+def test_endpoints_past_the_cap_are_counted_as_other():
+    metrics = RequestMetrics()
+    for index in range(MAX_ENDPOINTS + 5):
+        metrics.record(HTTP, f"/endpoint{index}.json", 0.01)
+
+    endpoints = metrics.as_dict()[HTTP]["endpoints"]
+    assert len(endpoints) == MAX_ENDPOINTS + 1
+    assert endpoints[OTHER]["requests"] == 5
+    # Endpoints seen before the cap was reached keep their own counters
+    metrics.record(HTTP, "/endpoint0.json", 0.01)
+    assert metrics.endpoint(HTTP, "/endpoint0.json").requests == 2
+
+
+def test_connections():
+    metrics = RequestMetrics()
+    metrics.record_connection(reused=False)
+    metrics.record_connection(reused=True)
+    metrics.record_connection(reused=True)
+    assert metrics.as_dict()[HTTP]["connections"] == {"opened": 1, "reused": 2}
+
+
+def test_poll_history_keeps_the_latest_polls():
+    history = PollHistory(size=3)
+    for started in range(5):
+        history.record(PollRecord(started=float(started), elapsed=0.1, requests=1, bytes_read=100))
+
+    assert len(history) == 3
+    assert [poll["started"] for poll in history.as_list()] == [2.0, 3.0, 4.0]
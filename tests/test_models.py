@@ -0,0 +1,87 @@
+"""Tests for parsing fire payloads into the Device model."""
+import tracemalloc
+
+import legacy_models
+from pyevonic import Device, Info
+from pyevonic.models import FIELDS
+from simulator import DEFAULT_LIVE, DEFAULT_MODULES, DEFAULT_OPTIONS, DEFAULT_SETUP
+
+INITIAL = {**DEFAULT_MODULES, **DEFAULT_LIVE, **DEFAULT_SETUP, **DEFAULT_OPTIONS}
+
+
+def _sections(device):
+    return [
+        (name, tuple(getattr(getattr(device, name), field) for _key, section, field, _convert in FIELDS if section == name))
+        for name in ("info", "climate", "network", "light")
+    ]
+
+
+def test_parses_like_the_legacy_models():
+    assert _sections(Device(INITIAL)) == _sections(legacy_models.Device(INITIAL))
+
+
+def test_converts_wire_values():
+    device = Device({"templevel": "22", "cost": "0.28", "powerHeater": None, "SSDP": "Evonic"})
+    assert device.climate.target_temp == 22
+    assert device.info.cost == 0.28
+    assert device.info.heater_power == 0
+    assert device.info.ssdp == "Evonic"
+
+
+def test_reports_changed_fields():
+    device = Device(INITIAL)
+    changes = set()
+    assert device.update_from_dict({"templevel": 24, "ssidAP": "Other", "heap": 1}, changes)
+    assert changes == {"climate.target_temp", "info.ssidAP", "network.ssidAP"}
+
+
+def test_unchanged_payload_reports_nothing():
+    device = Device(INITIAL)
+    changes = set()
+    assert not device.update_from_dict(DEFAULT_LIVE, changes)
+    assert changes == set()
+
+
+def test_equal_converted_value_is_not_a_change():
+    device = Device({"templevel": 21})
+    changes = set()
+    assert not device.update_from_dict({"templevel": "21"}, changes)
+    assert changes == set()
+
+
+def _peak(update):
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        update()
+        return tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+
+
+def test_update_allocates_nothing_per_key():
+    device = Device(INITIAL)
+    padded = {**DEFAULT_LIVE, **{f"unknown{index}": index for index in range(100)}}
+    changes = set()
+    device.update_from_dict(padded, changes)
+
+    # Only the loop over the payload allocates, however many keys it has
+    assert _peak(lambda: device.update_from_dict(padded, changes)) == _peak(
+        lambda: device.update_from_dict({"templevel": 21}, changes)
+    )
+
+
+def test_section_update_matches_the_device():
+    device = Device(INITIAL)
+    info = Info.from_dict(INITIAL)
+    assert info == device.info
+    assert not info.update_from_dict(DEFAULT_LIVE)
+    assert info.update_from_dict({"powerLed": "99"})
+    assert info.led_power == 99
+
+
+def test_section_from_dict():
+    info = Info.from_dict({"Fire": 1, "powerLed": "28", "temperature": 19})
+    assert info.on == 1
+    assert info.led_power == 28
@@ -0,0 +1,55 @@
+"""Tests for the coordinator's choice of polling interval."""
+import time
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.evonic.const import (  # noqa: E402
+    MAX_BACKOFF_INTERVAL,
+    PUSH_SAFETY_INTERVAL,
+    SCAN_INTERVAL,
+)
+from custom_components.evonic.coordinator import EvonicCoordinator  # noqa: E402
+
+ACTIVE = timedelta(seconds=10)
+IDLE = timedelta(minutes=2)
+
+
+def _interval(failures=0, push=None, last_command=None, on=1, heating=0):
+    coordinator = SimpleNamespace(
+        _failures=failures,
+        _last_command=last_command,
+        push=push,
+        active_interval=ACTIVE,
+        idle_interval=IDLE,
+        data=SimpleNamespace(info=SimpleNamespace(on=on), climate=SimpleNamespace(heating=heating)),
+    )
+    return EvonicCoordinator._next_update_interval(coordinator)
+
+
+def test_backs_off_exponentially_up_to_the_cap():
+    intervals = [_interval(failures) for failures in range(1, 7)]
+    assert intervals[:4] == [SCAN_INTERVAL * factor for factor in (1, 2, 4, 8)]
+    assert intervals[-1] == MAX_BACKOFF_INTERVAL
+
+
+@pytest.mark.parametrize("failures", [43, 100, 10_000])
+def test_long_outages_do_not_overflow(failures):
+    assert _interval(failures) == MAX_BACKOFF_INTERVAL
+
+
+def test_push_connection_slows_polling():
+    assert _interval(push=SimpleNamespace(connected=True)) == PUSH_SAFETY_INTERVAL
+    assert _interval(push=SimpleNamespace(connected=False)) == SCAN_INTERVAL
+
+
+def test_active_after_a_command_or_while_heating():
+    assert _interval(last_command=time.monotonic()) == ACTIVE
+    assert _interval(heating=1) == ACTIVE
+
+
+def test_idle_while_off():
+    assert _interval(on=0) == IDLE
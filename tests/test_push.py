@@ -0,0 +1,71 @@
+"""Tests for the WebSocket push connection and sending commands over it."""
+import asyncio
+
+import pytest
+
+from pyevonic import Evonic, EvonicPush
+from simulator import FireSimulator
+
+
+async def _wait_for(condition, timeout=2.0):
+    async with asyncio.timeout(timeout):
+        while not condition():
+            await asyncio.sleep(0.01)
+
+
+def test_pushed_state_is_applied():
+    async def main():
+        async with FireSimulator() as fire:
+            async with Evonic(fire.address, ws_port=fire.ws_port) as evonic:
+                await evonic.get_device()
+                targets = []
+                push = EvonicPush(evonic, on_update=lambda device: targets.append(device.climate.target_temp))
+                push.start()
+                # The first update is the live state requested on connecting
+                await _wait_for(lambda: targets)
+                evonic.pop_changes()
+                fire.push(templevel=24)
+                await _wait_for(lambda: targets[-1] == 24)
+                await push.stop()
+                return evonic.pop_changes()
+
+    assert asyncio.run(main()) == {"climate.target_temp"}
+
+
+def test_command_falls_back_when_push_send_fails():
+    async def main():
+        async with FireSimulator() as fire:
+            async with Evonic(fire.address, ws_port=fire.ws_port) as evonic:
+                await evonic.get_device()
+                push = EvonicPush(evonic, on_update=lambda device: None, backoff_min=5)
+                push.start()
+                await _wait_for(lambda: push.connected)
+
+                async def send_str(_data):
+                    raise ConnectionResetError("Cannot write to closing transport")
+
+                push._ws.send_str = send_str
+                fire.reset_stats()
+                await evonic.ws_request("/voice?command=Heater_ON")
+                await push.stop()
+                return fire.live["Heater"], fire.stats.connections, evonic.metrics.transports["websocket"]
+
+    heater, connections, metrics = asyncio.run(main())
+    assert heater == 1
+    assert connections == 1
+    assert metrics.errors == 1
+    assert metrics.requests == 1
+
+
+def test_handshake_is_bounded_by_the_request_timeout():
+    async def main():
+        # Accepts the connection but never answers the upgrade
+        server = await asyncio.start_server(lambda reader, writer: None, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server, Evonic("127.0.0.1", ws_port=port, request_timeout=0.2) as evonic:
+            push = EvonicPush(evonic, on_update=lambda device: None)
+            with pytest.raises(asyncio.TimeoutError):
+                await push._connect()
+            return evonic.scheduler.stats.in_flight
+
+    assert asyncio.run(main()) == 0
@@ -0,0 +1,66 @@
+"""Tests for the endpoint refresh planner and background refreshes."""
+import asyncio
+from datetime import timedelta
+
+from pyevonic import Evonic
+from pyevonic.refresh import EFFECTS, LIVE, MODULES, SETUP, RefreshPlanner
+
+INTERVALS = {LIVE: timedelta(0), SETUP: timedelta(hours=1), MODULES: None}
+
+
+def test_everything_is_due_until_fetched():
+    planner = RefreshPlanner(INTERVALS)
+    assert all(planner.due(uri) for uri in INTERVALS)
+    assert not planner.fetched(SETUP)
+
+
+def test_due_again_after_its_interval():
+    planner = RefreshPlanner(INTERVALS)
+    for uri in INTERVALS:
+        planner.mark(uri)
+
+    assert planner.due(LIVE)
+    assert not planner.due(SETUP)
+    assert not planner.due(MODULES)
+    assert planner.fetched(SETUP)
+
+
+def test_stale_endpoints_are_due_unless_fetched_once():
+    planner = RefreshPlanner(INTERVALS)
+    planner.mark_stale(SETUP)
+    planner.mark_stale(MODULES)
+
+    assert planner.fetched(SETUP)
+    assert planner.due(SETUP)
+    assert not planner.due(MODULES)
+
+
+def test_invalidate():
+    planner = RefreshPlanner(INTERVALS)
+    for uri in INTERVALS:
+        planner.mark(uri)
+
+    planner.invalidate(SETUP)
+    assert planner.due(SETUP)
+    assert not planner.due(MODULES)
+
+    planner.invalidate()
+    assert planner.due(MODULES)
+
+
+def test_background_refresh_backs_off_on_undecodable_body():
+    async def main():
+        evonic = Evonic("192.0.2.1")
+        notified = []
+        evonic.add_refresh_listener(lambda: notified.append(True))
+
+        async def refresh(priority):
+            raise ValueError("Expecting value: line 1 column 1 (char 0)")
+
+        evonic._refresher = lambda uri: refresh
+        await evonic._background_refresh(EFFECTS)
+        return evonic._planner.due(EFFECTS), notified
+
+    due, notified = asyncio.run(main())
+    assert not due
+    assert notified == []
@@ -0,0 +1,37 @@
+"""Tests for the responses returned by the client."""
+import asyncio
+
+import pytest
+
+from pyevonic import Evonic
+from pyevonic.refresh import LIVE
+from pyevonic.response import EvonicResponse
+from simulator import DEFAULT_LIVE, FireSimulator
+
+
+def test_decodes_json_whatever_the_content_type():
+    response = EvonicResponse(200, b'{"Fire": 1}', content_type="text/html")
+    assert response.json() == {"Fire": 1}
+    assert response.size == 11
+
+
+def test_invalid_json_raises_value_error():
+    response = EvonicResponse(200, b"<html>\xff</html>")
+    with pytest.raises(ValueError):
+        response.json()
+    assert response.text() == "<html>�</html>"
+
+
+def test_connection_is_released_for_the_next_request():
+    async def main():
+        async with FireSimulator(keep_alive=True) as fire:
+            async with Evonic(fire.address) as evonic:
+                first = await evonic.http_request(LIVE, "GET", None)
+                second = await evonic.http_request(LIVE, "GET", None)
+                return first, second, evonic.metrics.connections_reused, fire.stats.connections
+
+    first, second, reused, connections = asyncio.run(main())
+    assert first.json() == second.json() == DEFAULT_LIVE
+    assert first.status == 200
+    # The body was read in full, so the second request went out on the same connection
+    assert (reused, connections) == (1, 1)
@@ -0,0 +1,89 @@
+"""Tests for the per-host request scheduler."""
+import asyncio
+
+from pyevonic.scheduler import RequestPriority, RequestScheduler, get_scheduler
+
+
+def test_limits_requests_in_flight():
+    async def main():
+        scheduler = RequestScheduler(max_in_flight=1)
+        running = peak = 0
+
+        async def request():
+            nonlocal running, peak
+            async with scheduler.slot():
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*(request() for _ in range(5)))
+        return peak, scheduler.stats
+
+    peak, stats = asyncio.run(main())
+    assert peak == 1
+    assert stats.requests == 5
+    assert stats.in_flight == 0
+    assert stats.queue_depth == 0
+    assert stats.max_queue_depth == 4
+
+
+def test_serves_higher_priority_first():
+    async def main():
+        scheduler = RequestScheduler()
+        order = []
+
+        async def request(name, priority):
+            async with scheduler.slot(priority):
+                order.append(name)
+
+        await scheduler.acquire()
+        tasks = [
+            asyncio.create_task(request("background", RequestPriority.BACKGROUND)),
+            asyncio.create_task(request("poll", RequestPriority.POLL)),
+            asyncio.create_task(request("command", RequestPriority.COMMAND)),
+        ]
+        await asyncio.sleep(0)
+        scheduler.release()
+        await asyncio.gather(*tasks)
+        return order
+
+    assert asyncio.run(main()) == ["command", "poll", "background"]
+
+
+def test_cancelled_waiter_leaves_the_queue():
+    async def main():
+        scheduler = RequestScheduler()
+        await scheduler.acquire()
+        waiter = asyncio.create_task(scheduler.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        depth = scheduler.stats.queue_depth
+        scheduler.release()
+        return depth, scheduler.stats.in_flight
+
+    assert asyncio.run(main()) == (0, 0)
+
+
+def test_cancelled_while_handed_a_slot_passes_it_on():
+    async def main():
+        scheduler = RequestScheduler()
+        await scheduler.acquire()
+        first = asyncio.create_task(scheduler.acquire())
+        second = asyncio.create_task(scheduler.acquire())
+        await asyncio.sleep(0)
+        # Hand the slot to the first waiter, then cancel it before it runs
+        scheduler.release()
+        first.cancel()
+        await asyncio.gather(first, return_exceptions=True)
+        await asyncio.wait_for(second, 1)
+        return scheduler.stats.in_flight
+
+    assert asyncio.run(main()) == 1
+
+
+def test_scheduler_is_shared_per_host():
+    first = get_scheduler("192.0.2.1")
+    assert get_scheduler("192.0.2.1") is first
+    assert get_scheduler("192.0.2.2") is not first
@@ -0,0 +1,43 @@
+"""Tests for the fire simulator the benchmarks and tests run against."""
+import asyncio
+import json
+
+import aiohttp
+
+from simulator import DEFAULT_LIVE, FireSimulator
+
+
+async def _get(fire, path):
+    async with aiohttp.ClientSession() as session:
+        async with session.get(f"http://{fire.address}{path}") as response:
+            return response.status, await response.read()
+
+
+def test_serves_live_state():
+    async def main():
+        async with FireSimulator() as fire:
+            status, body = await _get(fire, "/config.live.json")
+            return status, body, fire.stats.paths["/config.live.json"]
+
+    status, body, served = asyncio.run(main())
+    assert status == 200
+    assert json.loads(body) == DEFAULT_LIVE
+    assert served == 1
+
+
+def test_voice_command_changes_live_state():
+    async def main():
+        async with FireSimulator() as fire:
+            await _get(fire, "/voice?command=Heater_ON")
+            return fire.live["Heater"]
+
+    assert asyncio.run(main()) == 1
+
+
+def test_unknown_path_is_not_found():
+    async def main():
+        async with FireSimulator() as fire:
+            return await _get(fire, "/nope.json")
+
+    status, _body = asyncio.run(main())
+    assert status == 404
@@ -0,0 +1,108 @@
+"""Tests for sharing one in-flight fetch between callers."""
+import asyncio
+
+import pytest
+
+from pyevonic.singleflight import SingleFlight
+
+
+class Fetcher:
+    """Counts fetches, each one waiting until ``release`` is set."""
+
+    def __init__(self, error: Exception | None = None) -> None:
+        self.error = error
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self):
+        self.calls += 1
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return self.calls
+
+
+def test_concurrent_callers_share_one_fetch():
+    async def main():
+        flight = SingleFlight()
+        fetch = Fetcher()
+        callers = [asyncio.create_task(flight.run("device", fetch)) for _ in range(3)]
+        await asyncio.sleep(0)
+        assert flight.running("device")
+        fetch.release.set()
+        return await asyncio.gather(*callers), flight
+
+    results, flight = asyncio.run(main())
+    assert results == [1, 1, 1]
+    assert (flight.stats.fetches, flight.stats.joined, flight.stats.deduplicated) == (1, 2, 2)
+    assert not flight.running("device")
+
+
+def test_results_are_reused_while_young_enough():
+    async def main():
+        flight = SingleFlight()
+        fetch = Fetcher()
+        fetch.release.set()
+        first = await flight.run("device", fetch)
+        reused = await flight.run("device", fetch, max_age=60)
+        # Without a max age every call after the fetch finished fetches again
+        fetched = await flight.run("device", fetch)
+        return first, reused, fetched, flight.stats
+
+    first, reused, fetched, stats = asyncio.run(main())
+    assert (first, reused, fetched) == (1, 1, 2)
+    assert (stats.calls, stats.fetches, stats.reused) == (3, 2, 1)
+
+
+def test_failures_reach_every_caller_and_are_not_reused():
+    async def main():
+        flight = SingleFlight()
+        fetch = Fetcher(ValueError("bad payload"))
+        callers = [asyncio.create_task(flight.run("device", fetch, max_age=60)) for _ in range(2)]
+        await asyncio.sleep(0)
+        fetch.release.set()
+        results = await asyncio.gather(*callers, return_exceptions=True)
+
+        fetch.error = None
+        return results, await flight.run("device", fetch, max_age=60)
+
+    results, retried = asyncio.run(main())
+    assert all(isinstance(result, ValueError) for result in results)
+    assert retried == 2
+
+
+def test_a_forgotten_fetch_is_not_reused():
+    async def main():
+        flight = SingleFlight()
+        stale = Fetcher()
+        caller = asyncio.create_task(flight.run("device", stale, max_age=60))
+        await asyncio.sleep(0)
+        # A command changed the device while the fetch was running
+        flight.forget("device")
+        fresh = Fetcher()
+        fresh.calls = 10
+        fresh.release.set()
+        after = await flight.run("device", fresh, max_age=60)
+
+        stale.release.set()
+        # The stale fetch finishing late does not replace the fresh result
+        return await caller, after, await flight.run("device", fresh, max_age=60)
+
+    assert asyncio.run(main()) == (1, 11, 11)
+
+
+def test_a_caller_giving_up_does_not_cancel_the_others():
+    async def main():
+        flight = SingleFlight()
+        fetch = Fetcher()
+        impatient = asyncio.create_task(flight.run("device", fetch))
+        patient = asyncio.create_task(flight.run("device", fetch))
+        await asyncio.sleep(0)
+        impatient.cancel()
+        await asyncio.sleep(0)
+        fetch.release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await impatient
+        return await patient, fetch.calls
+
+    assert asyncio.run(main()) == (1, 1)
@@ -0,0 +1,67 @@
+"""Tests for exporting a fire's configuration and starting up from it."""
+import asyncio
+import json
+
+from pyevonic import Evonic
+from pyevonic.refresh import EFFECTS, SETUP
+from simulator import FireSimulator
+
+
+async def _export(fire, **kwargs):
+    async with Evonic(fire.address) as evonic:
+        await evonic.get_config()
+        await evonic.get_device()
+        return evonic.export_config(**kwargs)
+
+
+def test_snapshot_leaves_out_credentials():
+    async def main():
+        async with FireSimulator() as fire:
+            return await _export(fire)
+
+    snapshot = asyncio.run(main())
+    text = json.dumps(snapshot)
+    assert snapshot["mac"] == "AA:BB:CC:DD:EE:FF"
+    assert "secret" not in text
+    assert "token" not in text
+
+
+def test_restore_builds_the_device_without_fetching_config():
+    async def main():
+        async with FireSimulator() as fire:
+            snapshot = await _export(fire)
+            fire.reset_stats()
+            async with Evonic(fire.address) as evonic:
+                device = evonic.restore_config(json.loads(json.dumps(snapshot)))
+                await evonic.get_device()
+                await evonic.wait_for_config()
+                fetched = dict(fire.stats.paths)
+                return device, fetched, evonic._planner.due(SETUP)
+
+    device, fetched, setup_due = asyncio.run(main())
+    assert device.network.mac == "AA:BB:CC:DD:EE:FF"
+    assert device.info.cost == 0.28
+    assert "Aurora" in device.effects.available_effects
+    # Restored endpoints are stale, so only what changes is fetched, setup and effects in the background
+    assert set(fetched) <= {"/config.live.json", "/config.setup.json", "/effect.json"}
+    assert fetched["/config.live.json"] == 1
+    assert not setup_due
+
+
+def test_nothing_to_export_before_the_config_is_fetched():
+    assert Evonic("192.0.2.1").export_config() is None
+
+
+def test_fresh_restore_needs_nothing_but_live_state():
+    async def main():
+        async with FireSimulator() as fire:
+            snapshot = await _export(fire, include_live=True)
+            fire.reset_stats()
+            async with Evonic(fire.address) as evonic:
+                evonic.restore_config(snapshot, fresh=True)
+                await evonic.get_device()
+                return dict(fire.stats.paths), evonic._planner.due(EFFECTS)
+
+    fetched, effects_due = asyncio.run(main())
+    assert fetched == {"/config.live.json": 1}
+    assert not effects_due
@@ -0,0 +1,87 @@
+"""Tests for the fire's timer schedules."""
+import asyncio
+import copy
+from datetime import datetime, time
+
+import pytest
+
+from pyevonic import Evonic
+from pyevonic.timers import HEATER, Schedule, TimerTable
+from simulator import DEFAULT_TIMERS, FireSimulator
+
+WEEKDAYS = frozenset(range(5))
+
+
+def test_parses_a_pair_into_a_schedule():
+    table = TimerTable.parse(DEFAULT_TIMERS)
+    assert table.get(4521) == Schedule(4521, WEEKDAYS, time(7, 30), time(22, 0))
+    assert table.other == ()
+
+
+def test_unpaired_entries_are_kept_verbatim():
+    data = copy.deepcopy(DEFAULT_TIMERS)
+    odd = {"id": 7, "day": "1000000", "time1": "08:00:00", "com1": "rgb set 0 effect 3", "run1": 0, "active": 1}
+    data["timer"].append(odd)
+
+    table = TimerTable.parse(data)
+    assert len(table) == 1
+    assert table.other == (odd,)
+    assert table.as_payload() == data
+
+
+def test_unchanged_schedules_are_written_back_as_read():
+    data = copy.deepcopy(DEFAULT_TIMERS)
+    # The firmware's record that the timer already ran today
+    data["timer"][0]["run1"] = 1
+    table = TimerTable.parse(data)
+
+    added = table.with_schedule(Schedule(12, frozenset({5, 6}), time(9, 0), target=HEATER))
+    payload = added.as_payload()["timer"]
+    assert payload[:2] == data["timer"]
+    assert payload[2] == {
+        "id": 12, "day": "1000001", "run1": 0, "active": 1, "time1": "09:00:00", "com1": "voice Heater_ON",
+    }
+
+
+def test_diff():
+    table = TimerTable.parse(DEFAULT_TIMERS)
+    moved = Schedule(4521, WEEKDAYS, time(8, 0), time(22, 0))
+    added = Schedule(12, WEEKDAYS, time(9, 0))
+
+    diff = table.diff(table.with_schedule(moved).with_schedule(added))
+    assert (diff.added, diff.changed, diff.removed) == ((added,), (moved,), ())
+    assert table.diff(table.without_schedule(4521)).removed == (4521,)
+    assert not table.diff(TimerTable.parse(DEFAULT_TIMERS))
+
+
+def test_invalid_schedules_are_rejected():
+    with pytest.raises(ValueError):
+        Schedule(1, frozenset({7}), time(8, 0))
+    with pytest.raises(ValueError):
+        Schedule(1, WEEKDAYS, time(8, 0), target="Light")
+    with pytest.raises(ValueError):
+        TimerTable.parse({"timer": "none"})
+
+
+def test_overnight_occurrences_end_the_next_day():
+    schedule = Schedule(1, frozenset({4}), time(22, 0), time(2, 0))
+    # Friday 2024-03-08 to the following Monday
+    runs = list(schedule.occurrences(datetime(2024, 3, 8), datetime(2024, 3, 11)))
+    assert runs == [(datetime(2024, 3, 8, 22), datetime(2024, 3, 9, 2))]
+
+
+def test_saving_a_schedule_rewrites_the_fire_timers():
+    async def main():
+        async with FireSimulator() as fire:
+            async with Evonic(fire.address) as evonic:
+                added = Schedule(12, frozenset({5, 6}), time(9, 0), time(10, 0))
+                diff = await evonic.save_schedule(added)
+                unchanged = await evonic.save_schedule(added)
+                return diff, unchanged, TimerTable.parse(fire.timers), fire.timer_reloads
+
+    diff, unchanged, stored, reloads = asyncio.run(main())
+    assert diff.added == (stored.get(12),)
+    assert stored.get(4521) is not None
+    # Saving the same schedule again changes nothing, so nothing is written
+    assert not unchanged
+    assert reloads == 1
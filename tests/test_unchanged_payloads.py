@@ -0,0 +1,54 @@
+"""Tests for skipping payloads identical to the previous poll's."""
+import asyncio
+
+from pyevonic import Evonic
+from pyevonic.capabilities import HTTP
+from pyevonic.refresh import LIVE
+from simulator import FireSimulator
+
+
+async def _warm_up(evonic):
+    # The first poll applies setup after live, so the second decodes live once more
+    await evonic.get_device()
+    await evonic.get_device()
+
+
+def test_identical_polls_are_not_decoded_again():
+    async def main():
+        async with FireSimulator() as fire:
+            async with Evonic(fire.address, device_max_age=0) as evonic:
+                await _warm_up(evonic)
+                live = evonic.metrics.endpoint(HTTP, LIVE)
+                requests, unchanged = live.requests, live.unchanged
+                for _ in range(5):
+                    await evonic.get_device()
+                return live.requests - requests, live.unchanged - unchanged
+
+    assert asyncio.run(main()) == (5, 5)
+
+
+def test_a_changed_body_is_applied():
+    async def main():
+        async with FireSimulator() as fire:
+            async with Evonic(fire.address, device_max_age=0) as evonic:
+                await _warm_up(evonic)
+                unchanged = evonic.metrics.endpoint(HTTP, LIVE).unchanged
+                fire.live["temperature"] = 25
+                device = await evonic.get_device()
+                return device.climate.current_temp, evonic.metrics.endpoint(HTTP, LIVE).unchanged - unchanged
+
+    assert asyncio.run(main()) == (25, 0)
+
+
+def test_state_changed_since_the_last_body_is_corrected():
+    async def main():
+        async with FireSimulator() as fire:
+            async with Evonic(fire.address, device_max_age=0) as evonic:
+                await _warm_up(evonic)
+                # A push frame or an optimistic command the fire never applied
+                evonic._update_device({"templevel": 30})
+                device = await evonic.get_device()
+                return device.climate.target_temp, fire.live["templevel"]
+
+    target, on_fire = asyncio.run(main())
+    assert target == on_fire